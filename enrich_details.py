@@ -149,7 +149,7 @@ def enrich_part_with_details(
         html = fetcher.fetch_with_browser(url)
 
         # Parse complete detail page data
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         detail_data = parser.extract_detail_page_data(soup, sku)
 
         # Extract and process images
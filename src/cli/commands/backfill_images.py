@@ -5,7 +5,6 @@ gallery images to AVIF, and syncs them to WordPress. The manifest
 serves as the resume checkpoint — SKUs already present are skipped.
 """
 
-import asyncio
 import json
 import sys
 import time
@@ -16,7 +15,7 @@ import httpx
 import structlog
 from rich.console import Console
 
-from src.scraper.fetcher import RespectfulFetcher
+from src.scraper.fetcher import RespectfulFetcher, run_async
 from src.scraper.image_processor import ImageProcessor
 from src.scraper.image_syncer import (
     ImageSyncer,
@@ -245,7 +244,7 @@ def _run_backfill(  # noqa: PLR0913
             DETAIL_BASE_URL + sku.replace("CSF-", "").replace("csf-", "") for sku in batch_skus
         ]
 
-        html_results = asyncio.run(
+        html_results = run_async(
             fetcher.async_fetch_detail_pages(batch_urls, concurrency=batch_size)
         )
 
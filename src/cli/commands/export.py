@@ -115,13 +115,10 @@ def export(
 
             console.print(f"[green]Loaded {len(compatibility)} compatibility mappings[/green]")
 
-            # Create parts lookup dictionary
-            parts_by_sku = {part.sku: part for part in parts}
-
-            # Export hierarchical
+            # Export hierarchical (exporter indexes parts by SKU)
             output_path = exporter.export_hierarchical(
                 compatibility=compatibility,
-                parts_by_sku=parts_by_sku,
+                parts=parts,
                 filename=output_file,
                 pretty=pretty,
             )
@@ -12,6 +12,7 @@ import click
 import structlog
 from rich.console import Console
 
+from src.scraper.fetcher import RespectfulFetcher
 from src.scraper.image_processor import ImageProcessor
 from src.scraper.image_syncer import (
     ImageSyncer,
@@ -32,6 +33,7 @@ EXIT_FAILURE = 1
 EXIT_HIGH_FAILURE_RATE = 2
 EXIT_TIME_BUDGET = 3
 FAILURE_RATE_THRESHOLD = 0.05
+HTTP_CACHE_DIR = Path("checkpoints/http_cache")
 
 
 @click.command()
@@ -104,6 +106,14 @@ FAILURE_RATE_THRESHOLD = 0.05
     envvar="CSF_TIME_BUDGET",
     help="Max minutes to run before saving checkpoint and exiting (env: CSF_TIME_BUDGET)",
 )
+@click.option(
+    "--http-cache-ttl",
+    type=float,
+    default=None,
+    envvar="CSF_HTTP_CACHE_TTL",
+    help="Serve vehicle hierarchy dropdown responses cached within this many hours from disk "
+    "(requires the 'cache' extra; ignored with --force-full) (env: CSF_HTTP_CACHE_TTL)",
+)
 def scrape(  # noqa: PLR0912, PLR0913, PLR0915
     make: str | None,
     year: int | None,
@@ -116,6 +126,7 @@ def scrape(  # noqa: PLR0912, PLR0913, PLR0915
     wp_url: str | None,
     wp_api_key: str | None,
     time_budget: float | None,
+    http_cache_ttl: float | None,
 ) -> None:
     r"""Scrape automotive parts data from CSF MyCarParts.
 
@@ -150,6 +161,10 @@ def scrape(  # noqa: PLR0912, PLR0913, PLR0915
         \b
         # Scrape and sync images to remote WordPress
         $ carpart scrape --sync-images --wp-url https://site.com --wp-api-key KEY
+
+        \b
+        # Reuse hierarchy dropdowns fetched in the last 24 hours
+        $ carpart scrape --http-cache-ttl 24
     """
     fetch_details = not catalog_only
     is_remote = _is_remote_wp(wp_url)
@@ -163,10 +178,15 @@ def scrape(  # noqa: PLR0912, PLR0913, PLR0915
             state_syncer.pull("detail_etags", Path("checkpoints/detail_etags.json"))
             state_syncer.pull("manifest", Path("images/manifest.json"))
 
+        fetcher: RespectfulFetcher | None = None
+        if http_cache_ttl is not None and not force_full:
+            fetcher = RespectfulFetcher(cache_dir=HTTP_CACHE_DIR, cache_ttl=http_cache_ttl * 3600)
+
         with ScraperOrchestrator(
             output_dir=output_dir,
             incremental=incremental,
             checkpoint_dir="checkpoints",
+            fetcher=fetcher,
         ) as orchestrator:
             # Set up streaming image sync before scraping
             sync_result: SyncResult | None = None
@@ -192,7 +212,7 @@ def scrape(  # noqa: PLR0912, PLR0913, PLR0915
                 stats = {
                     "unique_parts": len(orchestrator.unique_parts),
                     "applications_processed": len(orchestrator.processed_application_ids),
-                    "vehicles_tracked": sum(len(v) for v in orchestrator.vehicle_compat.values()),
+                    "vehicles_tracked": sum(map(len, orchestrator.vehicle_compat.values())),
                     "failure_summary": orchestrator.failure_tracker.get_summary(),
                     "timed_out": True,
                 }
@@ -5,6 +5,9 @@ Validates against Pydantic models and enforces data quality standards.
 """
 
 import json
+import operator
+import os
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -17,11 +20,22 @@ from src.models.vehicle import VehicleCompatibility
 
 logger = structlog.get_logger()
 
+# Fields read from every validated Part for the quality warnings below
+_PART_CHECK_FIELDS = operator.attrgetter("sku", "images", "description", "specifications")
 
-@dataclass
+# Required metadata fields per export format
+_PARTS_METADATA_FIELDS = frozenset({"export_date", "total_parts"})
+_COMPATIBILITY_METADATA_FIELDS = frozenset({"export_date", "total_mappings"})
+_HIERARCHICAL_METADATA_FIELDS = frozenset({"export_date", "structure", "total_years"})
+
+
+@dataclass(slots=True, frozen=True)
 class ValidationIssue:
     """Represents a validation issue.
 
+    Issues are immutable and slotted; a badly broken file can produce
+    thousands of them, so they carry no per-instance ``__dict__``.
+
     Attributes:
         severity: Issue severity ('error' or 'warning')
         field: Field/location where issue occurred
@@ -35,7 +49,7 @@ class ValidationIssue:
     details: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """Validation result with all findings.
 
@@ -70,14 +84,19 @@ class DataValidator:
     Provides comprehensive validation with configurable strictness levels.
     """
 
-    def __init__(self, strict: bool = False) -> None:
+    DEFAULT_MAX_ERRORS = 1000
+
+    def __init__(self, strict: bool = False, max_errors: int = DEFAULT_MAX_ERRORS) -> None:
         """Initialize validator.
 
         Args:
             strict: If True, warnings are treated as errors
+            max_errors: Stop validating items once this many errors have been
+                collected for a single file (bounds memory on badly broken files)
         """
         self.strict = strict
-        logger.info("validator_initialized", strict=strict)
+        self.max_errors = max_errors
+        logger.info("validator_initialized", strict=strict, max_errors=max_errors)
 
     def validate_json_file(self, filepath: Path) -> ValidationResult:
         """Validate a JSON export file.
@@ -98,7 +117,7 @@ class DataValidator:
             msg = f"File not found: {filepath}"
             raise FileNotFoundError(msg)
 
-        logger.info("validating_file", filepath=str(filepath))
+        logger.debug("validating_file", filepath=str(filepath))
 
         try:
             with filepath.open(encoding="utf-8") as f:
@@ -139,8 +158,16 @@ class DataValidator:
 
         results: dict[str, ValidationResult] = {}
 
-        for json_file in dirpath.glob("*.json"):
-            logger.info("validating_file_in_directory", file=json_file.name)
+        # os.scandir avoids glob's pattern matching and caches each entry's type
+        with os.scandir(dirpath) as entries:
+            json_files = [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            ]
+
+        for json_file in json_files:
+            logger.debug("validating_file_in_directory", file=json_file.name)
             try:
                 results[json_file.name] = self.validate_json_file(json_file)
             except ValueError as e:
@@ -190,7 +217,7 @@ class DataValidator:
             )
 
         # Validate metadata
-        metadata_issues = self._validate_metadata(data["metadata"], ["export_date", "total_parts"])
+        metadata_issues = self._validate_metadata(data["metadata"], _PARTS_METADATA_FIELDS)
         errors.extend(metadata_issues["errors"])
         warnings.extend(metadata_issues["warnings"])
 
@@ -223,6 +250,10 @@ class DataValidator:
             if not part_issues["errors"]:
                 valid_items += 1
 
+            if len(errors) >= self.max_errors:
+                errors.append(self._truncation_issue("parts"))
+                break
+
         # Check metadata consistency
         declared_count = data["metadata"].get("total_parts", 0)
         if declared_count != total_items:
@@ -237,7 +268,8 @@ class DataValidator:
         is_valid = len(errors) == 0 and (not self.strict or len(warnings) == 0)
 
         logger.info(
-            "parts_validation_complete",
+            "validation_complete",
+            export_type="parts",
             filepath=str(filepath),
             total=total_items,
             valid=valid_items,
@@ -282,9 +314,7 @@ class DataValidator:
             )
 
         # Validate metadata
-        metadata_issues = self._validate_metadata(
-            data["metadata"], ["export_date", "total_mappings"]
-        )
+        metadata_issues = self._validate_metadata(data["metadata"], _COMPATIBILITY_METADATA_FIELDS)
         errors.extend(metadata_issues["errors"])
         warnings.extend(metadata_issues["warnings"])
 
@@ -317,6 +347,10 @@ class DataValidator:
             if not compat_issues["errors"]:
                 valid_items += 1
 
+            if len(errors) >= self.max_errors:
+                errors.append(self._truncation_issue("compatibility"))
+                break
+
         # Check metadata consistency
         declared_count = data["metadata"].get("total_mappings", 0)
         if declared_count != total_items:
@@ -331,7 +365,8 @@ class DataValidator:
         is_valid = len(errors) == 0 and (not self.strict or len(warnings) == 0)
 
         logger.info(
-            "compatibility_validation_complete",
+            "validation_complete",
+            export_type="compatibility",
             filepath=str(filepath),
             total=total_items,
             valid=valid_items,
@@ -376,9 +411,7 @@ class DataValidator:
             )
 
         # Validate metadata
-        metadata_issues = self._validate_metadata(
-            data["metadata"], ["export_date", "structure", "total_years"]
-        )
+        metadata_issues = self._validate_metadata(data["metadata"], _HIERARCHICAL_METADATA_FIELDS)
         errors.extend(metadata_issues["errors"])
         warnings.extend(metadata_issues["warnings"])
 
@@ -403,7 +436,155 @@ class DataValidator:
         total_items = 0
         valid_items = 0
 
+        # Exports written with part_refs hold each part once in parts_table;
+        # validate those up front and only range-check the indices below
+        table_valid: list[bool] | None = None
+        if "parts_table" in data:
+            table_valid = self._validate_parts_table(data["parts_table"], errors, warnings)
+
         # Traverse hierarchy: year -> make -> model -> parts
+        for location, part_data in self._iter_hierarchy_parts(hierarchy, errors, warnings):
+            total_items += 1
+            if table_valid is not None:
+                if self._check_part_ref(part_data, table_valid, location, errors):
+                    valid_items += 1
+            else:
+                part_issues = self._validate_part_data(part_data, location)
+                errors.extend(part_issues["errors"])
+                warnings.extend(part_issues["warnings"])
+
+                if not part_issues["errors"]:
+                    valid_items += 1
+
+            if len(errors) >= self.max_errors:
+                errors.append(self._truncation_issue("data"))
+                break
+
+        # Check year count consistency
+        declared_years = data["metadata"].get("total_years", 0)
+        actual_years = len(hierarchy)
+        if declared_years != actual_years:
+            warnings.append(
+                ValidationIssue(
+                    severity="warning",
+                    field="metadata.total_years",
+                    message=f"Metadata declares {declared_years} years but found {actual_years}",
+                )
+            )
+
+        is_valid = len(errors) == 0 and (not self.strict or len(warnings) == 0)
+
+        logger.info(
+            "validation_complete",
+            export_type="hierarchical",
+            filepath=str(filepath),
+            total=total_items,
+            valid=valid_items,
+            years=len(hierarchy),
+            errors=len(errors),
+            warnings=len(warnings),
+        )
+
+        return ValidationResult(
+            is_valid=is_valid,
+            errors=errors,
+            warnings=warnings,
+            total_items=total_items,
+            valid_items=valid_items,
+        )
+
+    def _validate_parts_table(
+        self,
+        parts_table: Any,  # noqa: ANN401
+        errors: list[ValidationIssue],
+        warnings: list[ValidationIssue],
+    ) -> list[bool]:
+        """Validate the shared part table of a hierarchical export.
+
+        Args:
+            parts_table: The export's ``parts_table`` value
+            errors: List to collect errors into
+            warnings: List to collect warnings into
+
+        Returns:
+            Per-entry validity flags, indexed like ``parts_table``
+        """
+        if not isinstance(parts_table, list):
+            errors.append(
+                ValidationIssue(
+                    severity="error",
+                    field="parts_table",
+                    message="'parts_table' must be a list",
+                )
+            )
+            return []
+
+        table_valid: list[bool] = []
+        for idx, part_data in enumerate(parts_table):
+            part_issues = self._validate_part_data(part_data, idx)
+            errors.extend(part_issues["errors"])
+            warnings.extend(part_issues["warnings"])
+            table_valid.append(not part_issues["errors"])
+
+            if len(errors) >= self.max_errors:
+                errors.append(self._truncation_issue("parts_table"))
+                break
+
+        return table_valid
+
+    def _check_part_ref(
+        self,
+        part_ref: Any,  # noqa: ANN401
+        table_valid: list[bool],
+        location: str,
+        errors: list[ValidationIssue],
+    ) -> bool:
+        """Check a hierarchy entry is a valid index into ``parts_table``.
+
+        Args:
+            part_ref: Hierarchy entry expected to be a part index
+            table_valid: Per-entry validity flags from _validate_parts_table
+            location: Location of the entry for error messages
+            errors: List to collect errors into
+
+        Returns:
+            True if the index is in range and points at a valid part
+        """
+        if (
+            not isinstance(part_ref, int)
+            or isinstance(part_ref, bool)
+            or not 0 <= part_ref < len(table_valid)
+        ):
+            errors.append(
+                ValidationIssue(
+                    severity="error",
+                    field=f"data.{location}",
+                    message=f"Part reference {part_ref!r} is not a valid parts_table index",
+                )
+            )
+            return False
+        return table_valid[part_ref]
+
+    def _iter_hierarchy_parts(
+        self,
+        hierarchy: dict[str, Any],
+        errors: list[ValidationIssue],
+        warnings: list[ValidationIssue],
+    ) -> Iterator[tuple[str, Any]]:
+        """Walk a year > make > model hierarchy and yield each part entry.
+
+        Structural problems found along the way are appended to ``errors`` and
+        ``warnings``. The walk is lazy, so callers can stop early without
+        traversing the rest of the tree.
+
+        Args:
+            hierarchy: The export's ``data`` dict
+            errors: List to collect structural errors into
+            warnings: List to collect structural warnings into
+
+        Yields:
+            Tuples of (location, part_data) for every part in the hierarchy
+        """
         for year, makes in hierarchy.items():
             # Validate year is numeric
             if not str(year).isdigit():
@@ -447,47 +628,22 @@ class DataValidator:
                         )
                         continue
 
-                    # Validate each part in this vehicle configuration
                     for idx, part_data in enumerate(parts):
-                        total_items += 1
-                        location = f"{year}.{make}.{model}[{idx}]"
-                        part_issues = self._validate_part_data(part_data, location)
-                        errors.extend(part_issues["errors"])
-                        warnings.extend(part_issues["warnings"])
+                        yield f"{year}.{make}.{model}[{idx}]", part_data
 
-                        if not part_issues["errors"]:
-                            valid_items += 1
+    def _truncation_issue(self, field: str) -> ValidationIssue:
+        """Build the summary issue recorded when validation stops early.
 
-        # Check year count consistency
-        declared_years = data["metadata"].get("total_years", 0)
-        actual_years = len(hierarchy)
-        if declared_years != actual_years:
-            warnings.append(
-                ValidationIssue(
-                    severity="warning",
-                    field="metadata.total_years",
-                    message=f"Metadata declares {declared_years} years but found {actual_years}",
-                )
-            )
-
-        is_valid = len(errors) == 0 and (not self.strict or len(warnings) == 0)
-
-        logger.info(
-            "hierarchical_validation_complete",
-            filepath=str(filepath),
-            total_parts=total_items,
-            valid_parts=valid_items,
-            years=len(hierarchy),
-            errors=len(errors),
-            warnings=len(warnings),
-        )
+        Args:
+            field: Top-level field whose items were being validated
 
-        return ValidationResult(
-            is_valid=is_valid,
-            errors=errors,
-            warnings=warnings,
-            total_items=total_items,
-            valid_items=valid_items,
+        Returns:
+            ValidationIssue describing the truncation
+        """
+        return ValidationIssue(
+            severity="error",
+            field=field,
+            message=f"Validation truncated at {self.max_errors} errors",
         )
 
     def _validate_export_structure(
@@ -519,7 +675,7 @@ class DataValidator:
     def _validate_metadata(
         self,
         metadata: Any,  # noqa: ANN401
-        required_fields: list[str],
+        required_fields: frozenset[str],
     ) -> dict[str, list[ValidationIssue]]:
         """Validate export metadata.
 
@@ -543,16 +699,15 @@ class DataValidator:
             )
             return {"errors": errors, "warnings": warnings}
 
-        # Check required fields
-        for field in required_fields:
-            if field not in metadata:
-                errors.append(
-                    ValidationIssue(
-                        severity="error",
-                        field=f"metadata.{field}",
-                        message=f"Missing required metadata field: '{field}'",
-                    )
+        # Check required fields (sorted so error order is stable)
+        for field in sorted(required_fields - metadata.keys()):
+            errors.append(
+                ValidationIssue(
+                    severity="error",
+                    field=f"metadata.{field}",
+                    message=f"Missing required metadata field: '{field}'",
                 )
+            )
 
         # Validate version if present
         if "version" in metadata:
@@ -586,32 +741,33 @@ class DataValidator:
         try:
             # Attempt to create Part instance
             part = Part(**part_data)
+            sku, images, description, specifications = _PART_CHECK_FIELDS(part)
 
             # Additional validation checks
-            if not part.images:
+            if not images:
                 warnings.append(
                     ValidationIssue(
                         severity="warning",
                         field=f"parts[{identifier}].images",
-                        message=f"Part {part.sku} has no images",
+                        message=f"Part {sku} has no images",
                     )
                 )
 
-            if not part.description:
+            if not description:
                 warnings.append(
                     ValidationIssue(
                         severity="warning",
                         field=f"parts[{identifier}].description",
-                        message=f"Part {part.sku} has no description",
+                        message=f"Part {sku} has no description",
                     )
                 )
 
-            if not part.specifications:
+            if not specifications:
                 warnings.append(
                     ValidationIssue(
                         severity="warning",
                         field=f"parts[{identifier}].specifications",
-                        message=f"Part {part.sku} has no specifications",
+                        message=f"Part {sku} has no specifications",
                     )
                 )
 
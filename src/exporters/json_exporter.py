@@ -2,21 +2,441 @@
 
 This module exports validated data to JSON files for WordPress import.
 Supports hierarchical organization (Year → Make → Model → Parts).
+Filenames ending in ``.gz`` or ``.zst`` are compressed transparently.
 """
 
+import gzip
+import importlib
 import json
+import re
+import zlib
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from datetime import UTC, datetime
+from decimal import Decimal
 from pathlib import Path
-from typing import Any
+from types import ModuleType
+from typing import Any, BinaryIO
 
+import orjson
 import structlog
 
-from src.models.part import Part
-from src.models.vehicle import Vehicle, VehicleCompatibility
+from src.models.part import PART_LIST_ADAPTER, Part
+from src.models.vehicle import COMPATIBILITY_LIST_ADAPTER, Vehicle, VehicleCompatibility
+
+simdjson: ModuleType | None
+try:
+    simdjson = importlib.import_module("simdjson")
+except ImportError:  # optional: validate_export falls back to orjson
+    simdjson = None
 
 logger = structlog.get_logger()
 
 
+def _orjson_default(obj: Any) -> str:  # noqa: ANN401
+    """Serialize types orjson does not handle natively.
+
+    orjson already covers datetime, so only Decimal needs help here.
+
+    Args:
+        obj: Object orjson could not serialize
+
+    Returns:
+        String form of the object
+
+    Raises:
+        TypeError: If the object type is not supported
+    """
+    if isinstance(obj, Decimal):
+        return str(obj)
+    msg = f"Type is not JSON serializable: {type(obj).__name__}"
+    raise TypeError(msg)
+
+
+def _dumps(data: Any, pretty: bool, option: int = 0) -> bytes:  # noqa: ANN401
+    """Serialize data to UTF-8 JSON bytes with orjson.
+
+    Args:
+        data: JSON-compatible data to serialize
+        pretty: Whether to indent output with 2 spaces
+        option: Additional orjson option flags
+
+    Returns:
+        Serialized JSON bytes
+    """
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(data, default=_orjson_default, option=option)
+
+
+# Export files are written in large blocks to cut write syscalls on big outputs
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+# Exports whose filename ends in one of these suffixes are compressed on write
+# and decompressed on read
+_GZIP_SUFFIX = ".gz"
+_ZSTD_SUFFIX = ".zst"
+_ZSTD_LEVEL = 3
+
+
+def _zstd() -> ModuleType:
+    """Import the optional ``zstandard`` package.
+
+    Returns:
+        The zstandard module
+
+    Raises:
+        ImportError: If zstandard is not installed
+    """
+    try:
+        return importlib.import_module("zstandard")
+    except ImportError as e:
+        msg = "zstd exports require the 'zstandard' package (install the 'compress' extra)"
+        raise ImportError(msg) from e
+
+
+def _compressing_writer(path: Path, raw: BinaryIO) -> Any:  # noqa: ANN401
+    """Wrap a raw file handle in a compressor chosen by ``path``'s suffix.
+
+    Args:
+        path: Destination file path (``.gz`` → gzip, ``.zst`` → zstd)
+        raw: Open binary handle the compressed stream is written to
+
+    Returns:
+        Context manager yielding a writable binary stream; ``raw`` itself
+        (left open) for uncompressed paths
+    """
+    if path.suffix == _GZIP_SUFFIX:
+        return gzip.GzipFile(fileobj=raw, mode="wb", mtime=0)
+    if path.suffix == _ZSTD_SUFFIX:
+        return _zstd().ZstdCompressor(level=_ZSTD_LEVEL).stream_writer(raw, closefd=False)
+    return nullcontext(raw)
+
+
+def _read_export(path: Path) -> bytes:
+    """Read an export file, decompressing it if its suffix says so.
+
+    Args:
+        path: Export file path
+
+    Returns:
+        Uncompressed file contents
+
+    Raises:
+        OSError: If the file cannot be read or is not valid gzip data
+    """
+    data = path.read_bytes()
+    if path.suffix == _GZIP_SUFFIX:
+        return gzip.decompress(data)
+    if path.suffix == _ZSTD_SUFFIX:
+        zstd = _zstd()
+        try:
+            return bytes(zstd.ZstdDecompressor().decompressobj().decompress(data))
+        except zstd.ZstdError as e:
+            msg = f"Invalid zstd data in {path}: {e}"
+            raise OSError(msg) from e
+    return data
+
+
+def _check_json(data: bytes) -> None:
+    """Check that bytes hold one well-formed JSON document.
+
+    Uses simdjson's SIMD parser when the optional ``pysimdjson`` package is
+    installed, which validates without building Python objects for the
+    document; otherwise falls back to a full orjson parse.
+
+    Args:
+        data: Candidate JSON bytes
+
+    Raises:
+        ValueError: If the data is not valid JSON
+    """
+    if simdjson is None:
+        orjson.loads(data)
+    else:
+        simdjson.Parser().parse(data)
+
+
+# Every whole-file export writes "metadata" as its first key, so a stats call
+# only needs to decode this much of the file to find it
+_METADATA_HEAD_BYTES = 64 * 1024
+_METADATA_KEY_RE = re.compile(r'\A\s*\{\s*"metadata"\s*:\s*')
+
+
+def _read_export_head(path: Path, size: int) -> bytes:
+    """Read up to ``size`` bytes from the start of an export, decompressing if needed.
+
+    Args:
+        path: Export file path
+        size: Number of (compressed) bytes to read from disk
+
+    Returns:
+        Leading uncompressed bytes of the export
+
+    Raises:
+        OSError: If the file cannot be read or is not valid compressed data
+    """
+    with path.open("rb") as f:
+        data = f.read(size)
+    if path.suffix == _GZIP_SUFFIX:
+        try:
+            return zlib.decompressobj(wbits=zlib.MAX_WBITS | 16).decompress(data)
+        except zlib.error as e:
+            msg = f"Invalid gzip data in {path}: {e}"
+            raise OSError(msg) from e
+    if path.suffix == _ZSTD_SUFFIX:
+        zstd = _zstd()
+        try:
+            return bytes(zstd.ZstdDecompressor().decompressobj().decompress(data))
+        except zstd.ZstdError as e:
+            msg = f"Invalid zstd data in {path}: {e}"
+            raise OSError(msg) from e
+    return data
+
+
+def _read_metadata_header(path: Path) -> dict[str, Any] | None:
+    """Decode an export's leading ``metadata`` object without parsing the rest.
+
+    Args:
+        path: Export file path
+
+    Returns:
+        The metadata dict, or None if it is not found within the first
+        _METADATA_HEAD_BYTES of the file
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    # A truncated multi-byte character can only sit at the cut-off, past the metadata
+    head = _read_export_head(path, _METADATA_HEAD_BYTES).decode("utf-8", errors="ignore")
+    match = _METADATA_KEY_RE.match(head)
+    if match is None:
+        return None
+    try:
+        metadata, _ = json.JSONDecoder().raw_decode(head, match.end())
+    except json.JSONDecodeError:
+        return None
+    return metadata if isinstance(metadata, dict) else None
+
+
+@contextmanager
+def _atomic_open(path: Path) -> Iterator[BinaryIO]:
+    """Open a buffered temporary sibling of ``path`` and rename it into place on success.
+
+    A failure part-way through leaves any existing ``path`` untouched and
+    removes the partial temporary file. Paths ending in ``.gz`` or ``.zst``
+    are compressed as they are written.
+
+    Args:
+        path: Destination file path
+
+    Yields:
+        Binary file handle for the temporary file
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        with (
+            tmp_path.open("wb", buffering=_WRITE_BUFFER_SIZE) as raw,
+            _compressing_writer(path, raw) as f,
+        ):
+            yield f
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write bytes to a temporary sibling file, then rename it over ``path``.
+
+    Args:
+        path: Destination file path
+        data: Bytes to write
+    """
+    with _atomic_open(path) as f:
+        f.write(data)
+
+
+def _jsonl_meta_path(jsonl_path: Path) -> Path:
+    """Get the sidecar metadata path for a JSON Lines export.
+
+    Args:
+        jsonl_path: Path to the .jsonl file
+
+    Returns:
+        Path of the ``<name>.meta.json`` sidecar
+    """
+    return jsonl_path.with_name(f"{jsonl_path.name}.meta.json")
+
+
+# Below this many parts, thread startup costs more than the parallel dump saves
+_PARALLEL_DUMP_MIN_PARTS = 1000
+
+
+def _dump_parts(parts: list[Part], workers: int) -> list[dict[str, Any]]:
+    """Serialize parts to JSON-compatible dicts, optionally across threads.
+
+    Args:
+        parts: Part instances to serialize
+        workers: Number of threads; 1 (or a small batch) dumps serially
+
+    Returns:
+        List of part dicts in input order
+    """
+    if workers <= 1 or len(parts) < _PARALLEL_DUMP_MIN_PARTS:
+        parts_data: list[dict[str, Any]] = PART_LIST_ADAPTER.dump_python(parts, mode="json")
+        return parts_data
+
+    chunk_size = -(-len(parts) // workers)
+    chunks = [parts[i : i + chunk_size] for i in range(0, len(parts), chunk_size)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        dumped = executor.map(
+            lambda chunk: PART_LIST_ADAPTER.dump_python(chunk, mode="json"), chunks
+        )
+        return [part for chunk in dumped for part in chunk]
+
+
+# Parts serialized per write when streaming a list export; bounds the part
+# dicts and JSON bytes held at once, while staying large enough for the
+# threaded dump to apply
+_STREAM_CHUNK_PARTS = 5000
+
+
+def _write_list_stream(
+    f: BinaryIO,
+    header: dict[str, Any],
+    list_key: str,
+    chunks: Iterable[list[dict[str, Any]]],
+    option: int = 0,
+) -> None:
+    """Write ``{**header, list_key: [...]}`` one chunk of list items at a time.
+
+    The output is byte-for-byte what ``_dumps`` produces for the whole
+    object, but only one chunk's dicts and serialized bytes are held in
+    memory at once.
+
+    Args:
+        f: Binary file handle to write to
+        header: Non-empty top-level keys to write before the list
+        list_key: Key of the streamed list, written last
+        chunks: Lists of JSON-compatible items, in output order
+        option: orjson option flags; ``OPT_INDENT_2`` selects pretty output
+    """
+    pretty = bool(option & orjson.OPT_INDENT_2)
+    # Reopen the serialized header object to append the list as its last key
+    head = orjson.dumps(header, default=_orjson_default, option=option)
+    key = orjson.dumps(list_key)
+    if pretty:
+        f.write(head[:-2] + b",\n  " + key + b": [")
+    else:
+        f.write(head[:-1] + b"," + key + b":[")
+
+    written = False
+    for chunk in chunks:
+        if not chunk:
+            continue
+        # Drop the chunk's own brackets; pretty items shift one level deeper
+        items = orjson.dumps(chunk, default=_orjson_default, option=option)[1:-1]
+        if pretty:
+            items = items[1:-1].replace(b"\n", b"\n  ")
+            f.write((b",\n  " if written else b"\n  ") + items)
+        else:
+            f.write((b"," if written else b"") + items)
+        written = True
+
+    if pretty:
+        f.write(b"\n  ]\n}" if written else b"]\n}")
+    else:
+        f.write(b"]}")
+
+
+# JSON Lines record type -> (dedup key, metadata count field, JSON export list key)
+_JSONL_RECORD_TYPES: dict[str, tuple[str, str, str]] = {
+    "parts": ("sku", "total_parts", "parts"),
+    "compatibility": ("part_sku", "total_mappings", "compatibility"),
+}
+
+
+def _intern_spec_keys(part_data: dict[str, Any], spec_key_index: dict[str, int]) -> None:
+    """Replace a part dict's specification names with indices into a shared table.
+
+    New names are appended to ``spec_key_index`` in first-seen order, so
+    ``list(spec_key_index)`` is the matching ``spec_keys`` table.
+
+    Args:
+        part_data: Part dict to rewrite in place
+        spec_key_index: Specification name → index mapping, shared across parts
+    """
+    specs = part_data.get("specifications")
+    if specs:
+        part_data["specifications"] = {
+            spec_key_index.setdefault(name, len(spec_key_index)): value
+            for name, value in specs.items()
+        }
+
+
+def decode_specs(part_data: dict[str, Any], spec_keys: list[str]) -> dict[str, Any]:
+    """Restore specification names in a part dict exported with ``intern_spec_keys``.
+
+    Args:
+        part_data: Part dict whose specification keys are table indices
+        spec_keys: The export's top-level ``spec_keys`` table
+
+    Returns:
+        Copy of the part dict with named specifications
+
+    Raises:
+        ValueError: If a specification index is not in ``spec_keys``
+    """
+    specs = part_data.get("specifications")
+    if not specs:
+        return dict(part_data)
+
+    try:
+        named_specs = {spec_keys[int(idx)]: value for idx, value in specs.items()}
+    except (IndexError, ValueError) as e:
+        msg = f"Invalid specification index for spec_keys of {len(spec_keys)} entries"
+        raise ValueError(msg) from e
+    return {**part_data, "specifications": named_specs}
+
+
+def expand_hierarchy(export_data: dict[str, Any]) -> dict[str, Any]:
+    """Inline part dicts into a hierarchical export written with ``part_refs``.
+
+    Args:
+        export_data: Parsed hierarchical export
+
+    Returns:
+        Year → Make → Model → Parts mapping with full part dicts. Exports
+        without a ``parts_table`` are returned unchanged.
+
+    Raises:
+        ValueError: If a part index is out of range for ``parts_table``
+    """
+    parts_table = export_data.get("parts_table")
+    hierarchy: dict[str, Any] = export_data["data"]
+    if parts_table is None:
+        return hierarchy
+
+    try:
+        return {
+            year: {
+                make: {
+                    model: [parts_table[idx] for idx in indices]
+                    for model, indices in models.items()
+                }
+                for make, models in makes.items()
+            }
+            for year, makes in hierarchy.items()
+        }
+    except IndexError as e:
+        msg = f"Part index out of range for parts_table of {len(parts_table)} entries"
+        raise ValueError(msg) from e
+
+
 class JSONExporter:
     """Exporter for parts and compatibility data to JSON format.
 
@@ -39,6 +459,9 @@ class JSONExporter:
         parts: list[Part],
         filename: str = "parts.json",
         pretty: bool = True,
+        workers: int = 1,
+        *,
+        intern_spec_keys: bool = False,
     ) -> Path:
         """Export parts to JSON file.
 
@@ -46,6 +469,11 @@ class JSONExporter:
             parts: List of validated Part instances
             filename: Output filename (default: "parts.json")
             pretty: Whether to pretty-print JSON (default: True)
+            workers: Threads used to convert parts to dicts (default: 1).
+                Ignored for batches under 1000 parts.
+            intern_spec_keys: Write specification names once in a top-level
+                ``spec_keys`` table and key each part's specifications by
+                index into it (default: False). Use decode_specs() to restore.
 
         Returns:
             Path to created JSON file
@@ -61,27 +489,39 @@ class JSONExporter:
             True
         """
         output_path = self.output_dir / filename
+        now_iso = datetime.now(UTC).isoformat()
 
         try:
-            # Convert Parts to dicts
-            parts_data = [self._part_to_dict(part) for part in parts]
-
             # Create export structure with metadata
-            export_data = {
+            header: dict[str, Any] = {
                 "metadata": {
-                    "export_date": datetime.now(UTC).isoformat(),
+                    "export_date": now_iso,
                     "total_parts": len(parts),
                     "version": "1.0",
                 },
-                "parts": parts_data,
             }
+            option = orjson.OPT_INDENT_2 if pretty else 0
+            chunks: Iterable[list[dict[str, Any]]]
+            if intern_spec_keys:
+                # The spec_keys table precedes the parts, so every part is dumped first
+                parts_data = _dump_parts(parts, workers)
+                spec_key_index: dict[str, int] = {}
+                for part_data in parts_data:
+                    _intern_spec_keys(part_data, spec_key_index)
+                header["spec_keys"] = list(spec_key_index)
+                option |= orjson.OPT_NON_STR_KEYS
+                chunks = (parts_data,)
+            else:
+                # Convert and write a chunk at a time (each chunk across threads
+                # if requested), never holding every part dict at once
+                chunks = (
+                    _dump_parts(parts[i : i + _STREAM_CHUNK_PARTS], workers)
+                    for i in range(0, len(parts), _STREAM_CHUNK_PARTS)
+                )
 
             # Write to file
-            with output_path.open("w", encoding="utf-8") as f:
-                if pretty:
-                    json.dump(export_data, f, indent=2, ensure_ascii=False)
-                else:
-                    json.dump(export_data, f, ensure_ascii=False)
+            with _atomic_open(output_path) as f:
+                _write_list_stream(f, header, "parts", chunks, option)
 
             logger.info(
                 "parts_exported",
@@ -117,15 +557,16 @@ class JSONExporter:
             IOError: If export fails
         """
         output_path = self.output_dir / filename
+        now_iso = datetime.now(UTC).isoformat()
 
         try:
             # Convert to dicts
-            compat_data = [self._compatibility_to_dict(comp) for comp in compatibility]
+            compat_data = COMPATIBILITY_LIST_ADAPTER.dump_python(compatibility, mode="json")
 
             # Create export structure
             export_data = {
                 "metadata": {
-                    "export_date": datetime.now(UTC).isoformat(),
+                    "export_date": now_iso,
                     "total_mappings": len(compatibility),
                     "version": "1.0",
                 },
@@ -133,11 +574,7 @@ class JSONExporter:
             }
 
             # Write to file
-            with output_path.open("w", encoding="utf-8") as f:
-                if pretty:
-                    json.dump(export_data, f, indent=2, ensure_ascii=False)
-                else:
-                    json.dump(export_data, f, ensure_ascii=False)
+            _write_atomic(output_path, _dumps(export_data, pretty))
 
             logger.info(
                 "compatibility_exported",
@@ -153,12 +590,16 @@ class JSONExporter:
         else:
             return output_path
 
-    def export_hierarchical(
+    def export_hierarchical(  # noqa: PLR0913
         self,
         compatibility: list[VehicleCompatibility],
-        parts_by_sku: dict[str, Part],
+        parts_by_sku: dict[str, Part] | None = None,
         filename: str = "hierarchical.json",
         pretty: bool = True,
+        *,
+        part_refs: bool = False,
+        parts: list[Part] | None = None,
+        intern_spec_keys: bool = False,
     ) -> Path:
         """Export data in hierarchical structure: Year → Make → Model → Parts.
 
@@ -166,71 +607,70 @@ class JSONExporter:
 
         Args:
             compatibility: List of VehicleCompatibility mappings
-            parts_by_sku: Dict mapping SKU to Part
+            parts_by_sku: Dict mapping SKU to Part (or pass ``parts`` instead)
             filename: Output filename (default: "hierarchical.json")
             pretty: Whether to pretty-print JSON (default: True)
+            part_refs: Store each part once in a top-level ``parts_table`` and
+                list integer indices into it under each model, instead of
+                repeating the full part dict (default: False).
+                Use expand_hierarchy() to restore the inline form.
+            parts: List of Parts to index by SKU when ``parts_by_sku`` is not given
+            intern_spec_keys: Key specifications by index into a top-level
+                ``spec_keys`` table, as in export_parts() (default: False)
 
         Returns:
             Path to created JSON file
 
         Raises:
+            ValueError: If neither parts_by_sku nor parts is given
             IOError: If export fails
 
         Example:
             >>> exporter = JSONExporter()
             >>> parts_by_sku = {"CSF-123": part1, "CSF-456": part2}
             >>> path = exporter.export_hierarchical(compatibility, parts_by_sku)
+            >>> path = exporter.export_hierarchical(compatibility, parts=[part1, part2])
         """
+        if parts_by_sku is None:
+            if parts is None:
+                msg = "export_hierarchical requires parts_by_sku or parts"
+                raise ValueError(msg)
+            parts_by_sku = {part.sku: part for part in parts}
+
         output_path = self.output_dir / filename
+        now_iso = datetime.now(UTC).isoformat()
 
         try:
             # Build hierarchical structure
-            hierarchy: dict[int, dict[str, dict[str, list[dict[str, Any]]]]] = {}
-
-            for compat in compatibility:
-                part_sku = compat.part_sku
-                part = parts_by_sku.get(part_sku)
-
-                if not part:
-                    logger.warning("part_not_found_for_compat", sku=part_sku)
-                    continue
-
-                part_dict = self._part_to_dict(part)
-
-                # Organize by Year → Make → Model
-                for vehicle in compat.vehicles:
-                    year = vehicle.year
-                    make = vehicle.make
-                    model = vehicle.model
-
-                    # Initialize nested structure
-                    if year not in hierarchy:
-                        hierarchy[year] = {}
-                    if make not in hierarchy[year]:
-                        hierarchy[year][make] = {}
-                    if model not in hierarchy[year][make]:
-                        hierarchy[year][make][model] = []
-
-                    # Add part to this vehicle configuration
-                    hierarchy[year][make][model].append(part_dict)
+            parts_table: list[dict[str, Any]] | None = [] if part_refs else None
+            spec_key_index: dict[str, int] | None = {} if intern_spec_keys else None
+            hierarchy = self._build_hierarchy(
+                compatibility, parts_by_sku, parts_table, spec_key_index
+            )
 
-            # Create export structure
-            export_data = {
-                "metadata": {
-                    "export_date": datetime.now(UTC).isoformat(),
-                    "structure": "year > make > model > parts",
-                    "total_years": len(hierarchy),
-                    "version": "1.0",
-                },
-                "data": hierarchy,
+            metadata: dict[str, Any] = {
+                "export_date": now_iso,
+                "structure": "year > make > model > parts",
+                "total_years": len(hierarchy),
+                "version": "1.0",
             }
-
-            # Write to file
-            with output_path.open("w", encoding="utf-8") as f:
-                if pretty:
-                    json.dump(export_data, f, indent=2, ensure_ascii=False, sort_keys=True)
-                else:
-                    json.dump(export_data, f, ensure_ascii=False)
+            if parts_table is not None:
+                metadata["structure"] = "year > make > model > part_indices; see parts_table"
+                metadata["total_parts"] = len(parts_table)
+
+            # Top-level sections written ahead of "data"
+            header: dict[str, Any] = {"metadata": metadata}
+            if spec_key_index is not None:
+                header["spec_keys"] = list(spec_key_index)
+            if parts_table is not None:
+                header["parts_table"] = parts_table
+
+            if pretty:
+                # Write to file (year keys are ints, so allow non-str keys)
+                export_data = {**header, "data": hierarchy}
+                _write_atomic(output_path, _dumps(export_data, pretty, orjson.OPT_NON_STR_KEYS))
+            else:
+                self._write_hierarchy_stream(output_path, header, hierarchy)
 
             logger.info(
                 "hierarchical_exported",
@@ -271,29 +711,32 @@ class JSONExporter:
             IOError: If export fails
         """
         output_path = self.output_dir / filename
+        now_iso = datetime.now(UTC).isoformat()
 
         try:
-            merged_parts = []
-            for part in parts:
-                part_dict = self._part_to_dict(part)
-                vehicles = compatibility_map.get(part.sku, [])
-                part_dict["compatibility"] = [v.model_dump(mode="json") for v in vehicles]
-                merged_parts.append(part_dict)
-
-            export_data = {
+            header = {
                 "metadata": {
-                    "export_date": datetime.now(UTC).isoformat(),
+                    "export_date": now_iso,
                     "total_parts": len(parts),
                     "version": "1.0",
                 },
-                "parts": merged_parts,
             }
 
-            with output_path.open("w", encoding="utf-8") as f:
-                if pretty:
-                    json.dump(export_data, f, indent=2, ensure_ascii=False)
-                else:
-                    json.dump(export_data, f, ensure_ascii=False)
+            def _merged_chunks() -> Iterator[list[dict[str, Any]]]:
+                for i in range(0, len(parts), _STREAM_CHUNK_PARTS):
+                    merged_parts = []
+                    for part in parts[i : i + _STREAM_CHUNK_PARTS]:
+                        part_dict = self._part_to_dict(part)
+                        vehicles = compatibility_map.get(part.sku, [])
+                        part_dict["compatibility"] = [v.model_dump(mode="json") for v in vehicles]
+                        merged_parts.append(part_dict)
+                    yield merged_parts
+
+            # Merged dicts are built and written a chunk at a time
+            with _atomic_open(output_path) as f:
+                _write_list_stream(
+                    f, header, "parts", _merged_chunks(), orjson.OPT_INDENT_2 if pretty else 0
+                )
 
             logger.info(
                 "complete_export_finished",
@@ -309,6 +752,95 @@ class JSONExporter:
         else:
             return output_path
 
+    def _build_hierarchy(
+        self,
+        compatibility: list[VehicleCompatibility],
+        parts_by_sku: dict[str, Part],
+        parts_table: list[dict[str, Any]] | None,
+        spec_key_index: dict[str, int] | None = None,
+    ) -> dict[int, Any]:
+        """Group part entries into a Year → Make → Model tree.
+
+        Args:
+            compatibility: List of VehicleCompatibility mappings
+            parts_by_sku: Dict mapping SKU to Part
+            parts_table: When given, part dicts are appended here and the tree
+                holds their indices instead of the dicts themselves
+            spec_key_index: When given, specification names are interned into
+                this shared name → index mapping
+
+        Returns:
+            Year → Make → Model → part entries mapping, with keys inserted in
+            sorted order at every level
+        """
+        hierarchy: defaultdict[int, defaultdict[str, defaultdict[str, list[Any]]]] = defaultdict(
+            lambda: defaultdict(lambda: defaultdict(list))
+        )
+        # Parts are frozen, so one entry per SKU (the part dict, or its
+        # parts_table index) can be shared by every vehicle node
+        part_entry_cache: dict[str, dict[str, Any] | int] = {}
+
+        for compat in compatibility:
+            part_sku = compat.part_sku
+            part_entry = part_entry_cache.get(part_sku)
+
+            if part_entry is None:
+                part = parts_by_sku.get(part_sku)
+
+                if not part:
+                    logger.warning("part_not_found_for_compat", sku=part_sku)
+                    continue
+
+                part_entry = self._part_to_dict(part)
+                if spec_key_index is not None:
+                    _intern_spec_keys(part_entry, spec_key_index)
+                if parts_table is not None:
+                    parts_table.append(part_entry)
+                    part_entry = len(parts_table) - 1
+                part_entry_cache[part_sku] = part_entry
+
+            # Organize by Year → Make → Model
+            for vehicle in compat.vehicles:
+                hierarchy[vehicle.year][vehicle.make][vehicle.model].append(part_entry)
+
+        # Sort once here so serializers can keep insertion order instead of
+        # sorting every nested dict
+        return {
+            year: {make: dict(sorted(models.items())) for make, models in sorted(makes.items())}
+            for year, makes in sorted(hierarchy.items())
+        }
+
+    def _write_hierarchy_stream(
+        self,
+        output_path: Path,
+        header: dict[str, Any],
+        hierarchy: dict[int, Any],
+    ) -> None:
+        """Write a compact hierarchical export one year subtree at a time.
+
+        Only a single year's serialized bytes are held in memory at once,
+        instead of one blob for the whole tree.
+
+        Args:
+            output_path: Destination file path
+            header: Non-empty top-level sections (metadata, tables) to write before "data"
+            hierarchy: Year → Make → Model → Parts structure, already key-sorted
+        """
+        option = orjson.OPT_NON_STR_KEYS
+        with _atomic_open(output_path) as f:
+            # Reopen the serialized header object to append "data" as its last key
+            f.write(orjson.dumps(header, default=_orjson_default, option=option)[:-1])
+            f.write(b',"data":{')
+            for idx, (year, makes) in enumerate(hierarchy.items()):
+                if idx:
+                    f.write(b",")
+                f.write(
+                    orjson.dumps(str(year))
+                    + b":"
+                    + orjson.dumps(makes, default=_orjson_default, option=option)
+                )
+            f.write(b"}}")
+
     def _part_to_dict(self, part: Part) -> dict[str, Any]:
         """Convert Part to dict for JSON serialization.
 
@@ -319,15 +851,9 @@ class JSONExporter:
             Dict representation suitable for JSON
 
         Note:
-            Uses Pydantic's model_dump with specific serialization rules.
+            JSON mode already renders Decimal prices as strings.
         """
-        data = part.model_dump(mode="json")
-
-        # Convert Decimal to string for better JSON compatibility
-        if "price" in data and data["price"] is not None:
-            data["price"] = str(data["price"])
-
-        return data
+        return part.model_dump(mode="json")
 
     def _compatibility_to_dict(self, compatibility: VehicleCompatibility) -> dict[str, Any]:
         """Convert VehicleCompatibility to dict for JSON serialization.
@@ -343,6 +869,8 @@ class JSONExporter:
     def validate_export(self, filepath: Path) -> bool:
         """Validate that exported JSON file is valid.
 
+        The check is syntactic only; see _check_json() for the parser used.
+
         Args:
             filepath: Path to JSON file
 
@@ -356,11 +884,10 @@ class JSONExporter:
             True
         """
         try:
-            with filepath.open(encoding="utf-8") as f:
-                json.load(f)
+            _check_json(_read_export(filepath))
             logger.info("export_validated", filepath=str(filepath))
 
-        except (OSError, json.JSONDecodeError) as e:
+        except (OSError, ValueError) as e:
             logger.exception("export_validation_failed", filepath=str(filepath), error=str(e))
             return False
         else:
@@ -369,6 +896,9 @@ class JSONExporter:
     def get_export_stats(self, filepath: Path) -> dict[str, Any]:
         """Get statistics about an exported JSON file.
 
+        Only the leading ``metadata`` object is decoded; the whole file is
+        parsed only when metadata is not found at the start.
+
         Args:
             filepath: Path to JSON file
 
@@ -383,21 +913,23 @@ class JSONExporter:
             2
         """
         try:
-            with filepath.open(encoding="utf-8") as f:
-                data = json.load(f)
+            file_size = filepath.stat().st_size
+            metadata = _read_metadata_header(filepath)
+            if metadata is None:
+                metadata = orjson.loads(_read_export(filepath)).get("metadata", {})
 
             stats = {
                 "filepath": str(filepath),
-                "file_size_bytes": filepath.stat().st_size,
-                "file_size_mb": round(filepath.stat().st_size / (1024 * 1024), 2),
-                "export_date": data.get("metadata", {}).get("export_date"),
-                "total_parts": data.get("metadata", {}).get("total_parts", 0),
-                "version": data.get("metadata", {}).get("version"),
+                "file_size_bytes": file_size,
+                "file_size_mb": round(file_size / (1024 * 1024), 2),
+                "export_date": metadata.get("export_date"),
+                "total_parts": metadata.get("total_parts", 0),
+                "version": metadata.get("version"),
             }
 
             logger.info("export_stats_generated", **stats)
 
-        except (OSError, json.JSONDecodeError) as e:
+        except (OSError, orjson.JSONDecodeError) as e:
             logger.exception("stats_generation_failed", filepath=str(filepath), error=str(e))
             return {"error": str(e)}
         else:
@@ -437,6 +969,7 @@ class JSONExporter:
             >>> exporter.export_parts_incremental(batch3, "parts.json", append=True)
         """
         output_path = self.output_dir / filename
+        now_iso = datetime.now(UTC).isoformat()
 
         if append and not output_path.exists():
             msg = f"Cannot append to non-existent file: {output_path}"
@@ -445,8 +978,7 @@ class JSONExporter:
         try:
             if append:
                 # Load existing data
-                with output_path.open(encoding="utf-8") as f:
-                    existing_data = json.load(f)
+                existing_data = orjson.loads(_read_export(output_path))
 
                 # Validate existing structure
                 if "parts" not in existing_data:
@@ -460,7 +992,7 @@ class JSONExporter:
                 existing_data["parts"] = list(existing_by_sku.values())
 
                 # Update metadata
-                existing_data["metadata"]["export_date"] = datetime.now(UTC).isoformat()
+                existing_data["metadata"]["export_date"] = now_iso
                 existing_data["metadata"]["total_parts"] = len(existing_data["parts"])
 
                 export_data = existing_data
@@ -472,10 +1004,10 @@ class JSONExporter:
                 )
             else:
                 # Create new export
-                parts_data = [self._part_to_dict(part) for part in parts]
+                parts_data = PART_LIST_ADAPTER.dump_python(parts, mode="json")
                 export_data = {
                     "metadata": {
-                        "export_date": datetime.now(UTC).isoformat(),
+                        "export_date": now_iso,
                         "total_parts": len(parts),
                         "version": "1.0",
                     },
@@ -484,11 +1016,7 @@ class JSONExporter:
                 logger.info("creating_new_export", filename=filename, count=len(parts))
 
             # Write to file
-            with output_path.open("w", encoding="utf-8") as f:
-                if pretty:
-                    json.dump(export_data, f, indent=2, ensure_ascii=False)
-                else:
-                    json.dump(export_data, f, ensure_ascii=False)
+            _write_atomic(output_path, _dumps(export_data, pretty))
 
             logger.info(
                 "incremental_export_complete",
@@ -497,7 +1025,7 @@ class JSONExporter:
                 path=str(output_path),
             )
 
-        except (OSError, json.JSONDecodeError) as e:
+        except (OSError, orjson.JSONDecodeError) as e:
             logger.exception("incremental_export_failed", filename=filename, error=str(e))
             msg = f"Failed to export parts incrementally: {e}"
             raise OSError(msg) from e
@@ -527,6 +1055,7 @@ class JSONExporter:
             ValueError: If append=True but file doesn't exist or is invalid
         """
         output_path = self.output_dir / filename
+        now_iso = datetime.now(UTC).isoformat()
 
         if append and not output_path.exists():
             msg = f"Cannot append to non-existent file: {output_path}"
@@ -535,8 +1064,7 @@ class JSONExporter:
         try:
             if append:
                 # Load existing data
-                with output_path.open(encoding="utf-8") as f:
-                    existing_data = json.load(f)
+                existing_data = orjson.loads(_read_export(output_path))
 
                 # Validate existing structure
                 if "compatibility" not in existing_data:
@@ -550,7 +1078,7 @@ class JSONExporter:
                 existing_data["compatibility"] = list(existing_by_sku.values())
 
                 # Update metadata
-                existing_data["metadata"]["export_date"] = datetime.now(UTC).isoformat()
+                existing_data["metadata"]["export_date"] = now_iso
                 existing_data["metadata"]["total_mappings"] = len(existing_data["compatibility"])
 
                 export_data = existing_data
@@ -562,10 +1090,10 @@ class JSONExporter:
                 )
             else:
                 # Create new export
-                compat_data = [self._compatibility_to_dict(comp) for comp in compatibility]
+                compat_data = COMPATIBILITY_LIST_ADAPTER.dump_python(compatibility, mode="json")
                 export_data = {
                     "metadata": {
-                        "export_date": datetime.now(UTC).isoformat(),
+                        "export_date": now_iso,
                         "total_mappings": len(compatibility),
                         "version": "1.0",
                     },
@@ -576,11 +1104,7 @@ class JSONExporter:
                 )
 
             # Write to file
-            with output_path.open("w", encoding="utf-8") as f:
-                if pretty:
-                    json.dump(export_data, f, indent=2, ensure_ascii=False)
-                else:
-                    json.dump(export_data, f, ensure_ascii=False)
+            _write_atomic(output_path, _dumps(export_data, pretty))
 
             logger.info(
                 "incremental_compatibility_export_complete",
@@ -589,7 +1113,7 @@ class JSONExporter:
                 path=str(output_path),
             )
 
-        except (OSError, json.JSONDecodeError) as e:
+        except (OSError, orjson.JSONDecodeError) as e:
             logger.exception(
                 "incremental_compatibility_export_failed", filename=filename, error=str(e)
             )
@@ -597,3 +1121,200 @@ class JSONExporter:
             raise OSError(msg) from e
         else:
             return output_path
+
+    def export_parts_jsonl(self, parts: list[Part], filename: str = "parts.jsonl") -> Path:
+        """Append parts to a JSON Lines export.
+
+        Each part is written as one line, so appending a batch costs only the
+        new records instead of rewriting the whole file. Counts and the last
+        export date live in a ``<filename>.meta.json`` sidecar.
+
+        Args:
+            parts: List of Part instances to append
+            filename: Output filename (default: "parts.jsonl")
+
+        Returns:
+            Path to the JSON Lines file
+
+        Raises:
+            IOError: If export fails
+            ValueError: If the file already holds a different record type
+
+        Example:
+            >>> exporter = JSONExporter()
+            >>> exporter.export_parts_jsonl(batch1)
+            >>> exporter.export_parts_jsonl(batch2)
+            >>> exporter.jsonl_to_json(exporter.output_dir / "parts.jsonl")
+        """
+        records = PART_LIST_ADAPTER.dump_python(parts, mode="json")
+        return self._append_jsonl(records, "parts", filename)
+
+    def export_compatibility_jsonl(
+        self,
+        compatibility: list[VehicleCompatibility],
+        filename: str = "compatibility.jsonl",
+    ) -> Path:
+        """Append compatibility mappings to a JSON Lines export.
+
+        Args:
+            compatibility: List of VehicleCompatibility instances to append
+            filename: Output filename (default: "compatibility.jsonl")
+
+        Returns:
+            Path to the JSON Lines file
+
+        Raises:
+            IOError: If export fails
+            ValueError: If the file already holds a different record type
+        """
+        records = COMPATIBILITY_LIST_ADAPTER.dump_python(compatibility, mode="json")
+        return self._append_jsonl(records, "compatibility", filename)
+
+    def jsonl_to_json(
+        self,
+        jsonl_path: Path,
+        filename: str | None = None,
+        pretty: bool = True,
+    ) -> Path:
+        """Convert a JSON Lines export into the standard JSON export format.
+
+        Records are deduplicated by SKU (last-write-wins), matching the
+        behavior of the append-mode incremental exports.
+
+        Args:
+            jsonl_path: Path to a file written by export_parts_jsonl or
+                export_compatibility_jsonl
+            filename: Output filename (default: jsonl_path stem + ".json")
+            pretty: Whether to pretty-print JSON (default: True)
+
+        Returns:
+            Path to created JSON file
+
+        Raises:
+            IOError: If conversion fails
+            ValueError: If the sidecar metadata is missing or unrecognized
+        """
+        filename = filename or f"{jsonl_path.stem}.json"
+        output_path = self.output_dir / filename
+        now_iso = datetime.now(UTC).isoformat()
+        meta_path = _jsonl_meta_path(jsonl_path)
+
+        if not meta_path.exists():
+            msg = f"Missing JSON Lines metadata: {meta_path}"
+            raise ValueError(msg)
+
+        try:
+            meta = orjson.loads(meta_path.read_bytes())
+            record_type = meta.get("record_type")
+            if record_type not in _JSONL_RECORD_TYPES:
+                msg = f"Unknown JSON Lines record type in {meta_path}: {record_type!r}"
+                raise ValueError(msg)
+            key_field, count_field, list_key = _JSONL_RECORD_TYPES[record_type]
+
+            records_by_key: dict[str, dict[str, Any]] = {}
+            with jsonl_path.open("rb") as f:
+                for line in f:
+                    if line.strip():
+                        record = orjson.loads(line)
+                        records_by_key[record[key_field]] = record
+
+            export_data = {
+                "metadata": {
+                    "export_date": now_iso,
+                    count_field: len(records_by_key),
+                    "version": "1.0",
+                },
+                list_key: list(records_by_key.values()),
+            }
+            _write_atomic(output_path, _dumps(export_data, pretty))
+
+            logger.info(
+                "jsonl_converted",
+                source=str(jsonl_path),
+                path=str(output_path),
+                count=len(records_by_key),
+            )
+
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.exception("jsonl_conversion_failed", source=str(jsonl_path), error=str(e))
+            msg = f"Failed to convert JSON Lines export: {e}"
+            raise OSError(msg) from e
+        else:
+            return output_path
+
+    def remove_jsonl(self, filename: str) -> None:
+        """Delete a JSON Lines export and its sidecar metadata, if present.
+
+        Args:
+            filename: JSON Lines filename (e.g. "parts.jsonl")
+        """
+        output_path = self.output_dir / filename
+        output_path.unlink(missing_ok=True)
+        _jsonl_meta_path(output_path).unlink(missing_ok=True)
+        logger.debug("jsonl_removed", path=str(output_path))
+
+    def _append_jsonl(
+        self,
+        records: list[dict[str, Any]],
+        record_type: str,
+        filename: str,
+    ) -> Path:
+        """Append records to a JSON Lines file and update its sidecar metadata.
+
+        Args:
+            records: JSON-ready dicts to append, one per line
+            record_type: Record type key from _JSONL_RECORD_TYPES
+            filename: Output filename
+
+        Returns:
+            Path to the JSON Lines file
+
+        Raises:
+            IOError: If export fails
+            ValueError: If the file already holds a different record type
+        """
+        output_path = self.output_dir / filename
+        now_iso = datetime.now(UTC).isoformat()
+        meta_path = _jsonl_meta_path(output_path)
+
+        try:
+            total_records = 0
+            if meta_path.exists():
+                meta = orjson.loads(meta_path.read_bytes())
+                if meta.get("record_type") != record_type:
+                    msg = (
+                        f"Cannot append {record_type} to {filename}: "
+                        f"it contains {meta.get('record_type')!r} records"
+                    )
+                    raise ValueError(msg)
+                total_records = meta.get("total_records", 0)
+
+            with output_path.open("ab") as f:
+                f.writelines(
+                    orjson.dumps(record, default=_orjson_default, option=orjson.OPT_APPEND_NEWLINE)
+                    for record in records
+                )
+
+            total_records += len(records)
+            meta = {
+                "record_type": record_type,
+                "export_date": now_iso,
+                "total_records": total_records,
+                "version": "1.0",
+            }
+            _write_atomic(meta_path, _dumps(meta, pretty=True))
+
+            logger.info(
+                "jsonl_appended",
+                filename=filename,
+                new_count=len(records),
+                total_count=total_records,
+                path=str(output_path),
+            )
+
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.exception("jsonl_export_failed", filename=filename, error=str(e))
+            msg = f"Failed to append {record_type} to JSON Lines export: {e}"
+            raise OSError(msg) from e
+        else:
+            return output_path
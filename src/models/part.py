@@ -4,11 +4,12 @@ This module defines the Pydantic models for automotive parts data.
 All models are immutable (frozen) to ensure data integrity.
 """
 
+import sys
 from datetime import UTC, datetime
 from decimal import Decimal
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
 from src.models.validators import normalize_text, validate_csf_sku
 
@@ -48,6 +49,19 @@ class ReferenceNumber(BaseModel):
         "str_strip_whitespace": True,
     }
 
+    @field_validator("reference_type")
+    @classmethod
+    def intern_reference_type(cls, v: str) -> str:
+        """Share one string per reference type.
+
+        Args:
+            v: Reference type
+
+        Returns:
+            Interned reference type (a handful of values across every part)
+        """
+        return sys.intern(v)
+
 
 class Part(BaseModel):
     """Automotive part model.
@@ -142,14 +156,27 @@ class Part(BaseModel):
             v: Category name
 
         Returns:
-            Title-cased category
+            Title-cased category, interned since a few dozen categories are
+            shared by every part
         """
-        return normalize_text(v)
+        return sys.intern(normalize_text(v))
+
+    @field_validator("manufacturer")
+    @classmethod
+    def intern_manufacturer(cls, v: str) -> str:
+        """Share one string per manufacturer name.
+
+        Args:
+            v: Manufacturer name
+
+        Returns:
+            Interned manufacturer name
+        """
+        return sys.intern(v)
 
     model_config = {
-        "frozen": True,  # Immutable
+        "frozen": True,  # Immutable, so there is no assignment to validate
         "str_strip_whitespace": True,
-        "validate_assignment": True,
     }
 
     def get_primary_image(self) -> PartImage | None:
@@ -168,3 +195,16 @@ class Part(BaseModel):
 
         # Return first image if no primary set
         return self.images[0]
+
+
+# Bulk serializer for part lists; reuses one compiled core schema per call
+# instead of dispatching model_dump() on every instance.
+PART_LIST_ADAPTER: TypeAdapter[list[Part]] = TypeAdapter(list[Part])
+
+# Validators for the nested lists detail-page enrichment replaces, so an
+# enriched Part can be built with model_copy() instead of re-validating
+# every field of the original.
+PART_IMAGE_LIST_ADAPTER: TypeAdapter[list[PartImage]] = TypeAdapter(list[PartImage])
+REFERENCE_NUMBER_LIST_ADAPTER: TypeAdapter[list[ReferenceNumber]] = TypeAdapter(
+    list[ReferenceNumber]
+)
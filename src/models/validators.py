@@ -4,6 +4,8 @@ This module provides reusable validation functions to eliminate duplication
 across model definitions and ensure consistent validation logic.
 """
 
+import sys
+
 
 def validate_csf_sku(sku: str) -> str:
     """Validate and normalize CSF part SKU format.
@@ -12,7 +14,8 @@ def validate_csf_sku(sku: str) -> str:
         sku: Part SKU string to validate
 
     Returns:
-        Normalized SKU (uppercase, stripped whitespace)
+        Normalized SKU (uppercase, stripped whitespace), interned so every
+        part with the same SKU shares one string object
 
     Raises:
         ValueError: If SKU doesn't start with 'CSF-'
@@ -25,11 +28,18 @@ def validate_csf_sku(sku: str) -> str:
         >>> validate_csf_sku("INVALID")
         ValueError: SKU must start with 'CSF-'
     """
-    normalized = sku.upper().strip()
+    normalized = sku.strip()
+    # Scraped SKUs are almost always already uppercase; isupper() scans without
+    # allocating, so the upper() copy is only made when something needs changing
+    if not normalized.isupper():
+        normalized = normalized.upper()
     if not normalized.startswith("CSF-"):
         msg = "SKU must start with 'CSF-'"
         raise ValueError(msg)
-    return normalized
+    # The same SKU is parsed once per compatible vehicle and keys several
+    # dicts (unique_parts, vehicle_compat, ...); interning makes those lookups
+    # identity-first and keeps one copy of each SKU in memory
+    return sys.intern(normalized)
 
 
 def normalize_text(text: str) -> str:
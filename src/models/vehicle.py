@@ -4,11 +4,17 @@ This module defines models for vehicles and part compatibility mappings.
 """
 
 from datetime import UTC, datetime
+from typing import Any, Self, cast
+from weakref import WeakValueDictionary
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, TypeAdapter, field_validator
 
 from src.models.validators import normalize_text, validate_csf_sku
 
+# Canonical Vehicle per field tuple, for Vehicle.intern(). Entries drop out
+# once no compatibility list holds the instance any more.
+_VEHICLE_INTERN: WeakValueDictionary[tuple[Any, ...], "Vehicle"] = WeakValueDictionary()
+
 
 class Vehicle(BaseModel):
     """Vehicle model.
@@ -89,6 +95,55 @@ class Vehicle(BaseModel):
             return f"{base} {self.submodel}"
         return base
 
+    def _key(self) -> tuple[Any, ...]:
+        """Get the tuple of all field values.
+
+        Returns:
+            Field values, with ``qualifiers`` as a tuple so the key is hashable
+        """
+        return (
+            self.make,
+            self.model,
+            self.year,
+            self.submodel,
+            self.engine,
+            self.fuel_type,
+            self.aspiration,
+            tuple(self.qualifiers),
+        )
+
+    def __hash__(self) -> int:
+        """Hash over all fields, consistent with field-wise equality.
+
+        Pydantic's frozen hash fails on the ``qualifiers`` list, so it is
+        hashed as a tuple here.
+
+        Returns:
+            Hash value
+        """
+        return hash(self._key())
+
+    @classmethod
+    def intern(cls, **kwargs: Any) -> Self:  # noqa: ANN401
+        """Create a Vehicle, reusing an existing equal instance if one is alive.
+
+        Preferred over the constructor when building many compatibility
+        lists: a scrape repeats the same vehicles across thousands of parts,
+        and sharing one instance per vehicle keeps memory proportional to
+        the number of distinct vehicles.
+
+        Args:
+            **kwargs: Vehicle field values, as for the constructor
+
+        Returns:
+            The canonical Vehicle for these (validated) field values
+
+        Raises:
+            ValidationError: If the field values are invalid
+        """
+        vehicle = cls(**kwargs)
+        return cast("Self", _VEHICLE_INTERN.setdefault(vehicle._key(), vehicle))
+
 
 class VehicleCompatibility(BaseModel):
     """Part-to-vehicle compatibility mapping.
@@ -109,6 +164,11 @@ class VehicleCompatibility(BaseModel):
         description="Timestamp when compatibility data was scraped",
     )
 
+    # Lookups for is_compatible_with() and get_year_range(), built once since
+    # the model is frozen
+    _vehicle_set: frozenset[Vehicle] = PrivateAttr(default=frozenset())
+    _year_range: tuple[int, int] | None = PrivateAttr(default=None)
+
     @field_validator("part_sku")
     @classmethod
     def validate_sku(cls, v: str) -> str:
@@ -130,6 +190,24 @@ class VehicleCompatibility(BaseModel):
         "str_strip_whitespace": True,
     }
 
+    def model_post_init(self, context: Any, /) -> None:  # noqa: ANN401, ARG002
+        """Build cached lookups after validation.
+
+        Args:
+            context: Pydantic validation context (unused)
+        """
+        self._vehicle_set = frozenset(self.vehicles)
+
+        if self.vehicles:
+            low = high = self.vehicles[0].year
+            for vehicle in self.vehicles:
+                year = vehicle.year
+                if year < low:
+                    low = year
+                elif year > high:
+                    high = year
+            self._year_range = (low, high)
+
     def get_year_range(self) -> tuple[int, int] | None:
         """Get the year range of compatible vehicles.
 
@@ -139,8 +217,7 @@ class VehicleCompatibility(BaseModel):
         if not self.vehicles:
             return None
 
-        years = [v.year for v in self.vehicles]
-        return min(years), max(years)
+        return self._year_range
 
     def is_compatible_with(self, vehicle: Vehicle) -> bool:
         """Check if a vehicle is in the compatibility list.
@@ -151,4 +228,10 @@ class VehicleCompatibility(BaseModel):
         Returns:
             True if vehicle is compatible
         """
-        return vehicle in self.vehicles
+        return vehicle in self._vehicle_set
+
+
+# Bulk serializer for compatibility lists (see PART_LIST_ADAPTER).
+COMPATIBILITY_LIST_ADAPTER: TypeAdapter[list[VehicleCompatibility]] = TypeAdapter(
+    list[VehicleCompatibility]
+)
@@ -4,14 +4,70 @@ This module provides parsing functionality for CSF website AJAX responses,
 which return jQuery-wrapped HTML in JavaScript format instead of JSON.
 """
 
+import importlib
+import logging
 import re
+from functools import cache
+from html import unescape
+from types import ModuleType
 from typing import Final
 
 import structlog
-from bs4 import BeautifulSoup
+
+re2: ModuleType | None
+try:
+    re2 = importlib.import_module("re2")
+except ImportError:  # optional: parse() falls back to the stdlib pattern
+    re2 = None
 
 logger = structlog.get_logger()
 
+# RE2 compiles to an automaton, so .html() extraction stays linear on any
+# response. RE2 has no possessive quantifiers, and needs none.
+_RE2_HTML_PATTERN: Final = (
+    re2.compile(r'(?s)\.html\("((?:[^"\\]|\\.)+)"\)') if re2 is not None else None
+)
+_RE2_HTML_BYTES_PATTERN: Final = (
+    re2.compile(rb'(?s)\.html\("((?:[^"\\]|\\.)+)"\)') if re2 is not None else None
+)
+
+# Dropdown responses are flat lists of <a href="...">text</a> links, so one
+# regex scan replaces building a DOM. Groups: quote, href, trailing numeric
+# ID of the href (None when the last path segment is not an integer), inner HTML.
+_LINK_TEMPLATE: Final = (
+    r"""<a\b[^>]*?\shref=(["'])([^"']*?{}[^"']*?(?:(?<=/)([0-9]+))?)\1[^>]*>(.*?)</a>"""
+)
+_TAG_PATTERN: Final[re.Pattern[str]] = re.compile(r"<[^>]*>")
+
+
+@cache
+def _link_pattern(href_pattern: str) -> re.Pattern[str]:
+    """Compile (once per href pattern) the regex matching dropdown links.
+
+    Args:
+        href_pattern: Substring the link href must contain
+
+    Returns:
+        Compiled link regex
+    """
+    return re.compile(_LINK_TEMPLATE.format(re.escape(href_pattern)), re.IGNORECASE | re.DOTALL)
+
+
+def _link_text(inner_html: str) -> str:
+    """Convert a link's inner HTML to stripped plain text.
+
+    Args:
+        inner_html: Markup between <a ...> and </a>
+
+    Returns:
+        Text content with tags removed and entities decoded
+    """
+    if "<" in inner_html:
+        inner_html = _TAG_PATTERN.sub("", inner_html)
+    if "&" in inner_html:
+        inner_html = unescape(inner_html)
+    return inner_html.strip()
+
 
 class AJAXParsingError(Exception):
     """Raised when AJAX response parsing fails."""
@@ -30,17 +86,32 @@ class AJAXResponseParser:
     The parser extracts the HTML string from the .html("...") call and
     handles JavaScript string escaping (quotes and slashes).
 
+    Responses may be passed as raw bytes (``response.content``): the search
+    then runs on the bytes and only the extracted HTML is decoded as UTF-8,
+    skipping a decode of the whole body.
+
     Attributes:
         HTML_PATTERN: Compiled regex pattern for matching .html("...") calls.
+        UNESCAPE_PATTERN: Compiled regex pattern for JavaScript-escaped quotes and slashes.
+        HTML_BYTES_PATTERN: HTML_PATTERN for raw response bytes.
+        UNESCAPE_BYTES_PATTERN: UNESCAPE_PATTERN for raw response bytes.
     """
 
-    HTML_PATTERN: Final[re.Pattern[str]] = re.compile(r'\.html\("(.+?)"\)')
+    # The possessive escape-aware body cannot re-scan text it has consumed, so
+    # input missing the closing '")' fails in linear time
+    HTML_PATTERN: Final[re.Pattern[str]] = re.compile(r'\.html\("((?:[^"\\]|\\.)++)"\)', re.DOTALL)
+    UNESCAPE_PATTERN: Final[re.Pattern[str]] = re.compile(r'\\(["/])')
+    HTML_BYTES_PATTERN: Final[re.Pattern[bytes]] = re.compile(
+        rb'\.html\("((?:[^"\\]|\\.)++)"\)', re.DOTALL
+    )
+    UNESCAPE_BYTES_PATTERN: Final[re.Pattern[bytes]] = re.compile(rb'\\(["/])')
 
-    def parse(self, js_code: str) -> str:
+    def parse(self, js_code: str | bytes) -> str:
         r"""Extract HTML from JavaScript AJAX response.
 
         Args:
-            js_code: JavaScript code from AJAX response containing .html() call.
+            js_code: JavaScript code from AJAX response containing .html() call,
+                as text or as raw UTF-8 bytes.
 
         Returns:
             Extracted and unescaped HTML string.
@@ -58,9 +129,9 @@ class AJAXResponseParser:
             >>> parser.parse(js)
             '<a href="/path">Link</a>'
         """
-        match = self.HTML_PATTERN.search(js_code)
+        html = self._search_html(js_code)
 
-        if not match:
+        if html is None:
             logger.warning(
                 "ajax_parse_failed",
                 reason="no_html_call_found",
@@ -69,6 +140,24 @@ class AJAXResponseParser:
             msg = "No .html() call found in JavaScript response"
             raise AJAXParsingError(msg)
 
+        return html
+
+    def _search_html(self, js_code: str | bytes) -> str | None:
+        """Find and unescape the .html() string, shared by parse() and try_parse().
+
+        Args:
+            js_code: JavaScript code from AJAX response, as text or UTF-8 bytes.
+
+        Returns:
+            Extracted and unescaped HTML string, or None if no .html() call found.
+        """
+        if isinstance(js_code, bytes):
+            return self._search_html_bytes(js_code)
+
+        match = (_RE2_HTML_PATTERN or self.HTML_PATTERN).search(js_code)
+        if not match:
+            return None
+
         # Extract HTML from regex group
         html = match.group(1)
 
@@ -76,24 +165,55 @@ class AJAXResponseParser:
         # Common escapes in JavaScript strings:
         # - \\" → "  (escaped double quotes)
         # - \\/ → /  (escaped forward slashes)
-        html = html.replace('\\"', '"').replace("\\/", "/")
+        # Both are handled in a single pass, skipped when nothing is escaped
+        if "\\" in html:
+            html = self.UNESCAPE_PATTERN.sub(r"\1", html)
+
+        # Checked per call: the CLI can change the log level after import
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "ajax_parsed",
+                original_length=len(js_code),
+                html_length=len(html),
+            )
 
-        logger.debug(
-            "ajax_parsed",
-            original_length=len(js_code),
-            html_length=len(html),
-        )
+        return html
+
+    def _search_html_bytes(self, js_code: bytes) -> str | None:
+        """Bytes variant of _search_html(): decode only the extracted HTML.
+
+        Args:
+            js_code: Raw UTF-8 bytes of the AJAX response.
+
+        Returns:
+            Extracted and unescaped HTML string, or None if no .html() call found.
+        """
+        match = (_RE2_HTML_BYTES_PATTERN or self.HTML_BYTES_PATTERN).search(js_code)
+        if not match:
+            return None
+
+        raw = match.group(1)
+        if b"\\" in raw:
+            raw = self.UNESCAPE_BYTES_PATTERN.sub(rb"\1", raw)
+        html = raw.decode("utf-8", errors="replace")
+
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "ajax_parsed",
+                original_length=len(js_code),
+                html_length=len(html),
+            )
 
         return html
 
-    def try_parse(self, js_code: str) -> str | None:
+    def try_parse(self, js_code: str | bytes) -> str | None:
         """Attempt to extract HTML, returning None on failure.
 
         This is a non-throwing variant of parse() that returns None
         instead of raising AJAXParsingError when parsing fails.
 
         Args:
-            js_code: JavaScript code from AJAX response.
+            js_code: JavaScript code from AJAX response, as text or UTF-8 bytes.
 
         Returns:
             Extracted HTML string if successful, None if parsing fails.
@@ -108,13 +228,10 @@ class AJAXResponseParser:
             >>> parser.try_parse(invalid_js) is None
             True
         """
-        try:
-            return self.parse(js_code)
-        except AJAXParsingError:
-            return None
+        return self._search_html(js_code)
 
     def _parse_dropdown_response(
-        self, js_code: str, href_pattern: str, log_type: str
+        self, js_code: str | bytes, href_pattern: str, log_type: str
     ) -> dict[int, str]:
         """Parse dropdown AJAX response (DRY helper).
 
@@ -130,27 +247,20 @@ class AJAXResponseParser:
             Dict mapping ID to text content
         """
         html = self.parse(js_code)
-        soup = BeautifulSoup(html, "html.parser")
 
         results = {}
-        for link in soup.find_all("a", href=True):
-            href = link["href"]
-            # BeautifulSoup can return str or AttributeValueList, ensure string
-            href_str = str(href) if not isinstance(href, str) else href
-            if href_pattern in href_str:
-                id_str = href_str.split("/")[-1]
-                try:
-                    option_id = int(id_str)
-                    text = link.get_text(strip=True)
-                    results[option_id] = text
-                except ValueError:
-                    logger.warning("invalid_%s", log_type, href=href, id_str=id_str)
-                    continue
+        for match in _link_pattern(href_pattern).finditer(html):
+            id_str = match.group(3)
+            if id_str is None:
+                href = match.group(2)
+                logger.warning("invalid_%s", log_type, href=href, id_str=href.rsplit("/", 1)[-1])
+                continue
+            results[int(id_str)] = _link_text(match.group(4))
 
         logger.debug("%s_parsed", log_type, count=len(results))
         return results
 
-    def parse_year_response(self, js_code: str) -> dict[int, str]:
+    def parse_year_response(self, js_code: str | bytes) -> dict[int, str]:
         r"""Parse year dropdown AJAX response.
 
         Extracts year options from the jQuery response. The HTML contains links like:
@@ -171,7 +281,7 @@ class AJAXResponseParser:
         """
         return self._parse_dropdown_response(js_code, "get_model_by_make_year", "years")
 
-    def parse_model_response(self, js_code: str) -> dict[int, str]:
+    def parse_model_response(self, js_code: str | bytes) -> dict[int, str]:
         r"""Parse model dropdown AJAX response.
 
         Extracts model options from the jQuery response. The HTML contains links like:
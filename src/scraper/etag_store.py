@@ -12,6 +12,7 @@ Storage format (JSON):
 import json
 from pathlib import Path
 
+import orjson
 import structlog
 
 logger = structlog.get_logger()
@@ -70,8 +71,8 @@ class ETagStore:
     def save(self) -> None:
         """Persist current data to disk."""
         self.store_path.parent.mkdir(parents=True, exist_ok=True)
-        with self.store_path.open("w") as f:
-            json.dump(self._data, f, indent=2)
+        # Same bytes as json.dump(indent=2) for these ASCII URL/hash pairs
+        self.store_path.write_bytes(orjson.dumps(self._data, option=orjson.OPT_INDENT_2))
 
         logger.debug(
             "etag_store_saved",
@@ -3,31 +3,105 @@
 This module implements respectful web scraping with:
 - Rate limiting (0.3-0.8s for HTTP, 1-3s for browser fetches)
 - Polite user-agent
-- Exponential backoff on errors
+- Jittered exponential backoff on errors
 - Request timeout
-- Persistent browser for efficiency (with resource blocking)
+- Persistent browser for efficiency (with resource blocking), kept on its
+  own thread so it survives asyncio.run() calls between browser fetches
+- Browser session cookies shared with the HTTP client after the first
+  browser fetch, so follow-up requests need no browser
 - Smart retry (skip non-retryable HTTP errors like 404)
 - Lightweight content-hash checks for change detection
+- Optional on-disk HTTP cache (hishel) for the hierarchy dropdown batches
+- Optional uvloop event loop for the async batch methods (run_async)
 """
 
 import asyncio
 import hashlib
+import importlib
 import random
 import re
 import time
-from typing import Final
+from collections import defaultdict
+from collections.abc import Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from time import monotonic
+from types import ModuleType
+from typing import Any, Final
+from urllib.parse import urlsplit
 
 import httpx
 import structlog
+from playwright.async_api import BrowserContext as AsyncBrowserContext
+from playwright.async_api import Route, async_playwright
 from playwright.sync_api import Browser, BrowserContext, Playwright, sync_playwright
-from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
+from tenacity import (
+    AsyncRetrying,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+uvloop: ModuleType | None
+try:
+    uvloop = importlib.import_module("uvloop")
+except ImportError:  # optional: run_async() falls back to asyncio's default loop
+    uvloop = None
 
 logger = structlog.get_logger()
 
+# Nearly all traffic goes to one host, so keep a generous pool of warm
+# connections alive between requests (HTTP/2 also multiplexes over each)
+_HTTP_LIMITS: Final = httpx.Limits(
+    max_keepalive_connections=50, max_connections=50, keepalive_expiry=60.0
+)
+
+# Rate-limit jitter is drawn from a precomputed ring of unit samples; a
+# power-of-two size lets the index wrap with a mask
+_JITTER_RING_SIZE: Final[int] = 1024
+
 # Browser retry constants
 BROWSER_MAX_RETRIES: Final[int] = 3
 BROWSER_BACKOFF_BASE: Final[int] = 2
 
+# The parser only needs the HTML structure, so browsers skip everything else
+_BLOCKED_RESOURCES: Final[str] = "**/*.{png,jpg,jpeg,gif,svg,ico,woff,woff2,ttf,eot,css}"
+
+
+def _hishel() -> ModuleType:
+    """Import the optional ``hishel`` package.
+
+    Returns:
+        The hishel module
+
+    Raises:
+        ImportError: If hishel is not installed
+    """
+    try:
+        return importlib.import_module("hishel")
+    except ImportError as e:
+        msg = "The HTTP cache requires the 'hishel' package (install the 'cache' extra)"
+        raise ImportError(msg) from e
+
+
+def run_async[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on a fresh event loop.
+
+    Drop-in for ``asyncio.run()`` used by callers of the async batch methods.
+    Uses uvloop's libuv-based loop when the ``uvloop`` extra is installed,
+    which schedules tasks and handles socket I/O with less per-task overhead.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    if uvloop is None:
+        return asyncio.run(coro)
+    return asyncio.run(coro, loop_factory=uvloop.new_event_loop)
+
 
 def _is_retryable_http_error(exception: BaseException) -> bool:
     """Determine if an HTTP error should be retried.
@@ -103,19 +177,90 @@ class RespectfulFetcher:
     MAX_RETRIES: Final[int] = 3
     TIMEOUT_SECONDS: Final[int] = 30
 
-    def __init__(self) -> None:
-        """Initialize fetcher with HTTP client and lazy browser fields."""
-        self.client = httpx.Client(
-            headers={"User-Agent": self.USER_AGENT},
-            timeout=self.TIMEOUT_SECONDS,
-            follow_redirects=True,
-        )
-        self._last_request_time: float = 0
+    # Retry policy shared by fetch() and async_fetch_all(); the strategy
+    # objects are stateless, so they are built once here. Backoff is drawn
+    # at random up to the exponential bound, so fetchers rate-limited at
+    # the same moment do not all retry in lockstep.
+    _RETRY_WAIT: Final = wait_random_exponential(multiplier=1, min=4, max=60)
+    _RETRY_STOP: Final = stop_after_attempt(MAX_RETRIES)
+    _RETRY_IF: Final = retry_if_exception(_is_retryable_http_error)
+
+    def __init__(
+        self,
+        cache_dir: Path | str | None = None,
+        cache_ttl: float | None = None,
+    ) -> None:
+        """Initialize fetcher with HTTP client and lazy browser fields.
+
+        Args:
+            cache_dir: Directory for an on-disk HTTP cache used by
+                ``async_fetch_all(..., cached=True)``. Every other request
+                goes to the network. None (default) disables caching.
+            cache_ttl: Seconds a cached response is served without contacting
+                the server. None (default) honours the server's cache headers
+                instead, revalidating stale entries with conditional GETs.
+
+        Raises:
+            ImportError: If cache_dir is set but hishel is not installed
+        """
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._cache_ttl = cache_ttl
+        if self._cache_dir is not None:
+            _hishel()  # fail at construction, not on the first cached batch
+            logger.debug("http_cache_enabled", cache_dir=str(cache_dir), ttl=cache_ttl)
+        self.client = httpx.Client(**self._client_options())
+        # Start time of the previous request; -inf lets the first one through
+        self._last_request_time: float = float("-inf")
+        rng = random.SystemRandom()
+        self._jitter_ring: list[float] = [rng.random() for _ in range(_JITTER_RING_SIZE)]
+        self._jitter_index = 0
 
         # Persistent browser lifecycle (lazy-initialized)
         self._playwright: Playwright | None = None
         self._browser: Browser | None = None
         self._browser_context: BrowserContext | None = None
+        self._cookies_warmed = False
+
+        # Playwright's sync API runs an event loop on the thread that started
+        # it. Driving it from one dedicated thread leaves the caller's thread
+        # free for asyncio.run(), so the browser need not be relaunched
+        # around async batches.
+        self._browser_thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="playwright")
+
+    def _client_options(self) -> dict[str, Any]:
+        """Build the settings shared by the sync client and async batch clients.
+
+        Returns:
+            Keyword arguments for httpx.Client / httpx.AsyncClient
+        """
+        return {
+            "headers": {"User-Agent": self.USER_AGENT},
+            "timeout": self.TIMEOUT_SECONDS,
+            "follow_redirects": True,
+            "http2": True,
+            "limits": _HTTP_LIMITS,
+        }
+
+    def _async_client(self, cached: bool = False) -> httpx.AsyncClient:
+        """Create an async client for a batch, sharing the sync client's cookies.
+
+        Args:
+            cached: Whether to serve responses from the on-disk HTTP cache,
+                if one is configured
+
+        Returns:
+            New httpx.AsyncClient (use as an async context manager)
+        """
+        if not cached or self._cache_dir is None:
+            return httpx.AsyncClient(**self._client_options(), cookies=self.client.cookies)
+        hishel = _hishel()
+        client: httpx.AsyncClient = hishel.AsyncCacheClient(
+            storage=hishel.AsyncFileStorage(base_path=self._cache_dir, ttl=self._cache_ttl),
+            controller=hishel.Controller(force_cache=self._cache_ttl is not None),
+            **self._client_options(),
+            cookies=self.client.cookies,
+        )
+        return client
 
     def _ensure_browser(self) -> tuple[Browser, BrowserContext]:
         """Lazily initialize persistent Playwright browser on first use.
@@ -135,16 +280,61 @@ class RespectfulFetcher:
             self._playwright = pw
             self._browser = pw.chromium.launch(headless=True)
             self._browser_context = self._browser.new_context(user_agent=self.USER_AGENT)
-            self._browser_context.route(
-                "**/*.{png,jpg,jpeg,gif,svg,ico,woff,woff2,ttf,eot,css}",
-                lambda route: route.abort(),
-            )
+            self._browser_context.route(_BLOCKED_RESOURCES, lambda route: route.abort())
             logger.info("browser_initialized")
 
         assert self._browser is not None  # noqa: S101
         assert self._browser_context is not None  # noqa: S101
         return self._browser, self._browser_context
 
+    def _share_browser_cookies(self, browser_context: BrowserContext) -> None:
+        """Copy the browser session's cookies into the HTTP client (browser thread).
+
+        Runs once, after the first successful page load: the session and
+        CSRF cookies it sets let plain HTTP requests stand in for later
+        browser fetches.
+
+        Args:
+            browser_context: Browser context holding the session cookies
+        """
+        cookies = browser_context.cookies()
+        for cookie in cookies:
+            self.client.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain", ""),
+                path=cookie.get("path", "/"),
+            )
+        self._cookies_warmed = True
+        logger.debug("browser_cookies_shared", count=len(cookies))
+
+    def warm_up(self, url: str) -> None:
+        """Load ``url`` once in the browser to seed the HTTP client's cookies.
+
+        Call before a run so that later fetch() calls carry the session
+        cookies without waiting for the first fetch_with_browser() fallback.
+        Does nothing once cookies have been shared.
+
+        Args:
+            url: Page that establishes the session (e.g. the homepage)
+        """
+        if not self._cookies_warmed:
+            self.fetch_with_browser(url)
+
+    def _jitter(self, low: float, high: float) -> float:
+        """Pick a random delay between ``low`` and ``high`` from the jitter ring.
+
+        Args:
+            low: Lower bound in seconds
+            high: Upper bound in seconds
+
+        Returns:
+            Delay in seconds
+        """
+        unit = self._jitter_ring[self._jitter_index & (_JITTER_RING_SIZE - 1)]
+        self._jitter_index += 1
+        return low + unit * (high - low)
+
     def _apply_rate_limit(self, *, browser: bool = False) -> None:
         """Apply rate limiting delay between requests.
 
@@ -158,27 +348,22 @@ class RespectfulFetcher:
         min_delay = self.BROWSER_MIN_DELAY_SECONDS if browser else self.MIN_DELAY_SECONDS
         max_delay = self.BROWSER_MAX_DELAY_SECONDS if browser else self.MAX_DELAY_SECONDS
 
-        if self._last_request_time > 0:
-            elapsed = time.time() - self._last_request_time
-
-            if elapsed < min_delay:
-                delay = random.uniform(min_delay - elapsed, max_delay)  # noqa: S311
-                logger.debug(
-                    "rate_limit_delay",
-                    delay=round(delay, 2),
-                    elapsed_since_last=round(elapsed, 2),
-                    mode="browser" if browser else "http",
-                )
-                time.sleep(delay)
+        # Requests start a random min-max gap apart: wait out whatever part
+        # of this request's gap has not already elapsed
+        now = monotonic()
+        delay = self._last_request_time + self._jitter(min_delay, max_delay) - now
+        if delay > 0:
+            logger.debug(
+                "rate_limit_delay",
+                delay=round(delay, 2),
+                elapsed_since_last=round(now - self._last_request_time, 2),
+                mode="browser" if browser else "http",
+            )
+            time.sleep(delay)
 
-        self._last_request_time = time.time()
+        self._last_request_time = now + max(delay, 0.0)
 
-    @retry(
-        wait=wait_exponential(multiplier=1, min=4, max=60),
-        stop=stop_after_attempt(MAX_RETRIES),
-        retry=retry_if_exception(_is_retryable_http_error),
-        reraise=True,
-    )
+    @retry(wait=_RETRY_WAIT, stop=_RETRY_STOP, retry=_RETRY_IF, reraise=True)
     def fetch(self, url: str) -> httpx.Response:
         """Fetch URL with rate limiting and retries.
 
@@ -341,19 +526,13 @@ class RespectfulFetcher:
         total = len(urls_and_hashes)
         count_lock = asyncio.Lock()
 
-        async with httpx.AsyncClient(
-            headers={"User-Agent": self.USER_AGENT},
-            timeout=self.TIMEOUT_SECONDS,
-            follow_redirects=True,
-        ) as async_client:
+        async with self._async_client() as async_client:
 
             async def _check_one(url: str, previous_hash: str | None) -> tuple[bool, str]:
                 nonlocal completed_count
 
                 async with semaphore:
-                    delay = random.uniform(  # noqa: S311
-                        self.MIN_DELAY_SECONDS, self.MAX_DELAY_SECONDS
-                    )
+                    delay = self._jitter(self.MIN_DELAY_SECONDS, self.MAX_DELAY_SECONDS)
                     await asyncio.sleep(delay)
 
                     try:
@@ -414,19 +593,13 @@ class RespectfulFetcher:
         total = len(urls)
         count_lock = asyncio.Lock()
 
-        async with httpx.AsyncClient(
-            headers={"User-Agent": self.USER_AGENT},
-            timeout=self.TIMEOUT_SECONDS,
-            follow_redirects=True,
-        ) as async_client:
+        async with self._async_client() as async_client:
 
             async def _fetch_one(url: str) -> str | None:
                 nonlocal completed_count
 
                 async with semaphore:
-                    delay = random.uniform(  # noqa: S311
-                        self.MIN_DELAY_SECONDS, self.MAX_DELAY_SECONDS
-                    )
+                    delay = self._jitter(self.MIN_DELAY_SECONDS, self.MAX_DELAY_SECONDS)
                     await asyncio.sleep(delay)
 
                     try:
@@ -487,19 +660,13 @@ class RespectfulFetcher:
         total = len(urls)
         count_lock = asyncio.Lock()
 
-        async with httpx.AsyncClient(
-            headers={"User-Agent": self.USER_AGENT},
-            timeout=self.TIMEOUT_SECONDS,
-            follow_redirects=True,
-        ) as async_client:
+        async with self._async_client() as async_client:
 
             async def _fetch_one(url: str) -> str | None:
                 nonlocal completed_count
 
                 async with semaphore:
-                    delay = random.uniform(  # noqa: S311
-                        self.MIN_DELAY_SECONDS, self.MAX_DELAY_SECONDS
-                    )
+                    delay = self._jitter(self.MIN_DELAY_SECONDS, self.MAX_DELAY_SECONDS)
                     await asyncio.sleep(delay)
 
                     try:
@@ -533,6 +700,78 @@ class RespectfulFetcher:
             tasks = [_fetch_one(url) for url in urls]
             return list(await asyncio.gather(*tasks))
 
+    async def async_fetch_all(
+        self,
+        urls: list[str],
+        concurrency: int = 10,
+        cached: bool = False,
+    ) -> list[httpx.Response | Exception]:
+        """Fetch URLs concurrently, spacing requests per host.
+
+        Async counterpart of fetch(): requests to the same host keep the
+        usual 0.3-0.8s spacing, while requests to different hosts overlap.
+        Each URL gets fetch()'s retry policy (exponential backoff, no
+        retries for 4xx except 429).
+
+        Args:
+            urls: URLs to fetch
+            concurrency: Maximum number of simultaneous requests
+            cached: Whether to use the on-disk HTTP cache, if configured. Only
+                for pages that are the same on every request (the hierarchy
+                dropdowns); pages used for change detection or carrying
+                short-lived links must always be fetched fresh.
+
+        Returns:
+            List of responses, or the exception for URLs that failed (after
+            retries, where retryable), in the same order as the input. One
+            failed URL never aborts the batch.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        host_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        host_last_request: dict[str, float] = {}
+
+        async def _pace(host: str) -> None:
+            # Holding the host's lock through the sleep serializes that host only
+            async with host_locks[host]:
+                last_request = host_last_request.get(host, 0)
+                if last_request > 0:
+                    elapsed = monotonic() - last_request
+                    if elapsed < self.MIN_DELAY_SECONDS:
+                        delay = self._jitter(
+                            self.MIN_DELAY_SECONDS - elapsed, self.MAX_DELAY_SECONDS
+                        )
+                        await asyncio.sleep(delay)
+                host_last_request[host] = monotonic()
+
+        async with self._async_client(cached=cached) as async_client:
+
+            async def _fetch_one(url: str) -> httpx.Response | Exception:
+                host = urlsplit(url).netloc
+                async with semaphore:
+                    try:
+                        async for attempt in AsyncRetrying(
+                            wait=self._RETRY_WAIT,
+                            stop=self._RETRY_STOP,
+                            retry=self._RETRY_IF,
+                            reraise=True,
+                        ):
+                            with attempt:
+                                await _pace(host)
+                                response = await async_client.get(url)
+                                response.raise_for_status()
+                    except Exception as e:  # noqa: BLE001
+                        # Anything, not just HTTP errors (bad URL, cache I/O), is per URL
+                        logger.warning(
+                            "async_fetch_failed",
+                            url=url,
+                            error=str(e),
+                            error_type=type(e).__name__,
+                        )
+                        return e
+                    return response
+
+            return list(await asyncio.gather(*(_fetch_one(url) for url in urls)))
+
     def fetch_with_browser(self, url: str) -> str:
         """Fetch URL using persistent headless browser for JavaScript content.
 
@@ -560,6 +799,97 @@ class RespectfulFetcher:
 
         logger.info("fetching_url_with_browser", url=url)
 
+        return self._browser_thread.submit(self._fetch_with_browser, url).result()
+
+    async def async_fetch_with_browser(
+        self,
+        urls: list[str],
+        concurrency: int = 4,
+    ) -> list[str | None]:
+        """Render multiple pages concurrently with a pool of browser contexts.
+
+        Launches one headless browser for the batch and shares up to
+        ``concurrency`` contexts (resources blocked, as for the persistent
+        browser) between the fetches. Each fetch waits the usual 1-3s
+        browser delay first and retries transient errors like
+        fetch_with_browser().
+
+        Args:
+            urls: URLs to render
+            concurrency: Number of pages loading at once
+
+        Returns:
+            List of rendered HTML strings, or None for pages that failed,
+            in the same order as the input
+        """
+        if not urls:
+            return []
+
+        async def _abort(route: Route) -> None:
+            await route.abort()
+
+        async with async_playwright() as pw:
+            browser = await pw.chromium.launch(headless=True)
+            pool: asyncio.Queue[AsyncBrowserContext] = asyncio.Queue()
+            for _ in range(min(concurrency, len(urls))):
+                context = await browser.new_context(user_agent=self.USER_AGENT)
+                await context.route(_BLOCKED_RESOURCES, _abort)
+                pool.put_nowait(context)
+
+            async def _fetch_one(url: str) -> str | None:
+                context = await pool.get()
+                try:
+                    await asyncio.sleep(
+                        self._jitter(self.BROWSER_MIN_DELAY_SECONDS, self.BROWSER_MAX_DELAY_SECONDS)
+                    )
+                    for attempt in range(BROWSER_MAX_RETRIES):
+                        page = await context.new_page()
+                        try:
+                            await page.goto(
+                                url,
+                                wait_until="domcontentloaded",
+                                timeout=self.TIMEOUT_SECONDS * 1000,
+                            )
+                            content: str = await page.content()
+                        except Exception as e:  # noqa: BLE001
+                            if (
+                                not _is_retryable_browser_error(e)
+                                or attempt == BROWSER_MAX_RETRIES - 1
+                            ):
+                                logger.warning(
+                                    "async_browser_fetch_failed",
+                                    url=url,
+                                    attempts=attempt + 1,
+                                    error=str(e),
+                                    error_type=type(e).__name__,
+                                )
+                                return None
+                            await asyncio.sleep(BROWSER_BACKOFF_BASE ** (attempt + 1))
+                        else:
+                            return content
+                        finally:
+                            await page.close()
+                    return None
+                finally:
+                    pool.put_nowait(context)
+
+            try:
+                return list(await asyncio.gather(*(_fetch_one(url) for url in urls)))
+            finally:
+                await browser.close()
+
+    def _fetch_with_browser(self, url: str) -> str:
+        """Fetch URL in the browser with retries (runs on the browser thread).
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            Rendered HTML content
+
+        Raises:
+            Exception: If browser fetch fails after all retries
+        """
         _browser, browser_context = self._ensure_browser()
 
         last_error: BaseException | None = None
@@ -575,6 +905,9 @@ class RespectfulFetcher:
 
                 content: str = page.content()
 
+                if not self._cookies_warmed:
+                    self._share_browser_cookies(browser_context)
+
                 logger.info(
                     "browser_fetch_success",
                     url=url,
@@ -619,9 +952,15 @@ class RespectfulFetcher:
     def close_browser(self) -> None:
         """Close browser and Playwright, keeping the HTTP client open.
 
-        This releases the Playwright event loop so that asyncio.run()
-        can be used again afterwards (e.g. for async detail-page fetches).
+        The browser runs on its own thread, so this is not needed before
+        asyncio.run(); call it to free the browser's memory between phases.
         """
+        if self._browser is None and self._playwright is None:
+            return
+        self._browser_thread.submit(self._close_browser).result()
+
+    def _close_browser(self) -> None:
+        """Tear down the browser context, browser, and Playwright (browser thread)."""
         if self._browser_context is not None:
             self._browser_context.close()
             self._browser_context = None
@@ -637,6 +976,7 @@ class RespectfulFetcher:
     def close(self) -> None:
         """Close HTTP client, browser, and release all resources."""
         self.close_browser()
+        self._browser_thread.shutdown()
         self.client.close()
         logger.debug("fetcher_closed")
 
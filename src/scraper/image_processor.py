@@ -17,6 +17,7 @@ from pathlib import Path
 from typing import Any
 
 import httpx
+import orjson
 import structlog
 from PIL import Image
 
@@ -333,7 +334,7 @@ class ImageProcessor:
 
     def _save_manifest(self) -> None:
         """Persist the image hash manifest to disk."""
-        self._manifest_path.write_text(json.dumps(self._manifest, indent=2))
+        self._manifest_path.write_bytes(orjson.dumps(self._manifest, option=orjson.OPT_INDENT_2))
 
     # ------------------------------------------------------------------
     # AVIF encoding
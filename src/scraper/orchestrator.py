@@ -6,25 +6,33 @@ fetching, parsing, deduplication, and export of automotive parts data.
 
 from __future__ import annotations
 
-import asyncio
 import hashlib
 import json
+import os
 import re
+import struct
 import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from itertools import islice
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, NamedTuple, Self
+from typing import TYPE_CHECKING, Any, BinaryIO, Final, NamedTuple, Self
 
+import orjson
 import structlog
 from bs4 import BeautifulSoup
 
 from src.exporters.json_exporter import JSONExporter
-from src.models.part import Part
+from src.models.part import (
+    PART_IMAGE_LIST_ADAPTER,
+    PART_LIST_ADAPTER,
+    REFERENCE_NUMBER_LIST_ADAPTER,
+    Part,
+)
 from src.models.vehicle import Vehicle, VehicleCompatibility
 from src.scraper.ajax_parser import AJAXResponseParser
 from src.scraper.etag_store import ETagStore
-from src.scraper.fetcher import RespectfulFetcher
+from src.scraper.fetcher import RespectfulFetcher, run_async
 from src.scraper.hierarchy_cache import HierarchyCache
 from src.scraper.image_processor import ImageProcessor
 from src.scraper.parser import CSFParser
@@ -37,6 +45,17 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger()
 
+# One processed application ID per record in the append-only processed log
+_APP_ID_RECORD: Final = struct.Struct("<I")
+
+# Shortest gap between interval checkpoints in Phase 2. Pages are fetched
+# before the loop, so intervals can pass in well under a second, and each
+# checkpoint snapshots the whole parts map and fsyncs it
+_CHECKPOINT_MIN_SECONDS: Final = 30.0
+
+# Phase 2 logs its progress for the first, last and every Nth application
+_PROGRESS_LOG_EVERY: Final = 100
+
 # All 51 vehicle makes with their IDs (from reconnaissance)
 MAKES = {
     1: "Nissan",
@@ -354,8 +373,31 @@ class ScraperOrchestrator:
         # State tracking
         self.unique_parts: dict[str, Part] = {}
         self.vehicle_compat: dict[str, list[Vehicle]] = {}
+        # Per-SKU set of (make, model, year, engine) keys already in
+        # vehicle_compat, with the list and length it was built from so a
+        # list replaced or extended elsewhere (checkpoint, previous export)
+        # triggers a rebuild
+        self._vehicle_keys: dict[
+            str, tuple[list[Vehicle], int, set[tuple[str, str, int, str | None]]]
+        ] = {}
+        # Part object and compatibility-list length per SKU as of the last
+        # incremental export. Parts are replaced, never mutated, and lists
+        # only grow, so anything that differs is the delta to append next.
+        self._exported_parts: dict[str, Part] = {}
+        self._exported_compat_sizes: dict[str, int] = {}
+        # Same bookkeeping for the JSON Lines logs appended at checkpoints
+        self._logged_parts: dict[str, Part] = {}
+        self._logged_compat_sizes: dict[str, int] = {}
         self.parts_scraped = 0
         self.processed_application_ids: set[int] = set()
+        # Append-only log of processed IDs, so checkpoints record an entry
+        # count instead of rewriting the whole ID list every interval
+        self._processed_log: BinaryIO | None = None
+        self._processed_log_filter: str | None = None
+        self._processed_log_entries = 0
+        # Logs replaced by the open one, keyed by filter; deleted once a
+        # checkpoint refers to the new log instead
+        self._superseded_processed_logs: list[tuple[str, Path]] = []
 
         # Change tracking (populated by scrape_all)
         self.new_skus: set[str] = set()
@@ -394,7 +436,7 @@ class ScraperOrchestrator:
             )
             return dict(MAKES)
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = BeautifulSoup(response.text, "lxml")
 
         discovered: dict[int, str] = {}
         for link in soup.find_all("a", attrs={"data-remote": True}):
@@ -417,15 +459,14 @@ class ScraperOrchestrator:
             return dict(MAKES)
 
         # Log any newly discovered makes not in the fallback constant
-        known_ids = set(MAKES.keys())
-        for mid, mname in discovered.items():
-            if mid not in known_ids:
-                logger.info("new_make_discovered", make_id=mid, make_name=mname)
+        new_makes = [(mid, mname) for mid, mname in discovered.items() if mid not in MAKES]
+        for mid, mname in new_makes:
+            logger.info("new_make_discovered", make_id=mid, make_name=mname)
 
         logger.info(
             "makes_discovered",
             count=len(discovered),
-            new_count=len(set(discovered.keys()) - known_ids),
+            new_count=len(new_makes),
         )
         return discovered
 
@@ -455,7 +496,7 @@ class ScraperOrchestrator:
         logger.debug("enumerating_years", make=make_name, make_id=make_id, url=url)
 
         response = prefetched_response or self.fetcher.fetch(url)
-        years = self.ajax_parser.parse_year_response(response.text)
+        years = self.ajax_parser.parse_year_response(response.content)
 
         logger.info("years_enumerated", make=make_name, year_count=len(years))
         return years
@@ -480,7 +521,7 @@ class ScraperOrchestrator:
         logger.debug("enumerating_models", make=make_name, year=year, year_id=year_id, url=url)
 
         response = self.fetcher.fetch(url)
-        models = self.ajax_parser.parse_model_response(response.text)
+        models = self.ajax_parser.parse_model_response(response.content)
 
         logger.info("models_enumerated", make=make_name, year=year, model_count=len(models))
         return models
@@ -502,6 +543,12 @@ class ScraperOrchestrator:
         the stored hash. On a match the cached hierarchy entries are reused,
         skipping all model enumeration requests for that make.
 
+        The years dropdowns of all makes, and then the model dropdowns of
+        every cache-miss make, are each fetched in one concurrent batch
+        (``async_fetch_all``), so request latencies overlap instead of adding
+        up; the fetcher still paces request starts. A run where no make
+        changed therefore costs a single batch of years requests.
+
         Args:
             make_filter: Filter by make name (e.g., "Honda")
             year_filter: Filter by year (e.g., 2025)
@@ -526,17 +573,19 @@ class ScraperOrchestrator:
         hierarchy: list[dict[str, Any]] = []
         cache_hits = 0
         cache_misses = 0
+        # Year labels are compared as the strings the dropdown returns, so no
+        # label is parsed (and a non-numeric one cannot raise)
+        year_label = str(year_filter) if year_filter else None
 
         # Dynamically discover makes from homepage (falls back to MAKES constant)
         discovered_makes = self._enumerate_makes()
 
-        # Filter makes if requested
+        # Filter makes if requested (case-insensitive name match)
         makes_to_process: list[tuple[int, str]] = list(discovered_makes.items())
         if make_filter:
+            wanted = make_filter.lower()
             makes_to_process = [
-                (mid, mname)
-                for mid, mname in discovered_makes.items()
-                if mname.lower() == make_filter.lower()
+                (mid, mname) for mid, mname in makes_to_process if mname.lower() == wanted
             ]
 
         logger.info(
@@ -547,25 +596,38 @@ class ScraperOrchestrator:
             use_cache=use_cache,
         )
 
-        for make_id, make_name in makes_to_process:
-            years_url = f"https://csf.mycarparts.com/get_year_by_make/{make_id}"
+        # Per-make entries, in make order; cache misses are filled in once
+        # all of their model dropdowns have been fetched in one batch
+        make_entries_by_id: dict[int, list[dict[str, Any]]] = {}
+        pending: list[tuple[int, str, str, str, list[tuple[int, str]]]] = []
 
-            try:
-                # Fetch years response (we need it for both cache check and parsing)
-                response = self.fetcher.fetch(years_url)
-            except Exception as e:  # noqa: BLE001
+        # Fetch every make's years dropdown concurrently (paced per host); the
+        # responses drive both the cache check and year parsing
+        years_urls = [
+            f"https://csf.mycarparts.com/get_year_by_make/{make_id}"
+            for make_id, _make_name in makes_to_process
+        ]
+        years_responses = (
+            run_async(self.fetcher.async_fetch_all(years_urls, cached=True)) if years_urls else []
+        )
+
+        for (make_id, make_name), years_url, response in zip(
+            makes_to_process, years_urls, years_responses, strict=True
+        ):
+            if isinstance(response, Exception):
+                # The fetcher has already retried (if retryable) and logged the request
                 logger.warning(
                     "hierarchy_years_failed",
                     make=make_name,
                     make_id=make_id,
-                    error_type=type(e).__name__,
-                    error=str(e),
+                    error_type=type(response).__name__,
+                    error=str(response),
                 )
                 self.failure_tracker.record(
                     phase="hierarchy",
                     identifier=f"make:{make_name}",
-                    error_type=type(e).__name__,
-                    error_message=str(e),
+                    error_type=type(response).__name__,
+                    error_message=str(response),
                 )
                 continue
 
@@ -582,9 +644,9 @@ class ScraperOrchestrator:
                 if stored_hash == response_hash and cached_entries is not None:
                     # Cache hit — reuse cached hierarchy entries
                     make_entries = cached_entries
-                    if year_filter:
-                        make_entries = [e for e in make_entries if int(e["year"]) == year_filter]
-                    hierarchy.extend(make_entries)
+                    if year_label:
+                        make_entries = [e for e in make_entries if e["year"] == year_label]
+                    make_entries_by_id[make_id] = make_entries
                     cache_hits += 1
                     logger.info(
                         "hierarchy_cache_hit",
@@ -617,44 +679,28 @@ class ScraperOrchestrator:
                 continue
 
             # Filter years if requested
-            if year_filter:
-                years = {yid: yr for yid, yr in years.items() if int(yr) == year_filter}
-
-            make_entries = []
-            for year_id, year in years.items():
-                try:
-                    # Enumerate models for this year/make
-                    models = self._enumerate_models(year_id, year, make_name)
-                except Exception as e:  # noqa: BLE001
-                    logger.warning(
-                        "hierarchy_models_failed",
-                        make=make_name,
-                        year=year,
-                        year_id=year_id,
-                        error_type=type(e).__name__,
-                        error=str(e),
-                    )
-                    self.failure_tracker.record(
-                        phase="hierarchy",
-                        identifier=f"year:{make_name}/{year}",
-                        error_type=type(e).__name__,
-                        error_message=str(e),
-                    )
-                    continue
-
-                for application_id, model in models.items():
-                    make_entries.append(
-                        {
-                            "make_id": make_id,
-                            "make": make_name,
-                            "year_id": year_id,
-                            "year": year,
-                            "application_id": application_id,
-                            "model": model,
-                        }
-                    )
+            if year_label:
+                years = {yid: yr for yid, yr in years.items() if yr == year_label}
+
+            # Reserve the make's slot so the hierarchy keeps make order
+            make_entries_by_id[make_id] = []
+            pending.append((make_id, make_name, years_url, response_hash, list(years.items())))
+
+        # Fetch every pending model dropdown concurrently (paced per host)
+        model_urls = [
+            f"https://csf.mycarparts.com/get_model_by_make_year/{year_id}"
+            for *_, make_years in pending
+            for year_id, _year in make_years
+        ]
+        model_responses = iter(
+            run_async(self.fetcher.async_fetch_all(model_urls, cached=True)) if model_urls else []
+        )
 
-            hierarchy.extend(make_entries)
+        for make_id, make_name, years_url, response_hash, make_years in pending:
+            make_entries = self._collect_model_entries(
+                make_id, make_name, make_years, list(islice(model_responses, len(make_years)))
+            )
+            make_entries_by_id[make_id] = make_entries
 
             # Update cache with fresh data (store unfiltered entries)
             self.hierarchy_cache.set_url_hash(years_url, response_hash)
@@ -664,6 +710,9 @@ class ScraperOrchestrator:
             # we store what we have — the cache will be rebuilt on next full run.
             self.hierarchy_cache.set_make_hierarchy(make_id, make_entries)
 
+        for make_entries in make_entries_by_id.values():
+            hierarchy.extend(make_entries)
+
         # Persist cache
         self.hierarchy_cache.save()
 
@@ -675,6 +724,83 @@ class ScraperOrchestrator:
         )
         return hierarchy
 
+    def _collect_model_entries(
+        self,
+        make_id: int,
+        make_name: str,
+        make_years: list[tuple[int, str]],
+        model_responses: list[httpx.Response | Exception],
+    ) -> list[dict[str, Any]]:
+        """Parse one make's model dropdown responses into hierarchy entries.
+
+        Years whose response is missing (fetch failed) or unparseable are
+        recorded as failures and skipped.
+
+        Args:
+            make_id: Make ID (e.g., 3 for Honda)
+            make_name: Make name (e.g., "Honda")
+            make_years: (year_id, year) pairs, in the same order as the responses
+            model_responses: Model dropdown response per year, or the error its fetch
+                failed with
+
+        Returns:
+            Hierarchy entries for the make
+        """
+        make_entries: list[dict[str, Any]] = []
+        for (year_id, year), models_response in zip(make_years, model_responses, strict=True):
+            if isinstance(models_response, Exception):
+                # The fetcher has already retried (if retryable) and logged the request
+                self._record_models_failure(
+                    make_name, year, year_id, type(models_response).__name__, str(models_response)
+                )
+                continue
+            try:
+                models = self.ajax_parser.parse_model_response(models_response.content)
+            except Exception as e:  # noqa: BLE001
+                self._record_models_failure(make_name, year, year_id, type(e).__name__, str(e))
+                continue
+
+            logger.info("models_enumerated", make=make_name, year=year, model_count=len(models))
+            make_entries.extend(
+                {
+                    "make_id": make_id,
+                    "make": make_name,
+                    "year_id": year_id,
+                    "year": year,
+                    "application_id": application_id,
+                    "model": model,
+                }
+                for application_id, model in models.items()
+            )
+        return make_entries
+
+    def _record_models_failure(
+        self, make_name: str, year: str, year_id: int, error_type: str, error: str
+    ) -> None:
+        """Log and record a model dropdown that could not be fetched or parsed.
+
+        Args:
+            make_name: Make name (e.g., "Honda")
+            year: Year string (e.g., "2025")
+            year_id: Year ID whose models failed
+            error_type: Exception class name
+            error: Error message
+        """
+        logger.warning(
+            "hierarchy_models_failed",
+            make=make_name,
+            year=year,
+            year_id=year_id,
+            error_type=error_type,
+            error=error,
+        )
+        self.failure_tracker.record(
+            phase="hierarchy",
+            identifier=f"year:{make_name}/{year}",
+            error_type=error_type,
+            error_message=error,
+        )
+
     def _deduplicate_and_track(
         self,
         parts: list[Part],
@@ -703,13 +829,18 @@ class ScraperOrchestrator:
         """
         new_skus: set[str] = set()
         changed_skus: set[str] = set()
+        unique_parts = self.unique_parts
+        vehicle_compat = self.vehicle_compat
+        vehicle_keys = self._vehicle_keys
+        add_new_sku = new_skus.add
+        key = (vehicle.make, vehicle.model, vehicle.year, vehicle.engine)
 
         for part in parts:
             sku = part.sku
 
             # Track new parts (first time seeing this SKU)
-            if sku not in self.unique_parts:
-                new_skus.add(sku)
+            if sku not in unique_parts:
+                add_new_sku(sku)
                 logger.debug("new_part_found", sku=sku, name=part.name)
             elif previous_hashes and sku in previous_hashes:
                 # Check if content changed compared to previous export
@@ -719,29 +850,31 @@ class ScraperOrchestrator:
                     logger.debug("part_changed", sku=sku, name=part.name)
 
             # Always update with latest data (last-write-wins)
-            self.unique_parts[sku] = part
+            unique_parts[sku] = part
 
             # Track vehicle compatibility (prevent duplicates)
-            if sku not in self.vehicle_compat:
-                self.vehicle_compat[sku] = []
+            compat = vehicle_compat.setdefault(sku, [])
 
             # Check if this exact vehicle (including engine) is already tracked
-            vehicle_exists = any(
-                v.make == vehicle.make
-                and v.model == vehicle.model
-                and v.year == vehicle.year
-                and v.engine == vehicle.engine
-                for v in self.vehicle_compat[sku]
-            )
+            indexed = vehicle_keys.get(sku)
+            if indexed is not None and indexed[0] is compat and indexed[1] == len(compat):
+                keys = indexed[2]
+                if key in keys:
+                    # Fast path: already tracked and the index is current
+                    continue
+            else:
+                keys = {(v.make, v.model, v.year, v.engine) for v in compat}
 
-            if not vehicle_exists:
-                self.vehicle_compat[sku].append(vehicle)
+            if key not in keys:
+                compat.append(vehicle)
+                keys.add(key)
                 engine_info = f" ({vehicle.engine})" if vehicle.engine else ""
                 logger.debug(
                     "vehicle_compatibility_added",
                     sku=sku,
                     vehicle=f"{vehicle.year} {vehicle.make} {vehicle.model}{engine_info}",
                 )
+            vehicle_keys[sku] = (compat, len(compat), keys)
 
         logger.info(
             "deduplication_complete",
@@ -762,7 +895,9 @@ class ScraperOrchestrator:
 
         Note:
             Creates a new Part object with enriched data since Parts are immutable.
-            Updates self.unique_parts[sku] with the new object.
+            Updates self.unique_parts[sku] with the new object. Only the
+            replaced fields are validated; the rest are copied from the
+            already-validated part.
         """
         if sku not in self.unique_parts:
             logger.warning("part_not_found_for_enrichment", sku=sku)
@@ -770,39 +905,42 @@ class ScraperOrchestrator:
 
         part = self.unique_parts[sku]
 
-        # Build updated data dict
-        updated_data = part.model_dump()
+        # Collect the fields the detail page replaces
+        update: dict[str, Any] = {}
 
-        # Update with detail page data
+        # Strings are stripped here because model_copy() bypasses
+        # str_strip_whitespace
         if detail_data.get("full_description"):
-            updated_data["description"] = detail_data["full_description"]
+            update["description"] = detail_data["full_description"].strip()
 
         if detail_data.get("specifications"):
             # Merge specifications (detail page has more complete data)
-            updated_data["specifications"] = {
-                **updated_data["specifications"],
+            update["specifications"] = {
+                **part.specifications,
                 **detail_data["specifications"],
             }
 
         if detail_data.get("tech_notes"):
-            updated_data["tech_notes"] = detail_data["tech_notes"]
+            update["tech_notes"] = detail_data["tech_notes"].strip()
 
         if detail_data.get("interchange_data"):
             # Add interchange numbers (convert dict to ReferenceNumber objects)
-            updated_data["interchange_numbers"] = detail_data["interchange_data"]
+            update["interchange_numbers"] = REFERENCE_NUMBER_LIST_ADAPTER.validate_python(
+                detail_data["interchange_data"]
+            )
 
         # Process gallery images (parser already filters for large images only)
         if detail_data.get("additional_images"):
             processed_images = self.image_processor.process_images(
                 sku, detail_data["additional_images"]
             )
-            updated_data["images"] = processed_images
+            update["images"] = PART_IMAGE_LIST_ADAPTER.validate_python(processed_images)
 
         # Create new Part with enriched data
-        enriched_part = Part(**updated_data)
+        enriched_part = part.model_copy(update=update)
         self.unique_parts[sku] = enriched_part
 
-        logger.debug("part_enriched", sku=sku, gallery_images=len(updated_data.get("images", [])))
+        logger.debug("part_enriched", sku=sku, gallery_images=len(enriched_part.images))
 
     def _create_vehicle_from_config(
         self, config: dict[str, Any], vehicle_qualifiers: dict[str, Any] | None = None
@@ -834,7 +972,7 @@ class ScraperOrchestrator:
         if vehicle_qualifiers is None:
             vehicle_qualifiers = {}
 
-        return Vehicle(
+        return Vehicle.intern(
             make=config["make"],
             model=config["model"],
             year=int(config["year"]),
@@ -845,17 +983,20 @@ class ScraperOrchestrator:
 
     @staticmethod
     def _content_hash(part: Part) -> str:
-        """MD5 hash of content-relevant Part fields for change detection.
+        """BLAKE2b hash of content-relevant Part fields for change detection.
 
         Excludes volatile fields (scraped_at) and fields enriched separately
         (description, tech_notes, interchange_numbers) so that a re-scrape of the
         application page produces the same hash even if detail enrichment hasn't run yet.
 
+        Hashes are only compared within a run (previous export vs. fresh scrape),
+        never persisted, so the algorithm can change freely between versions.
+
         Args:
             part: Part to hash
 
         Returns:
-            MD5 hex digest of content-relevant fields
+            128-bit BLAKE2b hex digest of content-relevant fields
         """
         content = {
             "sku": part.sku,
@@ -863,14 +1004,16 @@ class ScraperOrchestrator:
             "price": str(part.price) if part.price else None,
             "category": part.category,
             "specifications": part.specifications,
-            "images": [img.model_dump() for img in part.images],
+            # Plain field reads; a model_dump() per image costs more than the hash
+            "images": [(img.url, img.alt_text, img.is_primary) for img in part.images],
             "manufacturer": part.manufacturer,
             "in_stock": part.in_stock,
             "features": part.features,
             "position": part.position,
         }
-        return hashlib.md5(  # noqa: S324
-            json.dumps(content, sort_keys=True).encode()
+        return hashlib.blake2b(
+            orjson.dumps(content, option=orjson.OPT_SORT_KEYS),
+            digest_size=16,
         ).hexdigest()
 
     @staticmethod
@@ -950,7 +1093,7 @@ class ScraperOrchestrator:
                 sku = entry.get("sku", "")
                 vehicles = entry.get("vehicles", [])
                 if sku and sku not in self.vehicle_compat:
-                    self.vehicle_compat[sku] = [Vehicle(**v) for v in vehicles]
+                    self.vehicle_compat[sku] = [Vehicle.intern(**v) for v in vehicles]
             logger.info("previous_compatibility_loaded", entries=len(compat_data))
 
         return previous_hashes
@@ -993,7 +1136,7 @@ class ScraperOrchestrator:
             urls_and_hashes.append((url, prev))
 
         # Run concurrent checks
-        results = asyncio.run(self.fetcher.async_check_etags(urls_and_hashes))
+        results = run_async(self.fetcher.async_check_etags(urls_and_hashes))
 
         # Process results sequentially
         changed: list[dict[str, Any]] = []
@@ -1030,11 +1173,73 @@ class ScraperOrchestrator:
 
         return changed
 
+    @staticmethod
+    def _checkpoint_filter_str(make_filter: str | None, year_filter: int | None) -> str:
+        """Build the filter part of checkpoint and processed-log file names.
+
+        Args:
+            make_filter: Make filter used in scraping
+            year_filter: Year filter used in scraping
+
+        Returns:
+            Lowercased filters joined by "_", or "all" when unfiltered
+        """
+        filters = []
+        if make_filter:
+            filters.append(make_filter.lower())
+        if year_filter:
+            filters.append(str(year_filter))
+        return "_".join(filters) if filters else "all"
+
+    def _open_processed_log(self, filter_str: str) -> BinaryIO:
+        """Start a new processed-ID log seeded with the current processed IDs.
+
+        Each run gets its own log file, so the entry counts recorded by older
+        checkpoints keep pointing at the log they were written against. The
+        log it replaces is deleted by the next checkpoint that refers to the
+        new one.
+
+        Args:
+            filter_str: Filter part of the log file name
+
+        Returns:
+            The log, opened for appending
+        """
+        if self._processed_log is not None and self._processed_log_filter == filter_str:
+            self._superseded_processed_logs.append((filter_str, Path(self._processed_log.name)))
+        self._close_processed_log()
+        timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S_%f")
+        log_path = self.checkpoint_dir / f"processed_{filter_str}_{timestamp}.bin"
+        log_path.write_bytes(b"".join(map(_APP_ID_RECORD.pack, self.processed_application_ids)))
+        self._processed_log = log_path.open("ab")
+        self._processed_log_filter = filter_str
+        self._processed_log_entries = len(self.processed_application_ids)
+        return self._processed_log
+
+    def _mark_processed(self, application_id: int) -> None:
+        """Record an application as processed in memory and in the processed log.
+
+        Args:
+            application_id: ID of the application page that was scraped
+        """
+        self.processed_application_ids.add(application_id)
+        if self._processed_log is not None:
+            self._processed_log.write(_APP_ID_RECORD.pack(application_id))
+            self._processed_log_entries += 1
+
+    def _close_processed_log(self) -> None:
+        """Close the processed-ID log, if one is open."""
+        if self._processed_log is not None:
+            self._processed_log.close()
+            self._processed_log = None
+
     def _save_checkpoint(self, make_filter: str | None, year_filter: int | None) -> Path:
         """Save current scraping state to checkpoint file.
 
         Includes actual parts data and vehicle compatibility so resume
-        does not need to re-fetch already scraped pages.
+        does not need to re-fetch already scraped pages. Processed application
+        IDs live in the append-only processed log; the checkpoint records the
+        log's name and how many of its entries the saved parts cover.
 
         Args:
             make_filter: Make filter used in scraping
@@ -1044,12 +1249,14 @@ class ScraperOrchestrator:
             Path to checkpoint file
         """
         timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
-        filters = []
-        if make_filter:
-            filters.append(make_filter.lower())
-        if year_filter:
-            filters.append(str(year_filter))
-        filter_str = "_".join(filters) if filters else "all"
+        filter_str = self._checkpoint_filter_str(make_filter, year_filter)
+
+        processed_log = self._processed_log
+        if processed_log is None or self._processed_log_filter != filter_str:
+            processed_log = self._open_processed_log(filter_str)
+        # The log must hold every entry counted below before the checkpoint exists
+        processed_log.flush()
+        os.fsync(processed_log.fileno())
 
         checkpoint_name = f"checkpoint_{filter_str}_{timestamp}.json"
         checkpoint_path = self.checkpoint_dir / checkpoint_name
@@ -1067,17 +1274,40 @@ class ScraperOrchestrator:
             "timestamp": timestamp,
             "make_filter": make_filter,
             "year_filter": year_filter,
-            "processed_application_ids": list(self.processed_application_ids),
+            "processed_log": Path(processed_log.name).name,
+            "processed_log_entries": self._processed_log_entries,
             "unique_parts_count": len(self.unique_parts),
             "parts_scraped": self.parts_scraped,
-            "vehicles_tracked": sum(len(v) for v in self.vehicle_compat.values()),
+            "vehicles_tracked": sum(map(len, self.vehicle_compat.values())),
             "parts_data": parts_data,
             "vehicle_compat": compat_data,
             "failure_records": self.failure_tracker.to_dicts(),
         }
 
-        with checkpoint_path.open("w") as f:
-            json.dump(checkpoint_data, f, indent=2, default=str)
+        # orjson serializes the (often large) parts map in native code; the
+        # on-disk format stays indented JSON. It is written to a temporary
+        # sibling and renamed into place, so a crash mid-write never leaves a
+        # truncated checkpoint for resume to pick up.
+        tmp_path = checkpoint_path.with_name(f"{checkpoint_path.name}.tmp")
+        try:
+            with tmp_path.open("wb") as f:
+                f.write(orjson.dumps(checkpoint_data, default=str, option=orjson.OPT_INDENT_2))
+                f.flush()
+                os.fsync(f.fileno())
+            tmp_path.replace(checkpoint_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        # Earlier logs for this filter are only needed by older checkpoints
+        current_log = Path(processed_log.name)
+        remaining: list[tuple[str, Path]] = []
+        for log_filter, log_path in self._superseded_processed_logs:
+            if log_filter != filter_str:
+                remaining.append((log_filter, log_path))
+            elif log_path != current_log:
+                log_path.unlink(missing_ok=True)
+        self._superseded_processed_logs = remaining
 
         logger.info(
             "checkpoint_saved",
@@ -1087,6 +1317,43 @@ class ScraperOrchestrator:
         )
         return checkpoint_path
 
+    def _render_with_browser_pool(self, urls: list[str], html_results: list[str | None]) -> int:
+        """Render pages the HTTP fast path could not serve with a browser pool.
+
+        Fills the ``None`` slots of ``html_results`` in place. A failed batch
+        is logged and leaves the slots empty for the caller's per-page fallback.
+
+        Args:
+            urls: Page URLs, aligned with ``html_results``
+            html_results: HTTP results, with None for pages needing a browser
+
+        Returns:
+            Number of pages rendered by the browser pool
+        """
+        fallback_indices = [i for i, html in enumerate(html_results) if html is None]
+        if not fallback_indices:
+            return 0
+
+        try:
+            browser_results = run_async(
+                self.fetcher.async_fetch_with_browser([urls[i] for i in fallback_indices])
+            )
+        except Exception as e:  # noqa: BLE001
+            logger.warning(
+                "browser_batch_failed",
+                pages=len(fallback_indices),
+                error_type=type(e).__name__,
+                error=str(e),
+            )
+            return 0
+
+        rendered = 0
+        for i, browser_html in zip(fallback_indices, browser_results, strict=True):
+            if browser_html is not None:
+                html_results[i] = browser_html
+                rendered += 1
+        return rendered
+
     @staticmethod
     def _raise_time_budget(
         budget: TimeBudget,
@@ -1140,12 +1407,23 @@ class ScraperOrchestrator:
             msg = f"Checkpoint file not found: {checkpoint_path}"
             raise FileNotFoundError(msg)
 
-        with checkpoint_path.open() as f:
-            checkpoint_data: dict[str, Any] = json.load(f)
+        checkpoint_data: dict[str, Any] = orjson.loads(checkpoint_path.read_bytes())
 
         # Restore state
         try:
-            self.processed_application_ids = set(checkpoint_data["processed_application_ids"])
+            if "processed_log" in checkpoint_data:
+                log_path = checkpoint_path.parent / checkpoint_data["processed_log"]
+                self.processed_application_ids = self._read_processed_log(
+                    log_path, checkpoint_data["processed_log_entries"]
+                )
+                # The next run starts its own log; this one goes at its first checkpoint
+                log_filter = self._checkpoint_filter_str(
+                    checkpoint_data.get("make_filter"), checkpoint_data.get("year_filter")
+                )
+                self._superseded_processed_logs.append((log_filter, log_path))
+            else:
+                # Checkpoints written before the processed log embed the IDs
+                self.processed_application_ids = set(checkpoint_data["processed_application_ids"])
             self.parts_scraped = checkpoint_data["parts_scraped"]
         except KeyError as e:
             msg = f"Invalid checkpoint file: {e}"
@@ -1153,17 +1431,19 @@ class ScraperOrchestrator:
 
         # Restore parts data if present (backward-compatible)
         if "parts_data" in checkpoint_data:
-            for sku, part_dict in checkpoint_data["parts_data"].items():
-                self.unique_parts[sku] = Part(**part_dict)
+            parts_data: dict[str, dict[str, Any]] = checkpoint_data["parts_data"]
+            # One list validation in pydantic-core instead of a Part(**dict) per SKU
+            restored = PART_LIST_ADAPTER.validate_python(list(parts_data.values()))
+            self.unique_parts.update(zip(parts_data, restored, strict=True))
             logger.info(
                 "checkpoint_parts_restored",
-                count=len(checkpoint_data["parts_data"]),
+                count=len(parts_data),
             )
 
         # Restore vehicle compatibility if present (backward-compatible)
         if "vehicle_compat" in checkpoint_data:
             for sku, vehicles_list in checkpoint_data["vehicle_compat"].items():
-                self.vehicle_compat[sku] = [Vehicle(**v) for v in vehicles_list]
+                self.vehicle_compat[sku] = [Vehicle.intern(**v) for v in vehicles_list]
             logger.info(
                 "checkpoint_compat_restored",
                 count=len(checkpoint_data["vehicle_compat"]),
@@ -1177,6 +1457,33 @@ class ScraperOrchestrator:
 
         return checkpoint_data
 
+    @staticmethod
+    def _read_processed_log(log_path: Path, entries: int) -> set[int]:
+        """Read the first ``entries`` application IDs from a processed log.
+
+        Entries appended after the checkpoint was saved are ignored: their
+        parts were never checkpointed, so those applications must be redone.
+
+        Args:
+            log_path: Processed log written alongside the checkpoint
+            entries: Number of entries the checkpoint covers
+
+        Returns:
+            Set of processed application IDs
+
+        Raises:
+            ValueError: If the log is missing or shorter than ``entries``
+        """
+        try:
+            data = log_path.read_bytes()[: entries * _APP_ID_RECORD.size]
+        except FileNotFoundError as e:
+            msg = f"Invalid checkpoint file: processed log not found: {log_path}"
+            raise ValueError(msg) from e
+        if len(data) != entries * _APP_ID_RECORD.size:
+            msg = f"Invalid checkpoint file: processed log truncated: {log_path}"
+            raise ValueError(msg)
+        return {app_id for (app_id,) in _APP_ID_RECORD.iter_unpack(data)}
+
     def _get_latest_checkpoint(
         self, make_filter: str | None = None, year_filter: int | None = None
     ) -> Path | None:
@@ -1189,12 +1496,7 @@ class ScraperOrchestrator:
         Returns:
             Path to latest checkpoint or None if no matching checkpoint exists
         """
-        filters = []
-        if make_filter:
-            filters.append(make_filter.lower())
-        if year_filter:
-            filters.append(str(year_filter))
-        filter_str = "_".join(filters) if filters else "all"
+        filter_str = self._checkpoint_filter_str(make_filter, year_filter)
 
         pattern = f"checkpoint_{filter_str}_*.json"
         checkpoints = sorted(self.checkpoint_dir.glob(pattern), reverse=True)
@@ -1235,7 +1537,9 @@ class ScraperOrchestrator:
             year_filter: Filter by year (e.g., 2025)
             fetch_details: Whether to fetch detail pages (default: True)
             resume: Resume from latest checkpoint if available (default: False)
-            checkpoint_interval: Save checkpoint every N applications (default: 10)
+            checkpoint_interval: Save checkpoint every N applications (default: 10),
+                at most once every _CHECKPOINT_MIN_SECONDS unless the time budget
+                has run out
             force_full: Force full scrape, ignoring previous data (default: False)
             time_budget_minutes: Maximum minutes to run before saving checkpoint
                 and exiting gracefully (default: None = unlimited).  Set this to
@@ -1290,6 +1594,8 @@ class ScraperOrchestrator:
         previous_hashes: dict[str, str] = {}
         if self.incremental:
             previous_hashes = self.load_previous_export()
+            # Start this run's logs empty; the loaded catalog goes in once
+            self._reset_export_logs()
 
         # Phase 1: Build vehicle hierarchy
         hierarchy = self._build_hierarchy(
@@ -1327,274 +1633,295 @@ class ScraperOrchestrator:
 
         logger.info("workflow_phase_1_complete", applications_to_process=len(hierarchy))
 
-        # Phase 2: Batch-fetch application pages concurrently, then process sequentially
-        new_skus_found: set[str] = set()
-        changed_skus_found: set[str] = set()
-        applications_processed = 0
-        applications_failed = 0
-        browser_fallback_count = 0
-
-        # Step A: Async batch fetch all application pages (HTTP fast path)
-        urls = [f"https://csf.mycarparts.com/applications/{c['application_id']}" for c in hierarchy]
-        html_results: list[str | None] = []
-        if urls:
-            html_results = asyncio.run(self.fetcher.async_scrape_application_pages(urls))
-
-        # Step B: Sequential processing (dedup, qualifier grouping, checkpoints)
-        for idx, (config, fetched_html) in enumerate(zip(hierarchy, html_results, strict=True), 1):
-            application_id = config["application_id"]
-            url = f"https://csf.mycarparts.com/applications/{application_id}"
-
-            logger.info(
-                "processing_application",
-                progress=f"{idx}/{len(hierarchy)}",
-                vehicle=f"{config['year']} {config['make']} {config['model']}",
-                application_id=application_id,
-            )
-
-            try:
-                # Browser fallback for pages where HTTP fast path returned no content
-                page_html: str
-                if fetched_html is None:
-                    logger.info("browser_fallback", application_id=application_id)
-                    page_html = self.fetcher.fetch_with_browser(url)
-                    browser_fallback_count += 1
-                else:
-                    page_html = fetched_html
-
-                # Parse parts from application page
-                soup = self.html_parser.parse(page_html)
-                parts_data = self.html_parser.extract_parts_from_application_page(soup)
-                parts: list[Part] = self.validator.validate_batch(parts_data)
-                self.parts_scraped += len(parts)
-
-                # Group parts by vehicle qualifiers (engine + aspiration + qualifiers)
-                # Create separate Vehicle objects for each unique qualifier combination
-                qualifier_groups: dict[str, tuple[dict[str, Any], list[Part]]] = {}
-                for part, part_dict in zip(parts, parts_data, strict=True):
-                    vehicle_qualifiers = part_dict.get("vehicle_qualifiers", {})
-
-                    # Create unique key from qualifiers
-                    engine = vehicle_qualifiers.get("engine") or ""
-                    aspiration = vehicle_qualifiers.get("aspiration") or ""
-                    quals = "|".join(vehicle_qualifiers.get("qualifiers", []))
-                    qualifier_key = f"{engine}::{aspiration}::{quals}"
-
-                    if qualifier_key not in qualifier_groups:
-                        qualifier_groups[qualifier_key] = (vehicle_qualifiers, [])
-                    qualifier_groups[qualifier_key][1].append(part)
-
-                # Track compatibility for each qualifier variant
-                for _qualifier_key, (
-                    vehicle_qualifiers,
-                    qualifier_parts,
-                ) in qualifier_groups.items():
-                    # Create vehicle with specific qualifiers
-                    vehicle = self._create_vehicle_from_config(config, vehicle_qualifiers)
-
-                    # Deduplicate and track compatibility (last-write-wins)
-                    result = self._deduplicate_and_track(
-                        qualifier_parts, vehicle, previous_hashes or None
+        # Fresh log per run, seeded with any IDs restored from the checkpoint
+        self._open_processed_log(self._checkpoint_filter_str(make_filter, year_filter))
+        try:
+            # Phase 2: Batch-fetch application pages concurrently, then process sequentially
+            new_skus_found: set[str] = set()
+            changed_skus_found: set[str] = set()
+            applications_processed = 0
+            applications_failed = 0
+            browser_fallback_count = 0
+
+            # Step A: Async batch fetch all application pages (HTTP fast path)
+            urls = [
+                f"https://csf.mycarparts.com/applications/{c['application_id']}" for c in hierarchy
+            ]
+            html_results: list[str | None] = []
+            if urls:
+                html_results = run_async(self.fetcher.async_scrape_application_pages(urls))
+
+            # Step A2: Render pages the HTTP fast path could not serve with a pool
+            # of browser contexts; pages still missing are retried one at a time
+            # in Step B so that their failures are recorded
+            browser_fallback_count += self._render_with_browser_pool(urls, html_results)
+
+            # Step B: Sequential processing (dedup, qualifier grouping, checkpoints)
+            last_checkpoint_at = time.monotonic()
+            for idx, (config, fetched_html) in enumerate(
+                zip(hierarchy, html_results, strict=True), 1
+            ):
+                application_id = config["application_id"]
+                url = f"https://csf.mycarparts.com/applications/{application_id}"
+
+                if idx == 1 or idx % _PROGRESS_LOG_EVERY == 0 or idx == len(hierarchy):
+                    logger.info(
+                        "processing_application",
+                        progress=f"{idx}/{len(hierarchy)}",
+                        vehicle=f"{config['year']} {config['make']} {config['model']}",
+                        application_id=application_id,
                     )
-                    new_skus_found.update(result.new_skus)
-                    changed_skus_found.update(result.changed_skus)
-
-                # Mark as processed
-                self.processed_application_ids.add(application_id)
-                applications_processed += 1
-
-                # Save checkpoint periodically
-                if applications_processed % checkpoint_interval == 0:
-                    self._save_checkpoint(make_filter, year_filter)
-
-                    # Export incrementally if configured
-                    if self.incremental:
-                        logger.info("exporting_incrementally")
-                        self.export_data()
 
-                    # Check time budget after checkpoint save
-                    if budget.is_expired:
-                        remaining = len(hierarchy) - idx
-                        self._raise_time_budget(
-                            budget, "application", applications_processed, remaining
+                try:
+                    # Browser fallback for pages where HTTP fast path returned no content
+                    page_html: str
+                    if fetched_html is None:
+                        logger.info("browser_fallback", application_id=application_id)
+                        page_html = self.fetcher.fetch_with_browser(url)
+                        browser_fallback_count += 1
+                    else:
+                        page_html = fetched_html
+
+                    # Parse parts from application page
+                    soup = self.html_parser.parse(page_html)
+                    parts_data = self.html_parser.extract_parts_from_application_page(soup)
+                    parts: list[Part] = self.validator.validate_batch(parts_data)
+                    self.parts_scraped += len(parts)
+
+                    # Group parts by vehicle qualifiers (engine + aspiration + qualifiers)
+                    # Create separate Vehicle objects for each unique qualifier combination
+                    qualifier_groups: dict[str, tuple[dict[str, Any], list[Part]]] = {}
+                    for part, part_dict in zip(parts, parts_data, strict=True):
+                        vehicle_qualifiers = part_dict.get("vehicle_qualifiers", {})
+
+                        # Create unique key from qualifiers
+                        engine = vehicle_qualifiers.get("engine") or ""
+                        aspiration = vehicle_qualifiers.get("aspiration") or ""
+                        quals = "|".join(vehicle_qualifiers.get("qualifiers", []))
+                        qualifier_key = f"{engine}::{aspiration}::{quals}"
+
+                        if qualifier_key not in qualifier_groups:
+                            qualifier_groups[qualifier_key] = (vehicle_qualifiers, [])
+                        qualifier_groups[qualifier_key][1].append(part)
+
+                    # Track compatibility for each qualifier variant
+                    for _qualifier_key, (
+                        vehicle_qualifiers,
+                        qualifier_parts,
+                    ) in qualifier_groups.items():
+                        # Create vehicle with specific qualifiers
+                        vehicle = self._create_vehicle_from_config(config, vehicle_qualifiers)
+
+                        # Deduplicate and track compatibility (last-write-wins)
+                        result = self._deduplicate_and_track(
+                            qualifier_parts, vehicle, previous_hashes or None
                         )
+                        new_skus_found.update(result.new_skus)
+                        changed_skus_found.update(result.changed_skus)
+
+                    # Mark as processed
+                    self._mark_processed(application_id)
+                    applications_processed += 1
+
+                    # Save checkpoint periodically; intervals that come too soon after
+                    # the last checkpoint are folded into the next one (Phase 2 always
+                    # ends with a checkpoint)
+                    if applications_processed % checkpoint_interval == 0 and (
+                        time.monotonic() - last_checkpoint_at >= _CHECKPOINT_MIN_SECONDS
+                        or budget.is_expired
+                    ):
+                        self._save_checkpoint(make_filter, year_filter)
+                        last_checkpoint_at = time.monotonic()
+
+                        # Export incrementally if configured
+                        if self.incremental:
+                            logger.info("exporting_incrementally")
+                            self._append_export_logs()
+
+                        # Check time budget after checkpoint save
+                        if budget.is_expired:
+                            remaining = len(hierarchy) - idx
+                            self._raise_time_budget(
+                                budget, "application", applications_processed, remaining
+                            )
 
-            except TimeBudgetExpired:
-                raise
-            except Exception as e:
-                applications_failed += 1
-                self.failure_tracker.record(
-                    phase="application",
-                    identifier=str(application_id),
-                    error_type=type(e).__name__,
-                    error_message=str(e),
-                )
-                logger.exception(
-                    "application_scrape_failed",
-                    application_id=application_id,
-                    error=str(e),
-                    error_type=type(e).__name__,
-                )
-                continue
-
-        logger.info(
-            "workflow_phase_2_complete",
-            applications_processed=applications_processed,
-            applications_failed=applications_failed,
-            browser_fallback_count=browser_fallback_count,
-            unique_parts=len(self.unique_parts),
-            new_skus=len(new_skus_found),
-            changed_skus=len(changed_skus_found),
-        )
-
-        # Store change tracking on instance for delta exports
-        self.new_skus.update(new_skus_found)
-        self.changed_skus.update(changed_skus_found)
-
-        # Log incremental summary if we loaded a previous export
-        if previous_hashes:
-            preserved_skus = set(previous_hashes.keys()) - new_skus_found - changed_skus_found
-            logger.info(
-                "incremental_summary",
-                new=len(new_skus_found),
-                changed=len(changed_skus_found),
-                preserved=len(preserved_skus),
-            )
+                except TimeBudgetExpired:
+                    raise
+                except Exception as e:
+                    applications_failed += 1
+                    self.failure_tracker.record(
+                        phase="application",
+                        identifier=str(application_id),
+                        error_type=type(e).__name__,
+                        error_message=str(e),
+                    )
+                    logger.exception(
+                        "application_scrape_failed",
+                        application_id=application_id,
+                        error=str(e),
+                        error_type=type(e).__name__,
+                    )
+                    continue
 
-        # Save final checkpoint
-        self._save_checkpoint(make_filter, year_filter)
-
-        # Check time budget before starting Phase 3
-        if budget.is_expired:
-            self._raise_time_budget(budget, "before_phase_3", applications_processed)
-
-        # Release Playwright's event loop so asyncio.run() works in Phase 3.
-        # The browser may have been started during Phase 2 browser fallbacks.
-        self.fetcher.close_browser()
-
-        # Phase 3: Batch-fetch detail pages concurrently, then enrich sequentially
-        details_fetched_count = 0
-        details_skipped_unchanged = 0
-        details_failed = 0
-        detail_browser_fallback_count = 0
-        if fetch_details:
-            # Always fetch all SKUs — content hashing detects which ones
-            # actually changed, so unchanged detail pages are skipped cheaply.
-            skus_to_fetch = set(self.unique_parts.keys())
             logger.info(
-                "workflow_phase_3_started",
-                total_skus=len(skus_to_fetch),
+                "workflow_phase_2_complete",
+                applications_processed=applications_processed,
+                applications_failed=applications_failed,
+                browser_fallback_count=browser_fallback_count,
+                unique_parts=len(self.unique_parts),
+                new_skus=len(new_skus_found),
+                changed_skus=len(changed_skus_found),
             )
 
-            if skus_to_fetch:
-                sku_list = sorted(skus_to_fetch)
-
-                # Fetch and process in batches to avoid S3 presigned URL
-                # expiry.  CSF's S3 URLs expire after 10 minutes; processing
-                # ~1.8 s/SKU (incl. image download + AVIF conversion) means
-                # a batch of 200 finishes in ~6 min.
-                detail_batch_size = 200
-                for batch_start in range(0, len(sku_list), detail_batch_size):
-                    batch_skus = sku_list[batch_start : batch_start + detail_batch_size]
-                    batch_urls = [
-                        "https://csf.autocaredata.com/items/"
-                        + sku.replace("CSF-", "").replace("csf-", "")
-                        for sku in batch_skus
-                    ]
+            # Store change tracking on instance for delta exports
+            self.new_skus.update(new_skus_found)
+            self.changed_skus.update(changed_skus_found)
 
-                    logger.info(
-                        "detail_batch_fetch",
-                        batch=batch_start // detail_batch_size + 1,
-                        batch_size=len(batch_skus),
-                        total=len(sku_list),
-                    )
+            # Log incremental summary if we loaded a previous export
+            if previous_hashes:
+                preserved_skus = set(previous_hashes.keys()) - new_skus_found - changed_skus_found
+                logger.info(
+                    "incremental_summary",
+                    new=len(new_skus_found),
+                    changed=len(changed_skus_found),
+                    preserved=len(preserved_skus),
+                )
 
-                    batch_html_results = asyncio.run(
-                        self.fetcher.async_fetch_detail_pages(batch_urls)
-                    )
+            # Save final checkpoint
+            self._save_checkpoint(make_filter, year_filter)
+
+            # Check time budget before starting Phase 3
+            if budget.is_expired:
+                self._raise_time_budget(budget, "before_phase_3", applications_processed)
+
+            # Phase 3: Batch-fetch detail pages concurrently, then enrich sequentially
+            details_fetched_count = 0
+            details_skipped_unchanged = 0
+            details_failed = 0
+            detail_browser_fallback_count = 0
+            if fetch_details:
+                # Always fetch all SKUs — content hashing detects which ones
+                # actually changed, so unchanged detail pages are skipped cheaply.
+                skus_to_fetch = set(self.unique_parts.keys())
+                logger.info(
+                    "workflow_phase_3_started",
+                    total_skus=len(skus_to_fetch),
+                )
 
-                    for sku, detail_url, fetched_html in zip(
-                        batch_skus, batch_urls, batch_html_results, strict=True
-                    ):
-                        try:
-                            # Browser fallback for pages where HTTP returned no content
-                            detail_html: str
-                            if fetched_html is None:
-                                logger.info("detail_browser_fallback", sku=sku)
-                                detail_html = self.fetcher.fetch_with_browser(detail_url)
-                                # Release Playwright so the next batch's asyncio.run() works
-                                self.fetcher.close_browser()
-                                detail_browser_fallback_count += 1
-                            else:
-                                detail_html = fetched_html
-
-                            # Content-hash change detection: skip enrichment
-                            # for detail pages that haven't changed since last run.
-                            # Normalize out volatile content (CSRF tokens, presigned
-                            # S3 URL params) so hashes are stable across requests.
-                            normalized = self._normalize_detail_html(detail_html)
-                            current_hash = hashlib.md5(  # noqa: S324
-                                normalized.encode()
-                            ).hexdigest()
-                            prev_hash = self.detail_etag_store.get(detail_url)
-                            self.detail_etag_store.set(detail_url, current_hash)
-
-                            if prev_hash == current_hash and not force_full:
-                                details_skipped_unchanged += 1
-                                logger.debug("detail_page_unchanged", sku=sku, url=detail_url)
-                                # Page content unchanged, but image bytes may have
-                                # been replaced at the same URL.  Run image processor
-                                # only — it uses source-hash comparison to detect
-                                # changed content and skips unchanged images cheaply.
-                                soup = self.html_parser.parse(detail_html)
-                                images = self.html_parser.extract_gallery_images(soup)
-                                if images:
-                                    self.image_processor.process_images(sku, images)
-                                    image_syncer = getattr(self, "image_syncer", None)
-                                    if image_syncer is not None:
-                                        image_syncer.sync_and_cleanup_for_sku(sku)
-                                continue
-
-                            # Parse and enrich (full processing for changed pages)
-                            soup = self.html_parser.parse(detail_html)
-                            detail_data = self.html_parser.extract_detail_page_data(soup, sku)
-                            self._enrich_part_with_details(sku, detail_data)
-                            details_fetched_count += 1
-
-                            # Stream-sync images for this SKU if syncer is configured
-                            image_syncer = getattr(self, "image_syncer", None)
-                            if image_syncer is not None:
-                                image_syncer.sync_and_cleanup_for_sku(sku)
-                        except Exception as e:
-                            details_failed += 1
-                            self.failure_tracker.record(
-                                phase="detail",
-                                identifier=sku,
-                                error_type=type(e).__name__,
-                                error_message=str(e),
-                            )
-                            logger.exception(
-                                "detail_fetch_failed",
-                                sku=sku,
-                                error=str(e),
-                                error_type=type(e).__name__,
-                            )
-                        continue
+                if skus_to_fetch:
+                    sku_list = sorted(skus_to_fetch)
+
+                    # Fetch and process in batches to avoid S3 presigned URL
+                    # expiry.  CSF's S3 URLs expire after 10 minutes; processing
+                    # ~1.8 s/SKU (incl. image download + AVIF conversion) means
+                    # a batch of 200 finishes in ~6 min.
+                    detail_batch_size = 200
+                    for batch_start in range(0, len(sku_list), detail_batch_size):
+                        batch_skus = sku_list[batch_start : batch_start + detail_batch_size]
+                        batch_urls = [
+                            "https://csf.autocaredata.com/items/"
+                            + sku.replace("CSF-", "").replace("csf-", "")
+                            for sku in batch_skus
+                        ]
+
+                        logger.info(
+                            "detail_batch_fetch",
+                            batch=batch_start // detail_batch_size + 1,
+                            batch_size=len(batch_skus),
+                            total=len(sku_list),
+                        )
 
-                # Persist detail page hashes for next run
-                self.detail_etag_store.save()
+                        batch_html_results = run_async(
+                            self.fetcher.async_fetch_detail_pages(batch_urls)
+                        )
+                        # Pages left for the browser are rendered concurrently;
+                        # any still missing fall back to one-at-a-time below
+                        detail_browser_fallback_count += self._render_with_browser_pool(
+                            batch_urls, batch_html_results
+                        )
 
-                # Save checkpoint after Phase 3 so enriched data (images,
-                # descriptions) persists across CI runs.
-                self._save_checkpoint(make_filter, year_filter)
+                        for sku, detail_url, fetched_html in zip(
+                            batch_skus, batch_urls, batch_html_results, strict=True
+                        ):
+                            try:
+                                # Browser fallback for pages where HTTP returned no content
+                                detail_html: str
+                                if fetched_html is None:
+                                    logger.info("detail_browser_fallback", sku=sku)
+                                    detail_html = self.fetcher.fetch_with_browser(detail_url)
+                                    detail_browser_fallback_count += 1
+                                else:
+                                    detail_html = fetched_html
+
+                                # Content-hash change detection: skip enrichment
+                                # for detail pages that haven't changed since last run.
+                                # Normalize out volatile content (CSRF tokens, presigned
+                                # S3 URL params) so hashes are stable across requests.
+                                normalized = self._normalize_detail_html(detail_html)
+                                current_hash = hashlib.md5(  # noqa: S324
+                                    normalized.encode()
+                                ).hexdigest()
+                                prev_hash = self.detail_etag_store.get(detail_url)
+                                self.detail_etag_store.set(detail_url, current_hash)
+
+                                if prev_hash == current_hash and not force_full:
+                                    details_skipped_unchanged += 1
+                                    logger.debug("detail_page_unchanged", sku=sku, url=detail_url)
+                                    # Page content unchanged, but image bytes may have
+                                    # been replaced at the same URL.  Run image processor
+                                    # only — it uses source-hash comparison to detect
+                                    # changed content and skips unchanged images cheaply.
+                                    soup = self.html_parser.parse(detail_html)
+                                    images = self.html_parser.extract_gallery_images(soup)
+                                    if images:
+                                        self.image_processor.process_images(sku, images)
+                                        image_syncer = getattr(self, "image_syncer", None)
+                                        if image_syncer is not None:
+                                            image_syncer.sync_and_cleanup_for_sku(sku)
+                                    continue
+
+                                # Parse and enrich (full processing for changed pages)
+                                soup = self.html_parser.parse(detail_html)
+                                detail_data = self.html_parser.extract_detail_page_data(soup, sku)
+                                self._enrich_part_with_details(sku, detail_data)
+                                details_fetched_count += 1
+
+                                # Stream-sync images for this SKU if syncer is configured
+                                image_syncer = getattr(self, "image_syncer", None)
+                                if image_syncer is not None:
+                                    image_syncer.sync_and_cleanup_for_sku(sku)
+                            except Exception as e:
+                                details_failed += 1
+                                self.failure_tracker.record(
+                                    phase="detail",
+                                    identifier=sku,
+                                    error_type=type(e).__name__,
+                                    error_message=str(e),
+                                )
+                                logger.exception(
+                                    "detail_fetch_failed",
+                                    sku=sku,
+                                    error=str(e),
+                                    error_type=type(e).__name__,
+                                )
+                            continue
+
+                    # Persist detail page hashes for next run
+                    self.detail_etag_store.save()
+
+                    # Save checkpoint after Phase 3 so enriched data (images,
+                    # descriptions) persists across CI runs.
+                    self._save_checkpoint(make_filter, year_filter)
 
-                logger.info(
-                    "workflow_phase_3_complete",
-                    parts_enriched=details_fetched_count,
-                    details_skipped_unchanged=details_skipped_unchanged,
-                    details_failed=details_failed,
-                    detail_browser_fallback_count=detail_browser_fallback_count,
-                )
+                    logger.info(
+                        "workflow_phase_3_complete",
+                        parts_enriched=details_fetched_count,
+                        details_skipped_unchanged=details_skipped_unchanged,
+                        details_failed=details_failed,
+                        detail_browser_fallback_count=detail_browser_fallback_count,
+                    )
+        finally:
+            self._close_processed_log()
 
         # Compile statistics
         stats: dict[str, Any] = {
@@ -1605,7 +1932,7 @@ class ScraperOrchestrator:
             "parts_scraped": self.parts_scraped,
             "new_parts": len(new_skus_found),
             "changed_parts": len(changed_skus_found),
-            "vehicles_tracked": sum(len(v) for v in self.vehicle_compat.values()),
+            "vehicles_tracked": sum(map(len, self.vehicle_compat.values())),
             "make_filter": make_filter,
             "year_filter": year_filter,
             "details_fetched": fetch_details,
@@ -1691,6 +2018,11 @@ class ScraperOrchestrator:
     def export_data(self) -> dict[str, Path]:
         """Export scraped data to JSON files.
 
+        In incremental mode, appending to existing exports only sends the
+        parts and compatibility mappings that changed since this
+        orchestrator's previous export_data() call. Checkpoint exports during
+        a scrape go to the JSON Lines logs instead (see _append_export_logs).
+
         Returns:
             Dict mapping export type to file path
 
@@ -1706,28 +2038,113 @@ class ScraperOrchestrator:
 
         # Export parts
         if self.unique_parts:
-            parts_list = list(self.unique_parts.values())
             if self.incremental and self._has_previous_export():
+                # Append only parts added or replaced since the last export
+                parts_list = self._parts_changed_since(self._exported_parts)
                 paths["parts"] = self.exporter.export_parts_incremental(parts_list, append=True)
             else:
+                parts_list = list(self.unique_parts.values())
                 paths["parts"] = self.exporter.export_parts(parts_list)
+            if self.incremental:
+                self._exported_parts.update((part.sku, part) for part in parts_list)
 
         # Export compatibility
         if self.vehicle_compat:
-            compat_list = [
-                VehicleCompatibility(part_sku=sku, vehicles=vehicles, notes=None)
-                for sku, vehicles in self.vehicle_compat.items()
-            ]
             if self.incremental and (self.exporter.output_dir / "compatibility.json").exists():
+                # Append only mappings that gained vehicles since the last export
+                compat_list = self._compat_changed_since(self._exported_compat_sizes)
                 paths["compatibility"] = self.exporter.export_compatibility_incremental(
                     compat_list, append=True
                 )
             else:
+                compat_list = [
+                    VehicleCompatibility(part_sku=sku, vehicles=vehicles, notes=None)
+                    for sku, vehicles in self.vehicle_compat.items()
+                ]
                 paths["compatibility"] = self.exporter.export_compatibility(compat_list)
+            if self.incremental:
+                self._exported_compat_sizes.update(
+                    (compat.part_sku, len(self.vehicle_compat[compat.part_sku]))
+                    for compat in compat_list
+                )
+
+        # The JSON exports now hold everything the logs recorded
+        if self.incremental:
+            self._reset_export_logs()
 
         logger.info("export_completed", files=list(paths.keys()))
         return paths
 
+    def _append_export_logs(self) -> dict[str, Path]:
+        """Append parts and mappings changed since the last call to the JSON Lines logs.
+
+        Periodic exports during an incremental scrape use this instead of
+        export_data(), whose append mode re-reads and rewrites parts.json and
+        compatibility.json at every checkpoint. Each call here only writes the
+        new lines. The final export_data() call still merges the whole run into
+        the JSON exports, and JSONExporter.jsonl_to_json() can rebuild them
+        from the logs after a crash. The logs hold one run at most: they are
+        reset when an incremental scrape starts and after export_data().
+
+        Returns:
+            Dict mapping export type to JSON Lines file path, for the types
+            that had changes to append
+        """
+        paths: dict[str, Path] = {}
+
+        parts_list = self._parts_changed_since(self._logged_parts)
+        if parts_list:
+            paths["parts"] = self.exporter.export_parts_jsonl(parts_list)
+            self._logged_parts.update((part.sku, part) for part in parts_list)
+
+        compat_list = self._compat_changed_since(self._logged_compat_sizes)
+        if compat_list:
+            paths["compatibility"] = self.exporter.export_compatibility_jsonl(compat_list)
+            self._logged_compat_sizes.update(
+                (compat.part_sku, len(self.vehicle_compat[compat.part_sku]))
+                for compat in compat_list
+            )
+
+        logger.info(
+            "export_logs_appended",
+            parts=len(parts_list),
+            compatibility=len(compat_list),
+        )
+        return paths
+
+    def _reset_export_logs(self) -> None:
+        """Delete the JSON Lines logs and forget what was appended to them."""
+        self.exporter.remove_jsonl("parts.jsonl")
+        self.exporter.remove_jsonl("compatibility.jsonl")
+        self._logged_parts = {}
+        self._logged_compat_sizes = {}
+
+    def _parts_changed_since(self, seen_parts: dict[str, Part]) -> list[Part]:
+        """List parts added or replaced since they were last recorded in seen_parts.
+
+        Args:
+            seen_parts: Part object per SKU as of the last export
+
+        Returns:
+            Parts whose object differs from the recorded one, in insertion order
+        """
+        return [part for sku, part in self.unique_parts.items() if seen_parts.get(sku) is not part]
+
+    def _compat_changed_since(self, seen_sizes: dict[str, int]) -> list[VehicleCompatibility]:
+        """List compatibility mappings that gained vehicles since seen_sizes was recorded.
+
+        Args:
+            seen_sizes: Compatibility-list length per SKU as of the last export
+
+        Returns:
+            VehicleCompatibility for every SKU whose vehicle count changed
+        """
+        return [
+            VehicleCompatibility(part_sku=sku, vehicles=vehicles, notes=None)
+            for sku, vehicles in self.vehicle_compat.items()
+            if seen_sizes.get(sku) != len(vehicles)
+        ]
+
     def export_complete(self) -> Path:
         """Export merged parts with inline vehicle compatibility.
 
@@ -1785,11 +2202,12 @@ class ScraperOrchestrator:
         return {
             "unique_parts": len(self.unique_parts),
             "parts_scraped": self.parts_scraped,
-            "vehicles_tracked": sum(len(v) for v in self.vehicle_compat.values()),
+            "vehicles_tracked": sum(map(len, self.vehicle_compat.values())),
         }
 
     def close(self) -> None:
         """Clean up resources."""
+        self._close_processed_log()
         self.image_processor.close()
         self.fetcher.close()
         logger.info("orchestrator_closed")
@@ -7,12 +7,25 @@ Follows Single Responsibility Principle - only concerned with parsing HTML.
 import re
 from typing import Any, ClassVar
 
+import soupsieve
 import structlog
 from bs4 import BeautifulSoup, NavigableString, Tag
 
 logger = structlog.get_logger()
 
 
+def _compile_all(patterns: tuple[str, ...]) -> tuple[re.Pattern[str], ...]:
+    """Compile case-insensitive regexes once, keeping their order.
+
+    Args:
+        patterns: Regex sources, in the order they are applied
+
+    Returns:
+        Compiled patterns
+    """
+    return tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns)
+
+
 class HTMLParser:
     """HTML parser using BeautifulSoup.
 
@@ -170,6 +183,19 @@ class CSFParser(HTMLParser):
     Follows Open/Closed Principle - extended, not modified.
     """
 
+    # CSS selectors run once per page or per part container, compiled once;
+    # Tag.select() rebuilds the namespace and cache-key arguments on every call
+    _ROW_APP_SELECTOR: ClassVar[soupsieve.SoupSieve] = soupsieve.compile(".row.app")
+    _PANEL_SELECTOR: ClassVar[soupsieve.SoupSieve] = soupsieve.compile("div.panel")
+    _H4_LINK_SELECTOR: ClassVar[soupsieve.SoupSieve] = soupsieve.compile("h4 a")
+    _PANEL_HEADER_H4_SELECTOR: ClassVar[soupsieve.SoupSieve] = soupsieve.compile(".panel-header h4")
+    _CONTAINER_SPEC_ROWS_SELECTOR: ClassVar[soupsieve.SoupSieve] = soupsieve.compile(
+        "table.table-borderless tbody tr"
+    )
+    _PAGE_SPEC_ROWS_SELECTOR: ClassVar[soupsieve.SoupSieve] = soupsieve.compile(
+        ".row.app table.table-borderless tbody tr"
+    )
+
     def extract_parts_from_application_page(self, soup: BeautifulSoup) -> list[dict[str, Any]]:
         """Extract all parts from an application page.
 
@@ -189,13 +215,25 @@ class CSFParser(HTMLParser):
         logger.info("extracting_all_parts_from_application_page")
 
         parts_data: list[dict[str, Any]] = []
-        part_containers = soup.select(".row.app")
+        part_containers = self._ROW_APP_SELECTOR.select(soup)
 
         logger.debug("found_part_containers", count=len(part_containers))
 
+        # Read each category panel's header once and hand it to the containers
+        # inside. Panels come in document order, so a nested panel overrides its
+        # ancestor and every container ends up with its nearest panel's category.
+        container_categories: dict[int, str | None] = {}
+        for panel in self._PANEL_SELECTOR.select(soup):
+            category_h4 = self._PANEL_HEADER_H4_SELECTOR.select_one(panel)
+            category = category_h4.get_text(strip=True) if category_h4 else None
+            for container in self._ROW_APP_SELECTOR.select(panel):
+                container_categories[id(container)] = category
+
         for idx, container in enumerate(part_containers, 1):
             try:
-                part_data = self._extract_single_part_from_container(container)
+                part_data = self._extract_single_part_from_container(
+                    container, container_categories.get(id(container))
+                )
                 parts_data.append(part_data)
                 logger.debug(
                     "part_extracted_from_container",
@@ -214,11 +252,16 @@ class CSFParser(HTMLParser):
         logger.info("application_page_extraction_complete", parts_found=len(parts_data))
         return parts_data
 
-    def _extract_single_part_from_container(self, container: Tag) -> dict[str, Any]:
+    def _extract_single_part_from_container(
+        self,
+        container: Tag,
+        category: str | None = None,
+    ) -> dict[str, Any]:
         """Extract part data from a single .row.app container.
 
         Args:
             container: BeautifulSoup Tag for .row.app element
+            category: Header text of the container's category panel, if any
 
         Returns:
             Dict of part data including engine qualifier
@@ -226,38 +269,34 @@ class CSFParser(HTMLParser):
         Raises:
             ValueError: If required fields are missing
         """
-        # Extract SKU from h4 a link
-        sku_link = container.select_one("h4 a")
+        # Plain tree walks (find) rather than CSS selector matching for the
+        # per-container lookups
+        h4 = container.find("h4")
+
+        # Extract SKU from h4 a link; only a first h4 without a link needs the
+        # full "h4 a" selector
+        sku_link = h4.find("a") if isinstance(h4, Tag) else None
+        if sku_link is None and h4 is not None:
+            sku_link = self._H4_LINK_SELECTOR.select_one(container)
         sku = sku_link.get_text(strip=True) if sku_link else None
 
         # Extract part name (text after " - " in h4)
-        h4 = container.select_one("h4")
         full_text = h4.get_text(strip=True) if h4 else ""
         name = full_text.split(" - ", 1)[1] if " - " in full_text else full_text
 
-        # Extract category from parent panel header
-        panel = container.find_parent("div", class_="panel")
-        category = None
-        if panel and isinstance(panel, Tag):
-            category_h4 = panel.select_one(".panel-header h4")
-            category = category_h4.get_text(strip=True) if category_h4 else None
-
         # Extract vehicle qualifiers (engine, aspiration, qualifiers list)
         vehicle_qualifiers = self._extract_vehicle_qualifiers(container)
 
-        # Create temporary soup for extracting specs/images from this container
-        container_soup = BeautifulSoup(str(container), "lxml")
-
         data: dict[str, Any] = {
             "sku": f"CSF-{sku}" if sku and not sku.startswith("CSF-") else sku,
             "name": name,
             "price": None,  # Not available on application pages
             "description": None,  # Not available on application pages
             "category": category or "Unknown",  # Default if not found
-            "specifications": self._extract_specifications(container_soup),
-            "images": self._extract_images(container_soup),
+            "specifications": self._extract_specifications(container),
+            "images": self._extract_images(container),
             "manufacturer": "CSF",
-            "in_stock": self._extract_stock_status(container_soup),
+            "in_stock": self._extract_stock_status(container),
             "vehicle_qualifiers": vehicle_qualifiers,  # Structured qualifiers data
         }
 
@@ -268,6 +307,65 @@ class CSFParser(HTMLParser):
 
         return data
 
+    # Engine-text cleanup passes, compiled once: the cleaners run several
+    # times per part container. Each group is applied in order, since later
+    # passes see the output of earlier ones.
+    _ENGINE_LABEL_PATTERNS: ClassVar[tuple[re.Pattern[str], ...]] = _compile_all(
+        (
+            r"^TRANSMISSION\s+CONTROL\s+TYPE:\s*",
+            r"^ENG\.\s*BASE:\s*",
+            r"^ENGINE:\s*",
+            # "Eng. Version:" label only; the version text (VTEC, Duratec) stays
+            r"Eng\.\s+Version:\s*",
+        )
+    )
+    # Common radiator manufacturers, with optional slash/comma prefix
+    _MANUFACTURER_PATTERNS: ClassVar[tuple[re.Pattern[str], ...]] = _compile_all(
+        tuple(
+            rf"[/,\s]+{mfr}(?:/[A-Z]+)?"
+            for mfr in (
+                "DENSO",
+                "TOYO",
+                "BEHR",
+                "VALEO",
+                "MODINE",
+                "NISSENS",
+                "DELPHI",
+                "MAHLE",
+                "CALSONIC",
+            )
+        )
+    )
+    _DUPLICATE_DISPLACEMENT_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
+        r"(\d+cc)\s+\d+ci", re.IGNORECASE
+    )
+    # Metadata suffixes that shouldn't be in the engine string; each cuts
+    # the text from its first occurrence to the end
+    _ENGINE_CUTOFF_PATTERNS: ClassVar[tuple[re.Pattern[str], ...]] = _compile_all(
+        tuple(
+            rf"\s*{pattern}.*$"
+            for pattern in (
+                r"Body\s+Type:",
+                r"OE\s+Style",
+                r"Use\s+Mini",
+                r"Mini,",
+                r"Micro,",
+                r"\d+\s+psi",
+                r"Radiator\s+&",
+                r"Radiator\s+And",
+                r"Transmission\s+#\s+of\s+Speeds:",
+                r"w/\s*Variable",
+                r"w/o\s*Variable",
+                r"NBR\s+OF\s+DOORS:",
+                r"VALVES\s+PER\s+ENGINE:",
+                r"ITEM\s+DETAIL",
+                r"UPGRADED",
+            )
+        )
+    )
+    _CC_UNIT_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"\b(\d+)CC\b", re.IGNORECASE)
+    _CI_UNIT_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"\b(\d+)CI\b", re.IGNORECASE)
+
     def _clean_engine_text(self, text: str) -> str:
         """Clean engine text by removing junk labels and manufacturers.
 
@@ -293,83 +391,59 @@ class CSFParser(HTMLParser):
             >>> self._clean_engine_text("3.2L V6 3210ccBody Type: CoupeMicro, 16 psi")
             "3.2L V6 3210cc"
         """
-        # Remove common label prefixes
-        text = re.sub(r"^TRANSMISSION\s+CONTROL\s+TYPE:\s*", "", text, flags=re.IGNORECASE)
-        text = re.sub(r"^ENG\.\s*BASE:\s*", "", text, flags=re.IGNORECASE)
-        text = re.sub(r"^ENGINE:\s*", "", text, flags=re.IGNORECASE)
-
-        # Remove "Eng. Version:" label but keep the version text (VTEC, Duratec, EcoBoost)
-        text = re.sub(r"Eng\.\s+Version:\s*", "", text, flags=re.IGNORECASE)
+        # Remove common label prefixes and the "Eng. Version:" label
+        for pattern in self._ENGINE_LABEL_PATTERNS:
+            text = pattern.sub("", text)
 
         # Remove manufacturer names (common radiator manufacturers)
-        manufacturers = [
-            "DENSO",
-            "TOYO",
-            "BEHR",
-            "VALEO",
-            "MODINE",
-            "NISSENS",
-            "DELPHI",
-            "MAHLE",
-            "CALSONIC",
-        ]
-        for mfr in manufacturers:
-            # Remove manufacturer with optional slash/comma prefix
-            text = re.sub(rf"[/,\s]+{mfr}(?:/[A-Z]+)?", "", text, flags=re.IGNORECASE)
+        for pattern in self._MANUFACTURER_PATTERNS:
+            text = pattern.sub("", text)
 
         # Handle duplicate displacement units (1588CC 98CI -> keep 1588cc only)
         # Pattern: Keep the cc value, remove the ci value if both present
         # Look for: digits + cc + space + digits + ci
-        text = re.sub(r"(\d+cc)\s+\d+ci", r"\1", text, flags=re.IGNORECASE)
+        text = self._DUPLICATE_DISPLACEMENT_PATTERN.sub(r"\1", text)
 
         # Remove trailing junk after valid engine info
-        # Cut off at common metadata suffixes that shouldn't be in engine string
-        cutoff_patterns = [
-            r"Body\s+Type:",
-            r"OE\s+Style",
-            r"Use\s+Mini",
-            r"Mini,",
-            r"Micro,",
-            r"\d+\s+psi",
-            r"Radiator\s+&",
-            r"Radiator\s+And",
-            r"Transmission\s+#\s+of\s+Speeds:",
-            r"w/\s*Variable",
-            r"w/o\s*Variable",
-            r"NBR\s+OF\s+DOORS:",
-            r"VALVES\s+PER\s+ENGINE:",
-            r"ITEM\s+DETAIL",
-            r"UPGRADED",
-        ]
-        for pattern in cutoff_patterns:
-            text = re.sub(rf"\s*{pattern}.*$", "", text, flags=re.IGNORECASE)
+        for pattern in self._ENGINE_CUTOFF_PATTERNS:
+            text = pattern.sub("", text)
 
         # Normalize cc/CI to lowercase cc for consistency
-        text = re.sub(r"\b(\d+)CC\b", r"\1cc", text, flags=re.IGNORECASE)
-        text = re.sub(r"\b(\d+)CI\b", r"\1ci", text, flags=re.IGNORECASE)
+        text = self._CC_UNIT_PATTERN.sub(r"\1cc", text)
+        text = self._CI_UNIT_PATTERN.sub(r"\1ci", text)
 
         # Clean up extra whitespace
         text = " ".join(text.split())
 
         return text.strip()
 
-    _QUALIFIER_PATTERNS: ClassVar[list[str]] = [
-        r"(w\/\s*(?:Heavy Duty |Max Duty )?Towing(?:\s+Package)?)",
-        r"(w\/o\s*Towing(?:\s+Package)?)",
-        r"(w\/\s*Tow\s+Package)",
-        r"(w\/o\s*Tow\s+Package)",
-        r"(w\/\s*Off-Road(?:\s+Package)?)",
-        r"(w\/o\s*Off-Road(?:\s+Package)?)",
-        r"(w\/\s*Ambulance(?:\s+Package)?)",
-        r"(w\/o\s*Ambulance(?:\s+Package)?)",
-        r"(w\/\s*Air\s+Conditioning)",
-    ]
+    _QUALIFIER_PATTERNS: ClassVar[tuple[re.Pattern[str], ...]] = _compile_all(
+        (
+            r"(w\/\s*(?:Heavy Duty |Max Duty )?Towing(?:\s+Package)?)",
+            r"(w\/o\s*Towing(?:\s+Package)?)",
+            r"(w\/\s*Tow\s+Package)",
+            r"(w\/o\s*Tow\s+Package)",
+            r"(w\/\s*Off-Road(?:\s+Package)?)",
+            r"(w\/o\s*Off-Road(?:\s+Package)?)",
+            r"(w\/\s*Ambulance(?:\s+Package)?)",
+            r"(w\/o\s*Ambulance(?:\s+Package)?)",
+            r"(w\/\s*Air\s+Conditioning)",
+        )
+    )
+    _ASPIRATION_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
+        r"Aspiration:\s*([^\n]+?)(?:\n|Item Detail|Upgraded|Denso|$)"
+    )
+    _TRANSMISSION_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
+        r"Transmission\s+Control\s+Type:\s*([^\n]+?)(?:\n|Item Detail|Upgraded|Denso|$)"
+    )
+    _ENG_BASE_PATTERN: ClassVar[re.Pattern[str]] = re.compile(
+        r"Eng\.\s*Base:\s*([^\n]+?)"
+        r"(?:\n|Transmission|Fuel Type|Aspiration|Item Detail|Upgraded|Denso|$)"
+    )
 
     def _parse_aspiration(self, text: str, result: dict[str, Any]) -> None:
         """Extract aspiration and EcoBoost qualifier from text."""
-        aspiration_match = re.search(
-            r"Aspiration:\s*([^\n]+?)(?:\n|Item Detail|Upgraded|Denso|$)", text
-        )
+        aspiration_match = self._ASPIRATION_PATTERN.search(text)
         if not aspiration_match:
             return
 
@@ -391,11 +465,7 @@ class CSFParser(HTMLParser):
 
     def _parse_transmission(self, text: str, result: dict[str, Any]) -> None:
         """Extract transmission qualifier from text."""
-        transmission_match = re.search(
-            r"Transmission\s+Control\s+Type:\s*([^\n]+?)"
-            r"(?:\n|Item Detail|Upgraded|Denso|$)",
-            text,
-        )
+        transmission_match = self._TRANSMISSION_PATTERN.search(text)
         if not transmission_match:
             return
 
@@ -412,7 +482,7 @@ class CSFParser(HTMLParser):
     def _collect_qualifier_matches(self, text: str, qualifiers: list[str]) -> None:
         """Find qualifier patterns (w/ Package, w/o Package) in text."""
         for pattern in self._QUALIFIER_PATTERNS:
-            for match in re.findall(pattern, text, re.IGNORECASE):
+            for match in pattern.findall(text):
                 if match and match not in qualifiers:
                     qualifiers.append(match)
 
@@ -439,11 +509,7 @@ class CSFParser(HTMLParser):
         }
 
         # 1. Extract clean engine spec (Eng. Base)
-        eng_base_pattern = (
-            r"Eng\.\s*Base:\s*([^\n]+?)"
-            r"(?:\n|Transmission|Fuel Type|Aspiration|Item Detail|Upgraded|Denso|$)"
-        )
-        eng_base_match = re.search(eng_base_pattern, text)
+        eng_base_match = self._ENG_BASE_PATTERN.search(text)
         if eng_base_match:
             eng_base = self._clean_engine_text(eng_base_match.group(1).strip())
             if eng_base:
@@ -470,6 +536,57 @@ class CSFParser(HTMLParser):
 
         return result
 
+    _UNIT_BOUNDARY_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"(cc|ci)([A-Z])")
+    # Case-insensitive substitutions, applied in order when cleaning an engine spec
+    _ENGINE_SPEC_SUBSTITUTIONS: ClassVar[tuple[tuple[re.Pattern[str], str], ...]] = tuple(
+        (re.compile(pattern, re.IGNORECASE), replacement)
+        for pattern, replacement in (
+            # Aspiration-related text (should be in aspiration field)
+            (r"Turbocharged", ""),
+            (r"Supercharged", ""),
+            (r"Naturally Aspirated", ""),
+            (r"EcoBoost", ""),
+            (r"w\/\s*EcoBoost(?:\s+Engine)?", ""),
+            # Fuel type info (should be in fuel_type field)
+            (r"Fuel Type:\s*\w+", ""),
+            # Radiator position info
+            (r"(?:Primary|Secondary)\s+Radiator", ""),
+            # Duty level info (Std/Heavy/Max Duty) — product specs, not
+            # vehicle qualifiers. "w/ Max Duty Towing" is extracted
+            # separately. No trailing \b: "Duty" may abut "w/" directly.
+            (r"\b(?:Std|Standard|Heavy|Max)\s+Duty", ""),
+            (r"Multi-fit\s+Model", ""),
+            # "Pkg" prefix/suffix
+            (r"\s*Pkg\s*", " "),
+            # Vehicle qualifiers (these are extracted separately)
+            (r"w\/\s*(?:Heavy Duty |Max Duty )?Towing(?:\s+Package)?", ""),
+            (r"w\/o\s*Towing(?:\s+Package)?", ""),
+            (r"w\/\s*Off-Road(?:\s+Package)?", ""),
+            (r"w\/o\s*Off-Road(?:\s+Package)?", ""),
+            (r"w\/\s*Ambulance(?:\s+Package)?", ""),
+            (r"w\/o\s*Ambulance(?:\s+Package)?", ""),
+            (r"w\/\s*Air\s+Conditioning", ""),
+            (r"w\/\s*Tow\s+Package", ""),
+            (r"w\/o\s*Tow\s+Package", ""),
+            # Common product specs
+            (r"w\/\s*SUB COOL[^w]*", ""),
+            (r"w\/\s*Heavy Duty Cooling[^w]*", ""),
+            (r"w\/\s*Standard Duty Cooling[^w]*", ""),
+            (r"w\/\s*\d+\s*Plate[^w]*", ""),
+            (r"w\/\s*Plate\s+Type[^w]*", ""),
+            (r"w\/\s*Built-In Oil Cooler[^w]*", ""),
+            (r"OE\s+\d+mm[^w]*", ""),
+            (r"\d+%\s+(?:Stronger|Thicker)[^w]*", ""),
+            (r"High-Efficiency[^w]*", ""),
+            (r"B-Tube Technology[^w]*", ""),
+            (r"Includes\s+[^w]+", ""),
+            (r"w\/\s*\d+\s+Speed", ""),
+            (r"w\/\s*\d+\s+Plate", ""),
+        )
+    )
+    _TRAILING_WITH_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"\s*w\/o?\s*$")
+    _WHITESPACE_RUN_PATTERN: ClassVar[re.Pattern[str]] = re.compile(r"\s+")
+
     def _extract_clean_engine_spec(self, eng_text: str) -> str:
         """Extract just the clean engine specification.
 
@@ -486,77 +603,17 @@ class CSFParser(HTMLParser):
             '2.0L L4 1993cc'
         """
         # Fix missing spaces (e.g., "3343ccMax Duty" → "3343cc Max Duty")
-        cleaned = re.sub(r"(cc|ci)([A-Z])", r"\1 \2", eng_text)
-
-        # Remove aspiration-related text (should be in aspiration field)
-        aspiration_patterns = [
-            r"Turbocharged",
-            r"Supercharged",
-            r"Naturally Aspirated",
-            r"EcoBoost",
-            r"w\/\s*EcoBoost(?:\s+Engine)?",
-        ]
-        for pattern in aspiration_patterns:
-            cleaned = re.sub(pattern, "", cleaned, flags=re.IGNORECASE)
-
-        # Remove fuel type info (should be in fuel_type field)
-        cleaned = re.sub(r"Fuel Type:\s*\w+", "", cleaned, flags=re.IGNORECASE)
-
-        # Remove radiator position info
-        cleaned = re.sub(r"(?:Primary|Secondary)\s+Radiator", "", cleaned, flags=re.IGNORECASE)
-
-        # Remove duty level info (Std/Heavy/Max Duty) — product specs,
-        # not vehicle qualifiers. "w/ Max Duty Towing" is extracted
-        # separately. No trailing \b: "Duty" may abut "w/" directly.
-        cleaned = re.sub(r"\b(?:Std|Standard|Heavy|Max)\s+Duty", "", cleaned, flags=re.IGNORECASE)
-
-        # Remove "Multi-fit Model"
-        cleaned = re.sub(r"Multi-fit\s+Model", "", cleaned, flags=re.IGNORECASE)
-
-        # Remove "Pkg" prefix/suffix
-        cleaned = re.sub(r"\s*Pkg\s*", " ", cleaned, flags=re.IGNORECASE)
-
-        # First, remove vehicle qualifiers (these will be extracted separately)
-        vehicle_qualifier_patterns = [
-            r"w\/\s*(?:Heavy Duty |Max Duty )?Towing(?:\s+Package)?",
-            r"w\/o\s*Towing(?:\s+Package)?",
-            r"w\/\s*Off-Road(?:\s+Package)?",
-            r"w\/o\s*Off-Road(?:\s+Package)?",
-            r"w\/\s*Ambulance(?:\s+Package)?",
-            r"w\/o\s*Ambulance(?:\s+Package)?",
-            r"w\/\s*Air\s+Conditioning",
-            r"w\/\s*Tow\s+Package",
-            r"w\/o\s*Tow\s+Package",
-        ]
-
-        for pattern in vehicle_qualifier_patterns:
-            cleaned = re.sub(pattern, "", cleaned, flags=re.IGNORECASE)
-
-        # Remove common product specs
-        product_spec_patterns = [
-            r"w\/\s*SUB COOL[^w]*",
-            r"w\/\s*Heavy Duty Cooling[^w]*",
-            r"w\/\s*Standard Duty Cooling[^w]*",
-            r"w\/\s*\d+\s*Plate[^w]*",
-            r"w\/\s*Plate\s+Type[^w]*",
-            r"w\/\s*Built-In Oil Cooler[^w]*",
-            r"OE\s+\d+mm[^w]*",
-            r"\d+%\s+(?:Stronger|Thicker)[^w]*",
-            r"High-Efficiency[^w]*",
-            r"B-Tube Technology[^w]*",
-            r"Includes\s+[^w]+",
-            r"w\/\s*\d+\s+Speed",
-            r"w\/\s*\d+\s+Plate",
-        ]
+        cleaned = self._UNIT_BOUNDARY_PATTERN.sub(r"\1 \2", eng_text)
 
-        for pattern in product_spec_patterns:
-            cleaned = re.sub(pattern, "", cleaned, flags=re.IGNORECASE)
+        # Remove aspiration, fuel type, duty level, qualifier and product-spec text
+        for pattern, replacement in self._ENGINE_SPEC_SUBSTITUTIONS:
+            cleaned = pattern.sub(replacement, cleaned)
 
         # Remove any trailing "w/" or "w/o" with nothing after
-        cleaned = re.sub(r"\s*w\/o?\s*$", "", cleaned)
+        cleaned = self._TRAILING_WITH_PATTERN.sub("", cleaned)
 
         # Clean up multiple spaces and trim
-        return re.sub(r"\s+", " ", cleaned).strip()
+        return self._WHITESPACE_RUN_PATTERN.sub(" ", cleaned).strip()
 
     def _extract_engine_qualifier(self, container: Tag) -> str | None:
         """Extract engine qualifier from part container (DEPRECATED).
@@ -639,11 +696,11 @@ class CSFParser(HTMLParser):
         logger.info("csf_part_extracted", sku=data["sku"], name=data["name"])
         return data
 
-    def _extract_specifications(self, soup: BeautifulSoup) -> dict[str, Any]:
+    def _extract_specifications(self, soup: Tag) -> dict[str, Any]:
         """Extract product specifications.
 
         Args:
-            soup: Parsed HTML
+            soup: Parsed HTML, or a single .row.app container within it
 
         Returns:
             Dict of specifications
@@ -654,24 +711,27 @@ class CSFParser(HTMLParser):
         """
         specs: dict[str, Any] = {}
 
-        # Find all spec rows in the part's table
-        spec_rows = soup.select(".row.app table.table-borderless tbody tr")
+        # Find all spec rows in the part's table. A .row.app container already
+        # scopes them, so its rows are matched with a relative selector; the
+        # .row.app prefix (an ancestor check per row) is only needed for a page
+        classes = soup.get("class") or ()
+        if "row" in classes and "app" in classes:
+            spec_rows = self._CONTAINER_SPEC_ROWS_SELECTOR.select(soup)
+        else:
+            spec_rows = self._PAGE_SPEC_ROWS_SELECTOR.select(soup)
         for spec_row in spec_rows:
-            cells = spec_row.select("td")
+            cells = spec_row.find_all("td")
             for cell in cells:
-                text = cell.get_text(strip=True)
                 # Parse "Key: Value" format
-                if ": " in text:
-                    key, value = text.split(": ", 1)
-                    # Clean value (remove HTML tags if any)
-                    # BeautifulSoup already strips tags, but ensure clean text
-                    value_clean = BeautifulSoup(value, "lxml").get_text(strip=True)
-                    specs[key] = value_clean
+                key, sep, value = cell.get_text(strip=True).partition(": ")
+                if sep:
+                    # get_text() already dropped tags and decoded entities
+                    specs[key] = value.strip()
 
         logger.debug("specifications_extracted", count=len(specs))
         return specs
 
-    def _extract_images(self, soup: BeautifulSoup) -> list[dict[str, Any]]:  # noqa: ARG002
+    def _extract_images(self, soup: Tag) -> list[dict[str, Any]]:  # noqa: ARG002
         """Extract product images from listing pages.
 
         Args:
@@ -736,7 +796,7 @@ class CSFParser(HTMLParser):
         logger.debug("gallery_images_extracted", count=len(images))
         return images
 
-    def _extract_stock_status(self, soup: BeautifulSoup) -> bool:  # noqa: ARG002
+    def _extract_stock_status(self, soup: Tag) -> bool:  # noqa: ARG002
         """Extract stock availability status.
 
         Args:
@@ -782,9 +842,11 @@ class CSFParser(HTMLParser):
         """
         logger.info("extracting_detail_page_data", sku=sku)
 
-        specifications = self._extract_detail_specifications(soup)
+        # Both table extractors classify tables by their headers; collect them once
+        tables = self._tables_with_headers(soup)
+        specifications = self._extract_detail_specifications(soup, tables)
         tech_notes = self._extract_tech_notes(specifications)
-        interchange_data = self._extract_interchange_data(soup)
+        interchange_data = self._extract_interchange_data(soup, tables)
         full_description = self._extract_full_description(soup)
         additional_images = self.extract_gallery_images(soup)
 
@@ -909,32 +971,58 @@ class CSFParser(HTMLParser):
             Modifies specs dict in-place. See RECONNAISSANCE.md for
             detailed table format variations and normalization strategy.
         """
+        # Each label/value cell is read exactly once; display cells of triplets are never read
+        cell_count = len(cells)
+
         # Handle multi-column rows with 3-cell groups
-        if len(cells) >= 3 and len(cells) % 3 == 0:  # noqa: PLR2004
-            for i in range(0, len(cells), 3):
-                if i + 2 < len(cells):
-                    key = cells[i + 1].get_text(strip=True).rstrip(":")
-                    value = cells[i + 2].get_text(strip=True)
-                    if key and value and key not in specs:
-                        specs[key] = value
-
-        elif len(cells) == 2:  # noqa: PLR2004
+        if cell_count >= 3 and cell_count % 3 == 0:  # noqa: PLR2004
+            for label_cell, value_cell in zip(cells[1::3], cells[2::3], strict=True):
+                key = label_cell.get_text(strip=True).rstrip(":")
+                value = value_cell.get_text(strip=True)
+                if key and value:
+                    specs.setdefault(key, value)
+
+        elif cell_count == 2:  # noqa: PLR2004
             key = cells[0].get_text(strip=True).rstrip(":")
             value = cells[1].get_text(strip=True)
-            if key and value and key not in specs:
-                specs[key] = value
+            if key and value:
+                specs.setdefault(key, value)
 
-        elif len(cells) == 1:
+        elif cell_count == 1:
             text = cells[0].get_text(strip=True)
             if ":" in text and len(text) > 3:  # noqa: PLR2004
-                parts = text.split(":", 1)
-                if len(parts) == 2:  # noqa: PLR2004
-                    key = parts[0].strip()
-                    value = parts[1].strip()
-                    if key and value and key not in specs:
-                        specs[key] = value
-
-    def _extract_detail_specifications(self, soup: BeautifulSoup) -> dict[str, Any]:
+                label, _, raw_value = text.partition(":")
+                key = label.strip()
+                value = raw_value.strip()
+                if key and value:
+                    specs.setdefault(key, value)
+
+    # Header cells that identify the detail-page tables holding no specs
+    _INTERCHANGE_HEADERS: ClassVar[frozenset[str]] = frozenset(
+        {"Reference Number", "Reference Name"}
+    )
+    _VEHICLE_HEADERS: ClassVar[frozenset[str]] = frozenset({"Make", "Model"})
+
+    @staticmethod
+    def _tables_with_headers(soup: BeautifulSoup) -> list[tuple[Tag, frozenset[str]]]:
+        """Find every table on a page along with its header cell texts.
+
+        Args:
+            soup: Parsed HTML
+
+        Returns:
+            (table, set of header texts) pairs in document order
+        """
+        return [
+            (table, frozenset(th.get_text(strip=True) for th in table.find_all("th")))
+            for table in soup.find_all("table")
+        ]
+
+    def _extract_detail_specifications(
+        self,
+        soup: BeautifulSoup,
+        tables: list[tuple[Tag, frozenset[str]]] | None = None,
+    ) -> dict[str, Any]:
         """Extract specifications from detail page tables with normalization.
 
         Detail pages have ~25 tables with specifications in multiple inconsistent
@@ -949,6 +1037,8 @@ class CSFParser(HTMLParser):
 
         Args:
             soup: Parsed HTML
+            tables: Tables with their headers from _tables_with_headers(),
+                if already collected for this page
 
         Returns:
             Dict of normalized specifications (~22 clean specs per part)
@@ -958,19 +1048,19 @@ class CSFParser(HTMLParser):
             Normalization reduces to ~22 clean specs (33% improvement).
         """
         specs: dict[str, Any] = {}
-        tables = soup.find_all("table")
+        if tables is None:
+            tables = self._tables_with_headers(soup)
 
         logger.debug("found_detail_tables", count=len(tables))
 
-        for idx, table in enumerate(tables):
+        for idx, (table, headers) in enumerate(tables):
             # Skip interchange table (has specific headers)
-            headers = [th.get_text(strip=True) for th in table.find_all("th")]
-            if "Reference Number" in headers or "Reference Name" in headers:
+            if not headers.isdisjoint(self._INTERCHANGE_HEADERS):
                 logger.debug("skipping_interchange_table", table_index=idx)
                 continue
 
             # Skip vehicle compatibility tables
-            if "Make" in headers and "Model" in headers:
+            if headers >= self._VEHICLE_HEADERS:
                 logger.debug("skipping_vehicle_table", table_index=idx)
                 continue
 
@@ -1005,11 +1095,17 @@ class CSFParser(HTMLParser):
             return str(tech_note)
         return None
 
-    def _extract_interchange_data(self, soup: BeautifulSoup) -> list[dict[str, str]]:
+    def _extract_interchange_data(
+        self,
+        soup: BeautifulSoup,
+        tables: list[tuple[Tag, frozenset[str]]] | None = None,
+    ) -> list[dict[str, str]]:
         """Extract OEM and interchange reference numbers.
 
         Args:
             soup: Parsed HTML
+            tables: Tables with their headers from _tables_with_headers(),
+                if already collected for this page
 
         Returns:
             List of interchange references with reference_number and reference_type
@@ -1019,11 +1115,12 @@ class CSFParser(HTMLParser):
             Parts typically have 1-5 interchange references
         """
         interchange_data: list[dict[str, str]] = []
+        if tables is None:
+            tables = self._tables_with_headers(soup)
 
         # Find the interchange table by headers
-        for table in soup.find_all("table"):
-            headers = [th.get_text(strip=True) for th in table.find_all("th")]
-            if "Reference Number" in headers and "Reference Name" in headers:
+        for table, headers in tables:
+            if headers >= self._INTERCHANGE_HEADERS:
                 logger.debug("found_interchange_table")
 
                 rows = table.find_all("tr")[1:]  # Skip header row
@@ -5,16 +5,19 @@ Follows Single Responsibility Principle - only concerned with validation.
 """
 
 from decimal import Decimal, InvalidOperation
-from typing import Any
+from typing import Any, ClassVar, Final
 
 import structlog
 from pydantic import ValidationError
 
-from src.models.part import Part, PartImage
+from src.models.part import PART_LIST_ADAPTER, Part, PartImage
 from src.models.vehicle import Vehicle, VehicleCompatibility
 
 logger = structlog.get_logger()
 
+# Price formatting characters removed in one translate() pass
+_PRICE_STRIP_TABLE: Final = str.maketrans("", "", "$, ")
+
 
 class DataValidator:
     """Validator for scraped data using Pydantic models.
@@ -23,6 +26,9 @@ class DataValidator:
     Provides helpful error messages for validation failures.
     """
 
+    # Part fields filled in when the scraped data does not supply them
+    _PART_DEFAULTS: ClassVar[dict[str, Any]] = {"manufacturer": "CSF", "in_stock": True}
+
     def validate_part(self, data: dict[str, Any]) -> Part:
         """Validate and construct Part from raw data.
 
@@ -153,50 +159,36 @@ class DataValidator:
         Returns:
             Preprocessed data ready for Pydantic validation
         """
-        processed = data.copy()
+        # One merged copy supplies the defaults; each field is then looked up once
+        processed = {**self._PART_DEFAULTS, **data}
 
         # Convert price to Decimal (skip if None)
-        if "price" in processed and processed["price"] is not None:
-            processed["price"] = self._parse_price(processed["price"])
+        price = processed.get("price")
+        if price is not None:
+            processed["price"] = self._parse_price(price)
 
         # Process images if present
-        if "images" in processed and isinstance(processed["images"], list):
-            processed["images"] = [self._process_image(img) for img in processed["images"]]
+        images = processed.get("images")
+        if isinstance(images, list):
+            processed["images"] = [self._process_image(img) for img in images]
 
         # Ensure specifications is a dict
-        if "specifications" not in processed or not isinstance(processed["specifications"], dict):
+        if not isinstance(processed.get("specifications"), dict):
             processed["specifications"] = {}
 
-        # Ensure features is a list
-        if "features" not in processed or not isinstance(processed["features"], list):
-            processed["features"] = []
+        # Ensure features is a list of non-empty strings
+        features = processed.get("features")
+        if isinstance(features, list):
+            processed["features"] = [str(f) for f in features if f]
         else:
-            # Ensure all features are strings
-            processed["features"] = [str(f) for f in processed["features"] if f]
-
-        # Ensure tech_notes is a string or None
-        if "tech_notes" in processed and processed["tech_notes"] is not None:
-            processed["tech_notes"] = str(processed["tech_notes"]).strip()
-            # Convert empty strings to None
-            if not processed["tech_notes"]:
-                processed["tech_notes"] = None
-
-        # Ensure position is a string or None
-        if "position" in processed and processed["position"] is not None:
-            processed["position"] = str(processed["position"]).strip()
-            # Convert empty strings to None
-            if not processed["position"]:
-                processed["position"] = None
-
-        # Set default manufacturer if not present
-        if "manufacturer" not in processed:
-            processed["manufacturer"] = "CSF"
-
-        # Set default stock status if not present
-        if "in_stock" not in processed:
-            processed["in_stock"] = True
-
-        logger.debug("part_data_preprocessed", sku=processed.get("sku"))
+            processed["features"] = []
+
+        # Ensure tech_notes and position are stripped strings, with empty ones as None
+        for key in ("tech_notes", "position"):
+            value = processed.get(key)
+            if value is not None:
+                processed[key] = str(value).strip() or None
+
         return processed
 
     def _parse_price(self, price: str | float | Decimal) -> Decimal:
@@ -224,13 +216,8 @@ class DataValidator:
         if isinstance(price, Decimal):
             return price
 
-        # Convert to string and clean
-        price_str = str(price).strip()
-
-        # Remove common price formatting
-        price_str = price_str.replace("$", "")
-        price_str = price_str.replace(",", "")
-        price_str = price_str.replace(" ", "")
+        # Convert to string and remove common price formatting
+        price_str = str(price).strip().translate(_PRICE_STRIP_TABLE)
 
         # Handle empty or invalid strings
         if not price_str or price_str == "":
@@ -269,6 +256,8 @@ class DataValidator:
         """Validate multiple parts in batch.
 
         Continues validation even if some parts fail, collecting all errors.
+        The whole batch is validated in one TypeAdapter call; when some parts
+        fail, the rest are validated again without them.
 
         Args:
             parts_data: List of raw part data dicts
@@ -286,26 +275,46 @@ class DataValidator:
             >>> len(parts)
             2
         """
-        valid_parts: list[Part] = []
-        errors: list[dict[str, Any]] = []
+        errors_by_index: dict[int, list[Any]] = {}
 
+        # Pre-process each part; a bad image fails only its own part
+        processed: dict[int, dict[str, Any]] = {}
         for idx, data in enumerate(parts_data):
             try:
-                part = self.validate_part(data)
-                valid_parts.append(part)
+                processed[idx] = self._preprocess_part_data(data)
             except ValidationError as e:
-                errors.append(
-                    {
-                        "index": idx,
-                        "sku": data.get("sku", "unknown"),
-                        "errors": e.errors(),
-                    }
-                )
-                logger.warning(
-                    "part_validation_failed_in_batch",
-                    index=idx,
-                    sku=data.get("sku"),
-                )
+                errors_by_index[idx] = e.errors()
+
+        # Validate the batch in one pass; each error's leading list index tells
+        # which part failed, and the remaining parts are validated again
+        valid_parts: list[Part] = []
+        while processed:
+            indices = list(processed)
+            try:
+                valid_parts = PART_LIST_ADAPTER.validate_python(list(processed.values()))
+            except ValidationError as e:
+                for error in e.errors():
+                    idx = indices[int(error["loc"][0])]
+                    errors_by_index.setdefault(idx, []).append({**error, "loc": error["loc"][1:]})
+                    processed.pop(idx, None)
+            else:
+                break
+
+        errors: list[dict[str, Any]] = []
+        for idx in sorted(errors_by_index):
+            data = parts_data[idx]
+            errors.append(
+                {
+                    "index": idx,
+                    "sku": data.get("sku", "unknown"),
+                    "errors": errors_by_index[idx],
+                }
+            )
+            logger.warning(
+                "part_validation_failed_in_batch",
+                index=idx,
+                sku=data.get("sku"),
+            )
 
         logger.info(
             "batch_validation_complete",
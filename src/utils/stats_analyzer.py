@@ -169,25 +169,24 @@ class StatsAnalyzer:
                 export_date=datetime.now(UTC),
             )
 
-        # Extract SKUs and detect duplicates
-        skus = [part.get("sku", "") for part in parts_data if part.get("sku")]
-        sku_counts = Counter(skus)
-        unique_skus = len(sku_counts)
-        duplicate_count = sum(1 for count in sku_counts.values() if count > 1)
-        dedup_rate = duplicate_count / unique_skus if unique_skus > 0 else 0.0
-
-        # Category breakdown
-        categories = [part.get("category", "Unknown") for part in parts_data]
-        category_counts = dict(Counter(categories))
-
-        # Vehicle analysis
+        # One pass over the parts collects SKUs, categories, vehicles and prices
+        sku_counts: Counter[str] = Counter()
+        category_counts: dict[str, int] = {}
         vehicles_set: set[tuple[str, str, int]] = set()
         make_counts: Counter[str] = Counter()
+        has_prices = False
 
         for part in parts_data:
+            sku = part.get("sku")
+            if sku:
+                sku_counts[sku] += 1
+
+            category = part.get("category", "Unknown")
+            category_counts[category] = category_counts.get(category, 0) + 1
+
             # Check for vehicle data in part
-            if part.get("vehicle"):
-                vehicle = part["vehicle"]
+            vehicle = part.get("vehicle")
+            if vehicle:
                 make = vehicle.get("make", "")
                 model = vehicle.get("model", "")
                 year = vehicle.get("year", 0)
@@ -195,8 +194,13 @@ class StatsAnalyzer:
                     vehicles_set.add((make, model, year))
                     make_counts[make] += 1
 
-        # Check for price data
-        has_prices = any(part.get("price") is not None for part in parts_data)
+            if not has_prices and part.get("price") is not None:
+                has_prices = True
+
+        # Detect duplicates
+        unique_skus = len(sku_counts)
+        duplicate_count = sum(1 for count in sku_counts.values() if count > 1)
+        dedup_rate = duplicate_count / unique_skus if unique_skus > 0 else 0.0
 
         return DataStats(
             total_parts=len(parts_data),
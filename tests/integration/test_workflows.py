@@ -60,7 +60,7 @@ class TestScrapingWorkflow:
         mock_response.raise_for_status = Mock()
 
         mocker.patch("src.scraper.fetcher.time.sleep")
-        mocker.patch("src.scraper.fetcher.time.time", return_value=0.0)
+        mocker.patch("src.scraper.fetcher.monotonic", return_value=0.0)
 
         fetcher = RespectfulFetcher()
         mocker.patch.object(fetcher.client, "get", return_value=mock_response)
@@ -116,7 +116,7 @@ class TestScrapingWorkflow:
         mock_response.raise_for_status = Mock()
 
         mocker.patch("src.scraper.fetcher.time.sleep")
-        mocker.patch("src.scraper.fetcher.time.time", return_value=0.0)
+        mocker.patch("src.scraper.fetcher.monotonic", return_value=0.0)
 
         fetcher = RespectfulFetcher()
         mocker.patch.object(fetcher.client, "get", return_value=mock_response)
@@ -853,7 +853,7 @@ class TestErrorRecoveryWorkflow:
         mock_response.raise_for_status = Mock()
 
         mocker.patch("src.scraper.fetcher.time.sleep")
-        mocker.patch("src.scraper.fetcher.time.time", return_value=0.0)
+        mocker.patch("src.scraper.fetcher.monotonic", return_value=0.0)
 
         fetcher = RespectfulFetcher()
         mocker.patch.object(fetcher.client, "get", return_value=mock_response)
@@ -942,6 +942,7 @@ class TestErrorRecoveryWorkflow:
 
         mock_context = Mock()
         mock_context.new_page.return_value = mock_page
+        mock_context.cookies.return_value = []
 
         mock_browser = Mock(spec=Browser)
         mock_browser.new_context.return_value = mock_context
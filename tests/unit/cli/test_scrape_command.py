@@ -11,7 +11,7 @@ import pytest
 from click.testing import CliRunner
 from pytest_mock import MockerFixture
 
-from src.cli.commands.scrape import _is_remote_wp, scrape
+from src.cli.commands.scrape import HTTP_CACHE_DIR, _is_remote_wp, scrape
 from src.scraper.orchestrator import ScraperOrchestrator
 
 # ============================================================================
@@ -263,6 +263,33 @@ class TestScrapeCommandOptions:
         call_kwargs = mock_orchestrator.call_args.kwargs
         assert call_kwargs["incremental"] is True
 
+    def test_http_cache_ttl_passes_cached_fetcher_to_constructor(
+        self, cli_runner: CliRunner, mock_orchestrator: MagicMock, mocker: MockerFixture
+    ) -> None:
+        """Test --http-cache-ttl builds a caching fetcher with the TTL in seconds."""
+        # Arrange
+        mock_fetcher_cls = mocker.patch("src.cli.commands.scrape.RespectfulFetcher")
+
+        # Act
+        result = cli_runner.invoke(scrape, ["--http-cache-ttl", "2"])
+
+        # Assert
+        assert result.exit_code == 0
+        mock_fetcher_cls.assert_called_once_with(cache_dir=HTTP_CACHE_DIR, cache_ttl=7200)
+        call_kwargs = mock_orchestrator.call_args.kwargs
+        assert call_kwargs["fetcher"] is mock_fetcher_cls.return_value
+
+    def test_default_uses_uncached_fetcher(
+        self, cli_runner: CliRunner, mock_orchestrator: MagicMock
+    ) -> None:
+        """Test the orchestrator creates its own fetcher without --http-cache-ttl."""
+        # Act
+        result = cli_runner.invoke(scrape, [])
+
+        # Assert
+        assert result.exit_code == 0
+        assert mock_orchestrator.call_args.kwargs["fetcher"] is None
+
     def test_resume_passes_to_scrape_all(
         self, cli_runner: CliRunner, mock_orchestrator: MagicMock
     ) -> None:
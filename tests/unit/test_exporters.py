@@ -6,13 +6,15 @@ All tests follow the AAA (Arrange-Act-Assert) pattern.
 
 # ruff: noqa: SLF001 - Testing private methods is intentional
 
+import gzip
 import json
 from decimal import Decimal
 from pathlib import Path
 
 import pytest
+from pytest_mock import MockerFixture
 
-from src.exporters.json_exporter import JSONExporter
+from src.exporters.json_exporter import JSONExporter, _dumps, decode_specs, expand_hierarchy
 from src.models.part import Part, PartImage
 from src.models.vehicle import Vehicle, VehicleCompatibility
 
@@ -326,6 +328,26 @@ def test_export_parts_handles_multiple_parts(
     assert data["parts"][1]["sku"] == "CSF-67890"
 
 
+def test_export_parts_writes_non_ascii_unescaped(tmp_path: Path) -> None:
+    """Test that export_parts() writes non-ASCII text as raw UTF-8.
+
+    Arrange: Create exporter and part with accented characters
+    Act: Export parts
+    Assert: Characters appear unescaped in the file
+    """
+    # Arrange
+    exporter = JSONExporter(output_dir=tmp_path)
+    part = Part(sku="CSF-11111", name="Radiateur Citroën", category="Radiators")
+
+    # Act
+    output_path = exporter.export_parts([part])
+
+    # Assert
+    content = output_path.read_text(encoding="utf-8")
+    assert "Citroën" in content
+    assert "\\u" not in content
+
+
 def test_export_parts_returns_path(tmp_path: Path, sample_part: Part) -> None:
     """Test that export_parts() returns the output path.
 
@@ -346,6 +368,160 @@ def test_export_parts_returns_path(tmp_path: Path, sample_part: Part) -> None:
     assert returned_path.exists()
 
 
+def test_export_parts_intern_spec_keys_round_trips(tmp_path: Path, sample_part: Part) -> None:
+    """Test that export_parts(intern_spec_keys=True) writes a shared spec key table.
+
+    Arrange: Create two parts sharing specification names
+    Act: Export with intern_spec_keys and decode each part
+    Assert: Names appear once in spec_keys and decode back to the originals
+    """
+    # Arrange
+    exporter = JSONExporter(output_dir=tmp_path)
+    other = Part(
+        sku="CSF-67890",
+        name="Condenser",
+        category="Condensers",
+        specifications={"rows": 1, "material": "Copper"},
+    )
+
+    # Act
+    output_path = exporter.export_parts([sample_part, other], intern_spec_keys=True)
+    data = json.loads(output_path.read_text(encoding="utf-8"))
+    decoded = [decode_specs(p, data["spec_keys"]) for p in data["parts"]]
+
+    # Assert
+    assert data["spec_keys"] == ["material", "rows", "core_width"]
+    assert data["parts"][1]["specifications"] == {"1": 1, "0": "Copper"}
+    assert decoded[0]["specifications"] == sample_part.specifications
+    assert decoded[1]["specifications"] == other.specifications
+
+
+def test_export_hierarchical_compact_intern_spec_keys(
+    tmp_path: Path, sample_part: Part, sample_compatibility: VehicleCompatibility
+) -> None:
+    """Test that compact hierarchical exports include the spec key table.
+
+    Arrange: Create exporter, part and compatibility
+    Act: Export compact hierarchical data with part_refs and intern_spec_keys
+    Assert: spec_keys is written and the table part decodes to the original
+    """
+    # Arrange
+    exporter = JSONExporter(output_dir=tmp_path)
+
+    # Act
+    output_path = exporter.export_hierarchical(
+        [sample_compatibility],
+        parts=[sample_part],
+        pretty=False,
+        part_refs=True,
+        intern_spec_keys=True,
+    )
+
+    # Assert
+    data = json.loads(output_path.read_text(encoding="utf-8"))
+    assert list(data) == ["metadata", "spec_keys", "parts_table", "data"]
+    part_data = decode_specs(data["parts_table"][0], data["spec_keys"])
+    assert part_data["specifications"] == sample_part.specifications
+
+
+def test_decode_specs_raises_value_error_for_unknown_index() -> None:
+    """Test that decode_specs() rejects indices outside spec_keys.
+
+    Arrange: Build a part dict referencing a missing spec key
+    Act: Decode the specifications
+    Assert: ValueError is raised
+    """
+    # Arrange
+    part_data = {"sku": "CSF-12345", "specifications": {"4": "Aluminum"}}
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="Invalid specification index"):
+        decode_specs(part_data, ["material"])
+
+
+def test_export_parts_with_workers_matches_serial_output(tmp_path: Path) -> None:
+    """Test that threaded export_parts() keeps order and content identical.
+
+    Arrange: Create a batch large enough to take the threaded path
+    Act: Export serially and with 4 workers
+    Assert: Both files hold the same parts in the same order
+    """
+    # Arrange
+    exporter = JSONExporter(output_dir=tmp_path)
+    parts = [
+        Part(sku=f"CSF-{i:05d}", name=f"Radiator {i}", price=Decimal("99.99"), category="Radiators")
+        for i in range(1500)
+    ]
+
+    # Act
+    serial_path = exporter.export_parts(parts, filename="serial.json")
+    threaded_path = exporter.export_parts(parts, filename="threaded.json", workers=4)
+
+    # Assert
+    serial = json.loads(serial_path.read_text())
+    threaded = json.loads(threaded_path.read_text())
+    assert threaded["parts"] == serial["parts"]
+    assert threaded["metadata"]["total_parts"] == 1500
+
+
+@pytest.mark.parametrize("pretty", [True, False])
+def test_export_parts_streamed_chunks_match_single_dump(
+    tmp_path: Path, mocker: MockerFixture, pretty: bool
+) -> None:
+    """Test that writing parts in chunks produces the same bytes as one dump.
+
+    Arrange: Shrink the stream chunk size so 5 parts span 3 chunks
+    Act: Export parts
+    Assert: File bytes equal _dumps() of the whole export structure
+    """
+    # Arrange
+    mocker.patch("src.exporters.json_exporter._STREAM_CHUNK_PARTS", 2)
+    exporter = JSONExporter(output_dir=tmp_path)
+    parts = [
+        Part(sku=f"CSF-{i:05d}", name=f"Radiator {i}", price=Decimal("99.99"), category="Radiators")
+        for i in range(5)
+    ]
+
+    # Act
+    output_path = exporter.export_parts(parts, pretty=pretty)
+
+    # Assert
+    content = output_path.read_bytes()
+    expected = {
+        "metadata": json.loads(content)["metadata"],
+        "parts": [exporter._part_to_dict(part) for part in parts],
+    }
+    assert content == _dumps(expected, pretty)
+
+
+def test_export_complete_streamed_chunks_match_single_dump(
+    tmp_path: Path, mocker: MockerFixture, sample_vehicle: Vehicle
+) -> None:
+    """Test that export_complete() writes chunked parts identically to one dump.
+
+    Arrange: Shrink the stream chunk size so 3 parts span 2 chunks
+    Act: Export complete
+    Assert: File bytes equal _dumps() of the merged structure
+    """
+    # Arrange
+    mocker.patch("src.exporters.json_exporter._STREAM_CHUNK_PARTS", 2)
+    exporter = JSONExporter(output_dir=tmp_path)
+    parts = [Part(sku=f"CSF-{i}", name=f"Radiator {i}", category="Radiators") for i in range(3)]
+    compat_map = {"CSF-1": [sample_vehicle]}
+
+    # Act
+    output_path = exporter.export_complete(parts, compat_map)
+
+    # Assert
+    content = output_path.read_bytes()
+    merged = [exporter._part_to_dict(part) for part in parts]
+    for part_dict in merged:
+        vehicles = compat_map.get(part_dict["sku"], [])
+        part_dict["compatibility"] = [v.model_dump(mode="json") for v in vehicles]
+    expected = {"metadata": json.loads(content)["metadata"], "parts": merged}
+    assert content == _dumps(expected, pretty=True)
+
+
 # ============================================================================
 # Test JSONExporter.export_compatibility()
 # ============================================================================
@@ -614,6 +790,25 @@ def test_export_parts_incremental_raises_valueerror_if_append_true_and_file_miss
         exporter.export_parts_incremental(parts, filename=filename, append=True)
 
 
+def test_export_parts_incremental_raises_oserror_if_existing_file_is_corrupt(
+    tmp_path: Path,
+    sample_part: Part,
+) -> None:
+    """Test that export_parts_incremental() raises OSError when appending to corrupt JSON.
+
+    Arrange: Create exporter and a truncated existing export
+    Act: Try to export with append=True
+    Assert: OSError raised with descriptive message
+    """
+    # Arrange
+    exporter = JSONExporter(output_dir=tmp_path)
+    (tmp_path / "corrupt.json").write_text('{"metadata": {"total_parts": 1}, "parts": [')
+
+    # Act & Assert
+    with pytest.raises(OSError, match="Failed to export parts incrementally"):
+        exporter.export_parts_incremental([sample_part], filename="corrupt.json", append=True)
+
+
 def test_export_parts_incremental_updates_metadata_on_append(
     tmp_path: Path,
     sample_part: Part,
@@ -818,6 +1013,27 @@ def test_validate_export_returns_false_for_invalid_json(tmp_path: Path) -> None:
     assert result is False
 
 
+def test_validate_export_without_simdjson_uses_orjson(
+    tmp_path: Path, sample_part: Part, mocker: MockerFixture
+) -> None:
+    """Test that validate_export() falls back to orjson without pysimdjson.
+
+    Arrange: Export parts and a truncated copy, with simdjson unavailable
+    Act: Validate both files
+    Assert: The export is valid and the truncated copy is not
+    """
+    # Arrange
+    mocker.patch("src.exporters.json_exporter.simdjson", None)
+    exporter = JSONExporter(output_dir=tmp_path)
+    output_path = exporter.export_parts([sample_part])
+    truncated = tmp_path / "truncated.json"
+    truncated.write_bytes(output_path.read_bytes()[:-10])
+
+    # Act & Assert
+    assert exporter.validate_export(output_path) is True
+    assert exporter.validate_export(truncated) is False
+
+
 def test_validate_export_returns_false_for_nonexistent_file(tmp_path: Path) -> None:
     """Test that validate_export() returns False for nonexistent file.
 
@@ -919,6 +1135,161 @@ def test_get_export_stats_returns_error_for_invalid_file(tmp_path: Path) -> None
     assert isinstance(stats["error"], str)
 
 
+def test_get_export_stats_reads_only_leading_metadata(tmp_path: Path) -> None:
+    """Test that get_export_stats() does not parse past the metadata header.
+
+    Arrange: Write valid metadata followed by a body that is not JSON
+    Act: Get stats
+    Assert: Stats come from the metadata header
+    """
+    # Arrange
+    exporter = JSONExporter(output_dir=tmp_path)
+    export_file = tmp_path / "parts.json"
+    export_file.write_bytes(
+        b'{"metadata":{"export_date":"2025-01-01","total_parts":7,"version":"1.0"},'
+        b'"parts":[not parsed'
+    )
+
+    # Act
+    stats = exporter.get_export_stats(export_file)
+
+    # Assert
+    assert stats["total_parts"] == 7
+    assert stats["export_date"] == "2025-01-01"
+
+
+def test_get_export_stats_falls_back_when_metadata_is_not_first(tmp_path: Path) -> None:
+    """Test that get_export_stats() parses the whole file for non-leading metadata.
+
+    Arrange: Write a JSON export with metadata after the parts list
+    Act: Get stats
+    Assert: Metadata is still found
+    """
+    # Arrange
+    exporter = JSONExporter(output_dir=tmp_path)
+    export_file = tmp_path / "parts.json"
+    export_file.write_text(
+        json.dumps({"parts": [], "metadata": {"total_parts": 3, "version": "1.0"}}),
+        encoding="utf-8",
+    )
+
+    # Act
+    stats = exporter.get_export_stats(export_file)
+
+    # Assert
+    assert stats["total_parts"] == 3
+    assert stats["version"] == "1.0"
+
+
+# ============================================================================
+# Test compressed exports
+# ============================================================================
+
+
+def test_export_parts_gz_filename_writes_gzip(tmp_path: Path, sample_part: Part) -> None:
+    """Test that a .gz filename produces a gzip-compressed export.
+
+    Arrange: Create exporter and part
+    Act: Export to parts.json.gz
+    Assert: File decompresses to the export and stats read through it
+    """
+    # Arrange
+    exporter = JSONExporter(output_dir=tmp_path)
+
+    # Act
+    output_path = exporter.export_parts([sample_part], filename="parts.json.gz")
+
+    # Assert
+    data = json.loads(gzip.decompress(output_path.read_bytes()))
+    assert data["parts"][0]["sku"] == "CSF-12345"
+    assert exporter.validate_export(output_path) is True
+    assert exporter.get_export_stats(output_path)["total_parts"] == 1
+
+
+def test_export_hierarchical_compact_gz_matches_plain(
+    tmp_path: Path, sample_part: Part, sample_compatibility: VehicleCompatibility
+) -> None:
+    """Test that the streamed hierarchical writer compresses the same bytes.
+
+    Arrange: Create exporter, part and compatibility
+    Act: Export compact hierarchical data plain and as .gz
+    Assert: Decompressed content equals the plain export
+    """
+    # Arrange
+    exporter = JSONExporter(output_dir=tmp_path)
+    parts_by_sku = {sample_part.sku: sample_part}
+
+    # Act
+    plain = exporter.export_hierarchical(
+        [sample_compatibility], parts_by_sku, filename="h.json", pretty=False
+    )
+    packed = exporter.export_hierarchical(
+        [sample_compatibility], parts_by_sku, filename="h.json.gz", pretty=False
+    )
+
+    # Assert
+    plain_data = json.loads(plain.read_bytes())
+    packed_data = json.loads(gzip.decompress(packed.read_bytes()))
+    assert packed_data["data"] == plain_data["data"]
+    assert not (tmp_path / "h.json.gz.tmp").exists()
+
+
+def test_export_parts_incremental_appends_to_gz(tmp_path: Path, sample_part: Part) -> None:
+    """Test that incremental append reads and rewrites a gzip export.
+
+    Arrange: Create a .gz export with one part
+    Act: Append a second part
+    Assert: Both parts are present after decompression
+    """
+    # Arrange
+    exporter = JSONExporter(output_dir=tmp_path)
+    other = Part(sku="CSF-67890", name="Condenser", category="Condensers")
+    exporter.export_parts_incremental([sample_part], filename="parts.json.gz")
+
+    # Act
+    output_path = exporter.export_parts_incremental([other], filename="parts.json.gz", append=True)
+
+    # Assert
+    data = json.loads(gzip.decompress(output_path.read_bytes()))
+    assert [p["sku"] for p in data["parts"]] == ["CSF-12345", "CSF-67890"]
+
+
+def test_export_parts_zst_filename_round_trips(tmp_path: Path, sample_part: Part) -> None:
+    """Test that a .zst filename produces a zstd export read back transparently.
+
+    Arrange: Create exporter and part (skipped without zstandard)
+    Act: Export to parts.json.zst
+    Assert: File is a zstd frame and stats read through it
+    """
+    # Arrange
+    zstd = pytest.importorskip("zstandard")
+    exporter = JSONExporter(output_dir=tmp_path)
+
+    # Act
+    output_path = exporter.export_parts([sample_part], filename="parts.json.zst")
+
+    # Assert
+    raw = zstd.ZstdDecompressor().decompressobj().decompress(output_path.read_bytes())
+    assert json.loads(raw)["parts"][0]["sku"] == "CSF-12345"
+    assert exporter.get_export_stats(output_path)["total_parts"] == 1
+
+
+def test_validate_export_returns_false_for_corrupt_gz(tmp_path: Path) -> None:
+    """Test that validate_export() rejects a .gz file that is not gzip data.
+
+    Arrange: Write plain text to a .gz path
+    Act: Validate the file
+    Assert: Returns False
+    """
+    # Arrange
+    exporter = JSONExporter(output_dir=tmp_path)
+    bad_file = tmp_path / "parts.json.gz"
+    bad_file.write_bytes(b"not gzip")
+
+    # Act & Assert
+    assert exporter.validate_export(bad_file) is False
+
+
 # ============================================================================
 # Test JSONExporter._part_to_dict()
 # ============================================================================
@@ -984,6 +1355,38 @@ def test_part_to_dict_converts_decimal_to_string(sample_part: Part, tmp_path: Pa
     assert result["price"] == "299.99"
 
 
+def test_dumps_serializes_raw_decimal_as_string() -> None:
+    """Test that _dumps() writes Decimal values as JSON strings.
+
+    Arrange: Build a dict holding a raw Decimal
+    Act: Serialize with _dumps
+    Assert: Decimal is emitted as a quoted string
+    """
+    # Arrange
+    data = {"price": Decimal("12.50")}
+
+    # Act
+    result = _dumps(data, pretty=False)
+
+    # Assert
+    assert json.loads(result) == {"price": "12.50"}
+
+
+def test_dumps_raises_type_error_for_unsupported_type() -> None:
+    """Test that _dumps() rejects types without a serializer.
+
+    Arrange: Build a dict holding an arbitrary object
+    Act: Serialize with _dumps
+    Assert: TypeError is raised
+    """
+    # Arrange
+    data = {"value": object()}
+
+    # Act & Assert
+    with pytest.raises(TypeError):
+        _dumps(data, pretty=False)
+
+
 # ============================================================================
 # Test JSONExporter._compatibility_to_dict()
 # ============================================================================
@@ -1060,6 +1463,59 @@ def test_export_parts_raises_oserror_on_write_failure(tmp_path: Path, sample_par
         exporter.export_parts([sample_part], filename="parts.json")
 
 
+def test_export_parts_failed_write_leaves_no_temp_file(tmp_path: Path, sample_part: Part) -> None:
+    """Test that a failed export_parts() cleans up its temporary file.
+
+    Arrange: Create exporter and make output path a directory so the rename fails
+    Act: Try to export parts
+    Assert: OSError raised and no .tmp sibling remains
+    """
+    # Arrange
+    exporter = JSONExporter(output_dir=tmp_path)
+    (tmp_path / "parts.json").mkdir()
+
+    # Act
+    with pytest.raises(OSError, match="Failed to export parts"):
+        exporter.export_parts([sample_part], filename="parts.json")
+
+    # Assert
+    assert not (tmp_path / "parts.json.tmp").exists()
+
+
+def test_export_hierarchical_compact_failure_keeps_previous_file(
+    tmp_path: Path,
+    sample_part: Part,
+    sample_compatibility: VehicleCompatibility,
+    mocker: MockerFixture,
+) -> None:
+    """Test that a compact hierarchical export failing mid-stream keeps the old file.
+
+    Arrange: Write a previous export, then make serialization fail during streaming
+    Act: Re-export compact hierarchical data
+    Assert: OSError raised, previous file unchanged, no .tmp sibling remains
+    """
+    # Arrange
+    exporter = JSONExporter(output_dir=tmp_path)
+    output_path = exporter.export_hierarchical(
+        [sample_compatibility], {"CSF-12345": sample_part}, pretty=False
+    )
+    previous = output_path.read_bytes()
+    # An unserializable entry makes the stream fail after metadata is written
+    mocker.patch.object(
+        exporter, "_build_hierarchy", return_value={2020: {"Honda": {"Civic": [object()]}}}
+    )
+
+    # Act
+    with pytest.raises(OSError, match="Failed to export hierarchical"):
+        exporter.export_hierarchical(
+            [sample_compatibility], {"CSF-12345": sample_part}, pretty=False
+        )
+
+    # Assert
+    assert output_path.read_bytes() == previous
+    assert not (tmp_path / "hierarchical.json.tmp").exists()
+
+
 def test_export_compatibility_raises_oserror_on_write_failure(
     tmp_path: Path, sample_compatibility: VehicleCompatibility
 ) -> None:
@@ -1103,6 +1559,68 @@ def test_export_hierarchical_compact_json(
     assert len(lines) == 1
 
 
+def test_export_hierarchical_compact_streams_years_in_order(
+    tmp_path: Path, sample_part: Part
+) -> None:
+    """Test that compact export_hierarchical() writes valid JSON with sorted years.
+
+    Arrange: Create compatibility spanning years in descending order
+    Act: Export hierarchical with pretty=False
+    Assert: Output parses, metadata comes first, and years are ascending
+    """
+    # Arrange
+    exporter = JSONExporter(output_dir=tmp_path)
+    compat = VehicleCompatibility(
+        part_sku="CSF-12345",
+        vehicles=[
+            Vehicle(make="Audi", model="A4", year=2022),
+            Vehicle(make="Audi", model="A4", year=2019),
+            Vehicle(make="Honda", model="Civic", year=2020),
+        ],
+    )
+
+    # Act
+    output_path = exporter.export_hierarchical(
+        [compat], {"CSF-12345": sample_part}, filename="stream.json", pretty=False
+    )
+
+    # Assert
+    data = json.loads(output_path.read_text(encoding="utf-8"))
+    assert list(data) == ["metadata", "data"]
+    assert list(data["data"]) == ["2019", "2020", "2022"]
+    assert data["metadata"]["total_years"] == 3
+    assert data["data"]["2020"]["Honda"]["Civic"][0]["sku"] == "CSF-12345"
+
+
+def test_export_hierarchical_pretty_sorts_every_level(tmp_path: Path, sample_part: Part) -> None:
+    """Test that pretty hierarchical output lists years, makes and models in order.
+
+    Arrange: Create compatibility with vehicles in reverse order
+    Act: Export hierarchical (pretty)
+    Assert: Keys at each level are sorted
+    """
+    # Arrange
+    exporter = JSONExporter(output_dir=tmp_path)
+    compat = VehicleCompatibility(
+        part_sku="CSF-12345",
+        vehicles=[
+            Vehicle(make="Toyota", model="Camry", year=2021),
+            Vehicle(make="Honda", model="Civic", year=2020),
+            Vehicle(make="Honda", model="Accord", year=2020),
+            Vehicle(make="Acura", model="Tlx", year=2020),
+        ],
+    )
+
+    # Act
+    output_path = exporter.export_hierarchical([compat], {"CSF-12345": sample_part})
+
+    # Assert
+    data = json.loads(output_path.read_text(encoding="utf-8"))["data"]
+    assert list(data) == ["2020", "2021"]
+    assert list(data["2020"]) == ["Acura", "Honda"]
+    assert list(data["2020"]["Honda"]) == ["Accord", "Civic"]
+
+
 def test_export_hierarchical_raises_oserror_on_write_failure(
     tmp_path: Path, sample_part: Part, sample_compatibility: VehicleCompatibility
 ) -> None:
@@ -1239,6 +1757,156 @@ def test_export_hierarchical_multiple_vehicles(tmp_path: Path) -> None:
     assert "2021" in data["data"] or 2021 in data["data"]
 
 
+def test_export_hierarchical_converts_each_sku_once(
+    tmp_path: Path,
+    sample_part: Part,
+    mocker: MockerFixture,
+) -> None:
+    """Test that export_hierarchical() converts a part once even across compat entries.
+
+    Arrange: Create two compatibility entries for the same SKU
+    Act: Export hierarchical
+    Assert: _part_to_dict called once and the part appears under both vehicles
+    """
+    # Arrange
+    exporter = JSONExporter(output_dir=tmp_path)
+    to_dict_spy = mocker.spy(exporter, "_part_to_dict")
+    compat_a = VehicleCompatibility(
+        part_sku="CSF-12345",
+        vehicles=[Vehicle(make="Honda", model="Civic", year=2020)],
+    )
+    compat_b = VehicleCompatibility(
+        part_sku="CSF-12345",
+        vehicles=[Vehicle(make="Toyota", model="Camry", year=2021)],
+    )
+
+    # Act
+    output_path = exporter.export_hierarchical([compat_a, compat_b], {"CSF-12345": sample_part})
+
+    # Assert
+    assert to_dict_spy.call_count == 1
+    data = json.loads(output_path.read_text(encoding="utf-8"))
+    assert data["data"]["2020"]["Honda"]["Civic"][0]["sku"] == "CSF-12345"
+    assert data["data"]["2021"]["Toyota"]["Camry"][0]["sku"] == "CSF-12345"
+
+
+@pytest.mark.parametrize("pretty", [True, False])
+def test_export_hierarchical_part_refs_stores_each_part_once(
+    tmp_path: Path, sample_part: Part, pretty: bool
+) -> None:
+    """Test that export_hierarchical(part_refs=True) writes a shared parts table.
+
+    Arrange: Create one part fitting two vehicles
+    Act: Export hierarchical with part_refs
+    Assert: Part appears once in parts_table and vehicles hold its index
+    """
+    # Arrange
+    exporter = JSONExporter(output_dir=tmp_path)
+    compat = VehicleCompatibility(
+        part_sku="CSF-12345",
+        vehicles=[
+            Vehicle(make="Honda", model="Civic", year=2020),
+            Vehicle(make="Toyota", model="Camry", year=2021),
+        ],
+    )
+
+    # Act
+    output_path = exporter.export_hierarchical(
+        [compat], {"CSF-12345": sample_part}, pretty=pretty, part_refs=True
+    )
+
+    # Assert
+    data = json.loads(output_path.read_text(encoding="utf-8"))
+    assert [p["sku"] for p in data["parts_table"]] == ["CSF-12345"]
+    assert data["data"]["2020"]["Honda"]["Civic"] == [0]
+    assert data["data"]["2021"]["Toyota"]["Camry"] == [0]
+    assert data["metadata"]["total_parts"] == 1
+    assert "parts_table" in data["metadata"]["structure"]
+
+
+def test_export_hierarchical_accepts_parts_list(
+    tmp_path: Path, sample_part: Part, sample_compatibility: VehicleCompatibility
+) -> None:
+    """Test that export_hierarchical() can index a parts list itself.
+
+    Arrange: Create exporter, parts list and compatibility
+    Act: Export hierarchical with parts= instead of parts_by_sku
+    Assert: Part is placed under the compatible vehicle
+    """
+    # Arrange
+    exporter = JSONExporter(output_dir=tmp_path)
+
+    # Act
+    output_path = exporter.export_hierarchical([sample_compatibility], parts=[sample_part])
+
+    # Assert
+    data = json.loads(output_path.read_text(encoding="utf-8"))
+    vehicle = sample_compatibility.vehicles[0]
+    models = data["data"][str(vehicle.year)][vehicle.make]
+    assert models[vehicle.model][0]["sku"] == sample_part.sku
+
+
+def test_export_hierarchical_requires_parts_source(
+    tmp_path: Path, sample_compatibility: VehicleCompatibility
+) -> None:
+    """Test that export_hierarchical() rejects calls without any parts.
+
+    Arrange: Create exporter and compatibility
+    Act: Export hierarchical without parts_by_sku or parts
+    Assert: ValueError is raised
+    """
+    # Arrange
+    exporter = JSONExporter(output_dir=tmp_path)
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="parts_by_sku or parts"):
+        exporter.export_hierarchical([sample_compatibility])
+
+
+def test_expand_hierarchy_matches_inline_export(tmp_path: Path, sample_part: Part) -> None:
+    """Test that expand_hierarchy() restores the inline part dicts.
+
+    Arrange: Export the same data inline and with part_refs
+    Act: Expand the part_refs export
+    Assert: Expanded hierarchy equals the inline export's data
+    """
+    # Arrange
+    exporter = JSONExporter(output_dir=tmp_path)
+    compat = VehicleCompatibility(
+        part_sku="CSF-12345",
+        vehicles=[
+            Vehicle(make="Honda", model="Civic", year=2020),
+            Vehicle(make="Honda", model="Accord", year=2020),
+        ],
+    )
+    parts_by_sku = {"CSF-12345": sample_part}
+    inline_path = exporter.export_hierarchical([compat], parts_by_sku, filename="inline.json")
+    refs_path = exporter.export_hierarchical(
+        [compat], parts_by_sku, filename="refs.json", part_refs=True
+    )
+
+    # Act
+    expanded = expand_hierarchy(json.loads(refs_path.read_text(encoding="utf-8")))
+
+    # Assert
+    assert expanded == json.loads(inline_path.read_text(encoding="utf-8"))["data"]
+
+
+def test_expand_hierarchy_raises_value_error_for_bad_index() -> None:
+    """Test that expand_hierarchy() rejects indices outside parts_table.
+
+    Arrange: Build an export referencing a missing table entry
+    Act: Expand the hierarchy
+    Assert: ValueError is raised
+    """
+    # Arrange
+    export_data = {"parts_table": [], "data": {"2020": {"Honda": {"Civic": [3]}}}}
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="out of range"):
+        expand_hierarchy(export_data)
+
+
 # ============================================================================
 # Test JSONExporter.export_complete()
 # ============================================================================
@@ -1356,3 +2024,151 @@ def test_export_complete_raises_oserror_on_write_failure(
     # Act & Assert
     with pytest.raises(OSError, match="Failed to export complete data"):
         exporter.export_complete([sample_part], {})
+
+
+# ============================================================================
+# Test JSONExporter JSON Lines exports
+# ============================================================================
+
+
+def test_export_parts_jsonl_appends_one_line_per_part(
+    tmp_path: Path,
+    sample_part: Part,
+    sample_part_minimal: Part,
+) -> None:
+    """Test that export_parts_jsonl() appends each batch as new lines.
+
+    Arrange: Create exporter and two batches of parts
+    Act: Export both batches to the same JSON Lines file
+    Assert: File holds one JSON record per line and the sidecar tracks the total
+    """
+    # Arrange
+    exporter = JSONExporter(output_dir=tmp_path)
+
+    # Act
+    exporter.export_parts_jsonl([sample_part])
+    output_path = exporter.export_parts_jsonl([sample_part_minimal])
+
+    # Assert
+    lines = output_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["sku"] for line in lines] == ["CSF-12345", "CSF-67890"]
+
+    meta = json.loads((tmp_path / "parts.jsonl.meta.json").read_text(encoding="utf-8"))
+    assert meta["record_type"] == "parts"
+    assert meta["total_records"] == 2
+    assert "export_date" in meta
+
+
+def test_export_compatibility_jsonl_rejects_mismatched_record_type(
+    tmp_path: Path,
+    sample_part: Part,
+    sample_compatibility: VehicleCompatibility,
+) -> None:
+    """Test that appending compatibility to a parts JSON Lines file raises ValueError.
+
+    Arrange: Create a parts JSON Lines export
+    Act: Append compatibility records to the same file
+    Assert: ValueError raised
+    """
+    # Arrange
+    exporter = JSONExporter(output_dir=tmp_path)
+    exporter.export_parts_jsonl([sample_part], filename="mixed.jsonl")
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="Cannot append compatibility"):
+        exporter.export_compatibility_jsonl([sample_compatibility], filename="mixed.jsonl")
+
+
+def test_remove_jsonl_restarts_the_log_and_its_count(
+    tmp_path: Path,
+    sample_part: Part,
+    sample_part_minimal: Part,
+) -> None:
+    """Test that remove_jsonl() deletes the log and sidecar so counting restarts.
+
+    Arrange: Create a parts JSON Lines export
+    Act: Remove it and append a new batch
+    Assert: Only the new batch is in the file and the sidecar total
+    """
+    # Arrange
+    exporter = JSONExporter(output_dir=tmp_path)
+    exporter.export_parts_jsonl([sample_part])
+
+    # Act
+    exporter.remove_jsonl("parts.jsonl")
+    exporter.remove_jsonl("parts.jsonl")  # already gone: no error
+    output_path = exporter.export_parts_jsonl([sample_part_minimal])
+
+    # Assert
+    lines = output_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["sku"] for line in lines] == ["CSF-67890"]
+    meta = json.loads((tmp_path / "parts.jsonl.meta.json").read_text(encoding="utf-8"))
+    assert meta["total_records"] == 1
+
+
+def test_jsonl_to_json_deduplicates_by_sku(
+    tmp_path: Path,
+    sample_part: Part,
+    sample_part_minimal: Part,
+) -> None:
+    """Test that jsonl_to_json() builds a standard export with last-write-wins dedup.
+
+    Arrange: Append the same SKU twice with different names
+    Act: Convert the JSON Lines file to JSON
+    Assert: Output matches the parts export format with one record per SKU
+    """
+    # Arrange
+    exporter = JSONExporter(output_dir=tmp_path)
+    updated = sample_part.model_copy(update={"name": "Updated Radiator"})
+    exporter.export_parts_jsonl([sample_part, sample_part_minimal])
+    jsonl_path = exporter.export_parts_jsonl([updated])
+
+    # Act
+    output_path = exporter.jsonl_to_json(jsonl_path)
+
+    # Assert
+    assert output_path == tmp_path / "parts.json"
+    data = json.loads(output_path.read_text(encoding="utf-8"))
+    assert data["metadata"]["total_parts"] == 2
+    assert [p["name"] for p in data["parts"]] == ["Updated Radiator", "Condenser"]
+    assert exporter.validate_export(output_path) is True
+
+
+def test_jsonl_to_json_converts_compatibility(
+    tmp_path: Path,
+    sample_compatibility: VehicleCompatibility,
+) -> None:
+    """Test that jsonl_to_json() converts compatibility records.
+
+    Arrange: Append compatibility records to a JSON Lines file
+    Act: Convert with a custom filename
+    Assert: Output uses the compatibility export format
+    """
+    # Arrange
+    exporter = JSONExporter(output_dir=tmp_path)
+    jsonl_path = exporter.export_compatibility_jsonl([sample_compatibility])
+
+    # Act
+    output_path = exporter.jsonl_to_json(jsonl_path, filename="compat_final.json")
+
+    # Assert
+    data = json.loads(output_path.read_text(encoding="utf-8"))
+    assert data["metadata"]["total_mappings"] == 1
+    assert data["compatibility"][0]["part_sku"] == "CSF-12345"
+
+
+def test_jsonl_to_json_raises_valueerror_without_metadata(tmp_path: Path) -> None:
+    """Test that jsonl_to_json() raises ValueError when the sidecar is missing.
+
+    Arrange: Create a JSON Lines file without a sidecar
+    Act: Try to convert it
+    Assert: ValueError raised
+    """
+    # Arrange
+    exporter = JSONExporter(output_dir=tmp_path)
+    jsonl_path = tmp_path / "orphan.jsonl"
+    jsonl_path.write_text('{"sku": "CSF-1"}\n', encoding="utf-8")
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="Missing JSON Lines metadata"):
+        exporter.jsonl_to_json(jsonl_path)
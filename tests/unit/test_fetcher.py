@@ -17,7 +17,9 @@ Tests cover:
 
 import asyncio
 import hashlib
+import threading
 import time
+from pathlib import Path
 from unittest.mock import Mock
 
 import httpx
@@ -30,6 +32,7 @@ from src.scraper.fetcher import (
     RespectfulFetcher,
     _is_retryable_browser_error,
     _is_retryable_http_error,
+    run_async,
 )
 
 
@@ -50,7 +53,7 @@ class TestRespectfulFetcherInit:
         assert fetcher.MAX_RETRIES == 3
         assert fetcher.TIMEOUT_SECONDS == 30
         assert isinstance(fetcher.client, httpx.Client)
-        assert fetcher._last_request_time == 0  # noqa: SLF001
+        assert fetcher._last_request_time == float("-inf")  # noqa: SLF001
 
         # Cleanup
         fetcher.close()
@@ -77,6 +80,95 @@ class TestRespectfulFetcherInit:
         # Cleanup
         fetcher.close()
 
+    def test_init_with_cache_dir_keeps_sync_client_uncached(self, tmp_path: Path) -> None:
+        """Test cache_dir leaves fetch() and the content checks on the network."""
+        # Arrange
+        hishel = pytest.importorskip("hishel")
+
+        # Act
+        fetcher = RespectfulFetcher(cache_dir=tmp_path / "http_cache")
+
+        # Assert
+        assert not isinstance(fetcher.client, hishel.CacheClient)
+        assert fetcher.client.headers["User-Agent"] == RespectfulFetcher.USER_AGENT
+
+        # Cleanup
+        fetcher.close()
+
+    def test_cache_ttl_applies_only_to_cached_async_clients(self, tmp_path: Path) -> None:
+        """Test only async clients requested with cached=True use the cache."""
+        # Arrange
+        hishel = pytest.importorskip("hishel")
+        fetcher = RespectfulFetcher(cache_dir=tmp_path / "http_cache", cache_ttl=3600)
+
+        # Act
+        cached_client = fetcher._async_client(cached=True)  # noqa: SLF001
+        batch_client = fetcher._async_client()  # noqa: SLF001
+
+        # Assert
+        assert isinstance(cached_client, hishel.AsyncCacheClient)
+        assert not isinstance(batch_client, hishel.AsyncCacheClient)
+
+        # Cleanup
+        fetcher.close()
+
+    async def test_cache_ttl_serves_dropdowns_but_not_detail_pages_from_cache(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test a detail fetch with cache_ttl set still reaches the network."""
+        # Arrange
+        pytest.importorskip("hishel")
+        mocker.patch("src.scraper.fetcher.asyncio.sleep", return_value=None)
+        detail_html = '<html><td class="selling-part">3562</td></html>'
+
+        async def handle(_transport: object, request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text=detail_html, request=request)
+
+        network = mocker.patch.object(
+            httpx.AsyncHTTPTransport, "handle_async_request", side_effect=handle, autospec=True
+        )
+        fetcher = RespectfulFetcher(cache_dir=tmp_path / "http_cache", cache_ttl=3600)
+        detail_url = "https://csf.autocaredata.com/items/3562"
+        dropdown_url = "https://csf.mycarparts.com/get_year_by_make/3"
+
+        # Act
+        await fetcher.async_fetch_detail_pages([detail_url])
+        await fetcher.async_fetch_detail_pages([detail_url])
+        await fetcher.async_fetch_all([dropdown_url], cached=True)
+        await fetcher.async_fetch_all([dropdown_url], cached=True)
+
+        # Assert - both detail fetches hit the network, the second dropdown did not
+        fetched = [call.args[1].url for call in network.call_args_list]
+        assert fetched == [detail_url, detail_url, dropdown_url]
+
+        # Cleanup
+        fetcher.close()
+
+    def test_init_with_cache_dir_requires_hishel(self, mocker: MockerFixture) -> None:
+        """Test cache_dir raises a helpful ImportError when hishel is missing."""
+        # Arrange
+        mocker.patch.dict("sys.modules", {"hishel": None})
+
+        # Act & Assert
+        with pytest.raises(ImportError, match="cache"):
+            RespectfulFetcher(cache_dir=".http_cache")
+
+    def test_client_options_enable_http2_and_shared_pool_limits(self) -> None:
+        """Test sync and async clients share HTTP/2 and keep-alive pool settings."""
+        # Arrange
+        fetcher = RespectfulFetcher()
+
+        # Act
+        options = fetcher._client_options()  # noqa: SLF001
+
+        # Assert
+        assert options["http2"] is True
+        assert options["limits"].max_keepalive_connections == 50
+        assert options["limits"].keepalive_expiry == 60.0
+
+        # Cleanup
+        fetcher.close()
+
     def test_init_configures_http_client_with_redirects(self) -> None:
         """Test __init__() configures HTTP client to follow redirects."""
         # Arrange & Act
@@ -370,7 +462,7 @@ class TestRespectfulFetcherFetch:
         """Test fetch() skips delay when elapsed time exceeds min delay."""
         # Arrange
         mock_sleep = mocker.patch("src.scraper.fetcher.time.sleep")
-        mock_time = mocker.patch("src.scraper.fetcher.time.time")
+        mock_time = mocker.patch("src.scraper.fetcher.monotonic")
         # First request: time() sets _last_request_time = 1.0
         # Second request: time() returns 2.0, elapsed = 1.0s > MIN_DELAY 0.3s
         # Third call: time() updates _last_request_time = 2.0
@@ -458,6 +550,7 @@ class TestRespectfulFetcherBrowser:
 
         mock_context = Mock()
         mock_context.new_page.return_value = mock_page
+        mock_context.cookies.return_value = []
         mock_context.route = Mock()
 
         mock_browser = Mock(spec=Browser)
@@ -500,6 +593,7 @@ class TestRespectfulFetcherBrowser:
 
         mock_context = Mock()
         mock_context.new_page.return_value = mock_page
+        mock_context.cookies.return_value = []
 
         mock_browser = Mock(spec=Browser)
         mock_browser.new_context.return_value = mock_context
@@ -526,7 +620,7 @@ class TestRespectfulFetcherBrowser:
         """Test fetch_with_browser() applies rate limiting."""
         # Arrange
         mock_sleep = mocker.patch("src.scraper.fetcher.time.sleep")
-        mock_time = mocker.patch("src.scraper.fetcher.time.time")
+        mock_time = mocker.patch("src.scraper.fetcher.monotonic")
         # Simulate time progression
         # First call: time() to set _last_request_time = 1.0 (non-zero!)
         # Second call: time() to check elapsed (returns 1.5, elapsed = 0.5s)
@@ -631,7 +725,7 @@ class TestRespectfulFetcherRateLimiting:
         """Test first request initializes last_request_time."""
         # Arrange
         mocker.patch("src.scraper.fetcher.time.sleep")
-        mock_time = mocker.patch("src.scraper.fetcher.time.time")
+        mock_time = mocker.patch("src.scraper.fetcher.monotonic")
         mock_time.return_value = 100.0
 
         mock_response = Mock(spec=httpx.Response)
@@ -643,7 +737,7 @@ class TestRespectfulFetcherRateLimiting:
         mocker.patch.object(fetcher.client, "get", return_value=mock_response)
 
         # Act
-        assert fetcher._last_request_time == 0  # noqa: SLF001
+        assert fetcher._last_request_time == float("-inf")  # noqa: SLF001
         fetcher.fetch("https://example.com")
 
         # Assert
@@ -653,17 +747,12 @@ class TestRespectfulFetcherRateLimiting:
         fetcher.close()
 
     def test_rate_limit_uses_random_delay(self, mocker: MockerFixture) -> None:
-        """Test rate limiting uses random delay between MIN and MAX."""
+        """Test rate limiting waits out the rest of a jittered [MIN, MAX] gap."""
         # Arrange
         mock_sleep = mocker.patch("src.scraper.fetcher.time.sleep")
-        mock_time = mocker.patch("src.scraper.fetcher.time.time")
-        # First request: time() to set _last_request_time = 1.0
-        # Second request: time() to check elapsed (returns 1.1, so elapsed = 0.1s < 0.3s)
-        # Third call: time() to update _last_request_time = 1.1
-        mock_time.side_effect = [1.0, 1.1, 1.1]  # 0.1s elapsed
-
-        mock_random = mocker.patch("src.scraper.fetcher.random.uniform")
-        mock_random.return_value = 0.5  # Fixed delay for testing
+        mock_time = mocker.patch("src.scraper.fetcher.monotonic")
+        # One monotonic() read per request: 1.0, then 1.1 (0.1s elapsed)
+        mock_time.side_effect = [1.0, 1.1]
 
         mock_response = Mock(spec=httpx.Response)
         mock_response.status_code = 200
@@ -671,23 +760,34 @@ class TestRespectfulFetcherRateLimiting:
         mock_response.raise_for_status = Mock()
 
         fetcher = RespectfulFetcher()
+        fetcher._jitter_ring = [0.5] * len(fetcher._jitter_ring)  # noqa: SLF001
         mocker.patch.object(fetcher.client, "get", return_value=mock_response)
 
         # Act
         fetcher.fetch("https://example.com/first")
-        # After first request, _last_request_time = 1.0
-        # Second request: elapsed = 1.1 - 1.0 = 0.1s < MIN_DELAY 0.3s → delay applied
         fetcher.fetch("https://example.com/second")
 
         # Assert
-        # Should call uniform with (min_delay - elapsed, max_delay)
-        # = (0.3 - 0.1, 0.8) = (0.2, 0.8)
-        assert mock_random.call_count >= 1, "random.uniform should be called for rate limiting"
-        call_args = [call[0] for call in mock_random.call_args_list]
-        assert any(abs(args[0] - 0.2) < 0.01 and abs(args[1] - 0.8) < 0.01 for args in call_args), (
-            f"Expected uniform(0.2, 0.8), got {call_args}"
-        )
-        mock_sleep.assert_called_with(0.5)
+        # A 0.5 draw gives a 0.55s gap (midway in 0.3-0.8s); 0.1s already passed
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args[0][0] == pytest.approx(0.45)
+        assert fetcher._last_request_time == pytest.approx(1.55)  # noqa: SLF001
+
+        # Cleanup
+        fetcher.close()
+
+    def test_jitter_cycles_through_ring_within_bounds(self) -> None:
+        """Test _jitter() maps ring draws into the requested range and wraps around."""
+        # Arrange
+        fetcher = RespectfulFetcher()
+        ring_size = len(fetcher._jitter_ring)  # noqa: SLF001
+
+        # Act
+        delays = [fetcher._jitter(0.3, 0.8) for _ in range(ring_size + 1)]  # noqa: SLF001
+
+        # Assert
+        assert all(0.3 <= delay <= 0.8 for delay in delays)
+        assert delays[ring_size] == delays[0]
 
         # Cleanup
         fetcher.close()
@@ -804,6 +904,19 @@ class TestSmartHTTPRetry:
         # Cleanup
         fetcher.close()
 
+    def test_retry_backoff_is_jittered_within_bounds(self) -> None:
+        """Test retry waits are randomized between the 4s floor and the exponential cap."""
+        # Arrange
+        wait = RespectfulFetcher._RETRY_WAIT  # noqa: SLF001
+        retry_state = Mock(attempt_number=5)  # exponential bound 2**4 = 16s
+
+        # Act
+        waits = [wait(retry_state) for _ in range(50)]
+
+        # Assert
+        assert all(4 <= delay <= 16 for delay in waits)
+        assert len(set(waits)) > 1
+
 
 class TestBrowserErrorClassification:
     """Test _is_retryable_browser_error classification."""
@@ -848,6 +961,7 @@ class TestPersistentBrowser:
 
         mock_context = Mock()
         mock_context.new_page.return_value = mock_page
+        mock_context.cookies.return_value = []
         mock_context.route = Mock()
 
         mock_browser = Mock(spec=Browser)
@@ -875,6 +989,86 @@ class TestPersistentBrowser:
         # Cleanup
         fetcher.close()
 
+    def test_browser_survives_asyncio_run_between_fetches(self, mocker: MockerFixture) -> None:
+        """Test browser runs on its own thread and is not relaunched around asyncio.run()."""
+        # Arrange
+        mocker.patch("src.scraper.fetcher.time.sleep")
+
+        mock_page = Mock(spec=Page)
+        mock_page.content.return_value = "<html>test</html>"
+
+        mock_context = Mock()
+        mock_context.new_page.return_value = mock_page
+        mock_context.cookies.return_value = []
+
+        mock_browser = Mock(spec=Browser)
+        mock_browser.new_context.return_value = mock_context
+
+        mock_playwright = Mock(spec=Playwright)
+        mock_playwright.chromium.launch.return_value = mock_browser
+
+        mock_sync_playwright = mocker.patch("src.scraper.fetcher.sync_playwright")
+        mock_sync_playwright.return_value.start.return_value = mock_playwright
+
+        start_threads: list[str] = []
+        mock_sync_playwright.side_effect = lambda: (
+            start_threads.append(threading.current_thread().name)
+            or mock_sync_playwright.return_value
+        )
+
+        fetcher = RespectfulFetcher()
+
+        # Act
+        fetcher.fetch_with_browser("https://example.com/first")
+        asyncio.run(asyncio.sleep(0))
+        fetcher.fetch_with_browser("https://example.com/second")
+
+        # Assert
+        mock_playwright.chromium.launch.assert_called_once()
+        assert len(start_threads) == 1
+        assert start_threads[0].startswith("playwright")
+
+        # Cleanup
+        fetcher.close()
+
+    def test_browser_cookies_shared_with_http_client_once(self, mocker: MockerFixture) -> None:
+        """Test the first browser fetch copies session cookies into the HTTP client."""
+        # Arrange
+        mocker.patch("src.scraper.fetcher.time.sleep")
+
+        mock_page = Mock(spec=Page)
+        mock_page.content.return_value = "<html>test</html>"
+
+        mock_context = Mock()
+        mock_context.new_page.return_value = mock_page
+        mock_context.cookies.return_value = [
+            {"name": "_session", "value": "abc123", "domain": "example.com", "path": "/"}
+        ]
+
+        mock_browser = Mock(spec=Browser)
+        mock_browser.new_context.return_value = mock_context
+
+        mock_playwright = Mock(spec=Playwright)
+        mock_playwright.chromium.launch.return_value = mock_browser
+
+        mock_sync_playwright = mocker.patch("src.scraper.fetcher.sync_playwright")
+        mock_sync_playwright.return_value.start.return_value = mock_playwright
+
+        fetcher = RespectfulFetcher()
+
+        # Act
+        fetcher.warm_up("https://example.com/")
+        fetcher.warm_up("https://example.com/")
+        fetcher.fetch_with_browser("https://example.com/page")
+
+        # Assert
+        assert fetcher.client.cookies.get("_session", domain="example.com") == "abc123"
+        mock_context.cookies.assert_called_once()
+        assert mock_context.new_page.call_count == 2
+
+        # Cleanup
+        fetcher.close()
+
     def test_close_cleans_up_browser(self, mocker: MockerFixture) -> None:
         """Test close() properly cleans up browser context, browser, and playwright."""
         # Arrange
@@ -887,6 +1081,7 @@ class TestPersistentBrowser:
 
         mock_context = Mock()
         mock_context.new_page.return_value = mock_page
+        mock_context.cookies.return_value = []
         mock_context.route = Mock()
 
         mock_browser = Mock(spec=Browser)
@@ -927,6 +1122,7 @@ class TestPersistentBrowser:
 
         mock_context = Mock()
         mock_context.new_page.side_effect = [mock_page_fail, mock_page_success]
+        mock_context.cookies.return_value = []
         mock_context.route = Mock()
 
         mock_browser = Mock(spec=Browser)
@@ -997,6 +1193,7 @@ class TestPersistentBrowser:
 
         mock_context = Mock()
         mock_context.new_page.return_value = mock_page
+        mock_context.cookies.return_value = []
 
         mock_browser = Mock(spec=Browser)
         mock_browser.new_context.return_value = mock_context
@@ -1033,6 +1230,7 @@ class TestPersistentBrowser:
 
         mock_context = Mock()
         mock_context.new_page.return_value = mock_page
+        mock_context.cookies.return_value = []
 
         mock_browser = Mock(spec=Browser)
         mock_browser.new_context.return_value = mock_context
@@ -1103,7 +1301,7 @@ class TestCheckEtag:
         """Test check_etag returns (True, hash) when no previous hash exists."""
         # Arrange
         mocker.patch("src.scraper.fetcher.time.sleep")
-        mocker.patch("src.scraper.fetcher.time.time", return_value=0.0)
+        mocker.patch("src.scraper.fetcher.monotonic", return_value=0.0)
 
         mock_response = Mock(spec=httpx.Response)
         mock_response.status_code = 200
@@ -1128,7 +1326,7 @@ class TestCheckEtag:
         """Test check_etag returns (False, hash) when content is unchanged."""
         # Arrange
         mocker.patch("src.scraper.fetcher.time.sleep")
-        mocker.patch("src.scraper.fetcher.time.time", return_value=0.0)
+        mocker.patch("src.scraper.fetcher.monotonic", return_value=0.0)
 
         html = "<html><body>Same Content</body></html>"
         mock_response = Mock(spec=httpx.Response)
@@ -1158,7 +1356,7 @@ class TestCheckEtag:
         """Test check_etag returns (True, new_hash) when content has changed."""
         # Arrange
         mocker.patch("src.scraper.fetcher.time.sleep")
-        mocker.patch("src.scraper.fetcher.time.time", return_value=0.0)
+        mocker.patch("src.scraper.fetcher.monotonic", return_value=0.0)
 
         mock_response_1 = Mock(spec=httpx.Response)
         mock_response_1.status_code = 200
@@ -1190,7 +1388,7 @@ class TestCheckEtag:
         """Test check_etag returns (True, previous_hash) on HTTP error."""
         # Arrange
         mocker.patch("src.scraper.fetcher.time.sleep")
-        mocker.patch("src.scraper.fetcher.time.time", return_value=0.0)
+        mocker.patch("src.scraper.fetcher.monotonic", return_value=0.0)
 
         mock_response = Mock(spec=httpx.Response)
         mock_response.status_code = 500
@@ -1625,6 +1823,102 @@ class TestAsyncScrapeApplicationPages:
         fetcher.close()
 
 
+class TestAsyncFetchAll:
+    """Test RespectfulFetcher.async_fetch_all() per-host paced fetching."""
+
+    async def test_returns_responses_in_order_with_errors_for_failures(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test responses keep input order and failed URLs return their error."""
+        # Arrange
+        mocker.patch("src.scraper.fetcher.asyncio.sleep", return_value=None)
+
+        async def mock_get(url: str, **kwargs: object) -> httpx.Response:
+            status = 404 if url.endswith("missing") else 200
+            return httpx.Response(status, text=url, request=httpx.Request("GET", url))
+
+        mock_client = mocker.AsyncMock()
+        mock_client.get = mock_get
+        mock_client.__aenter__ = mocker.AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = mocker.AsyncMock(return_value=False)
+        mocker.patch("src.scraper.fetcher.httpx.AsyncClient", return_value=mock_client)
+
+        fetcher = RespectfulFetcher()
+        urls = ["https://a.example/1", "https://a.example/missing", "https://b.example/2"]
+
+        # Act
+        results = await fetcher.async_fetch_all(urls)
+
+        # Assert
+        assert isinstance(results[0], httpx.Response)
+        assert results[0].text == "https://a.example/1"
+        assert isinstance(results[1], httpx.HTTPStatusError)
+        assert results[1].response.status_code == 404
+        assert isinstance(results[2], httpx.Response)
+        assert results[2].text == "https://b.example/2"
+
+        # Cleanup
+        fetcher.close()
+
+    async def test_non_http_errors_are_returned_per_url(self, mocker: MockerFixture) -> None:
+        """Test an exception other than an HTTP error fails only its own URL."""
+        # Arrange
+        mocker.patch("src.scraper.fetcher.asyncio.sleep", return_value=None)
+
+        async def mock_get(url: str, **kwargs: object) -> httpx.Response:
+            if url.endswith("broken"):
+                msg = "cache write failed"
+                raise OSError(msg)
+            return httpx.Response(200, text=url, request=httpx.Request("GET", url))
+
+        mock_client = mocker.AsyncMock()
+        mock_client.get = mock_get
+        mock_client.__aenter__ = mocker.AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = mocker.AsyncMock(return_value=False)
+        mocker.patch("src.scraper.fetcher.httpx.AsyncClient", return_value=mock_client)
+
+        fetcher = RespectfulFetcher()
+        urls = ["https://a.example/broken", "https://b.example/2"]
+
+        # Act
+        results = await fetcher.async_fetch_all(urls)
+
+        # Assert
+        assert isinstance(results[0], OSError)
+        assert isinstance(results[1], httpx.Response)
+        assert results[1].text == "https://b.example/2"
+
+        # Cleanup
+        fetcher.close()
+
+    async def test_spaces_requests_per_host_only(self, mocker: MockerFixture) -> None:
+        """Test only repeat requests to the same host wait for the rate limit."""
+        # Arrange
+        mock_sleep = mocker.patch("src.scraper.fetcher.asyncio.sleep", return_value=None)
+        mocker.patch("src.scraper.fetcher.monotonic", return_value=100.0)
+
+        async def mock_get(url: str, **kwargs: object) -> httpx.Response:
+            return httpx.Response(200, text="ok", request=httpx.Request("GET", url))
+
+        mock_client = mocker.AsyncMock()
+        mock_client.get = mock_get
+        mock_client.__aenter__ = mocker.AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = mocker.AsyncMock(return_value=False)
+        mocker.patch("src.scraper.fetcher.httpx.AsyncClient", return_value=mock_client)
+
+        fetcher = RespectfulFetcher()
+        urls = ["https://a.example/1", "https://b.example/1", "https://a.example/2"]
+
+        # Act
+        await fetcher.async_fetch_all(urls)
+
+        # Assert - the second a.example request is the only one delayed
+        assert mock_sleep.await_count == 1
+
+        # Cleanup
+        fetcher.close()
+
+
 class TestAsyncFetchDetailPages:
     """Test RespectfulFetcher.async_fetch_detail_pages() concurrent batch fetching."""
 
@@ -1759,3 +2053,102 @@ class TestAsyncFetchDetailPages:
 
         # Cleanup
         fetcher.close()
+
+
+class TestAsyncFetchWithBrowser:
+    """Test RespectfulFetcher.async_fetch_with_browser() context-pool rendering."""
+
+    async def test_renders_pages_through_bounded_context_pool(self, mocker: MockerFixture) -> None:
+        """Test pages render in input order, failures become None, contexts are capped."""
+        # Arrange
+        mocker.patch("src.scraper.fetcher.asyncio.sleep", return_value=None)
+
+        def make_page(url_holder: list[str]) -> Mock:
+            page = mocker.AsyncMock()
+
+            async def goto(url: str, **kwargs: object) -> None:
+                if url.endswith("missing"):
+                    msg = "net::ERR_NAME_NOT_RESOLVED"
+                    raise RuntimeError(msg)
+                url_holder.append(url)
+
+            async def content() -> str:
+                return f"<html>{url_holder[-1]}</html>"
+
+            page.goto = goto
+            page.content = content
+            return page
+
+        mock_context = mocker.AsyncMock()
+        mock_context.new_page.side_effect = lambda: make_page([])
+        mock_browser = mocker.AsyncMock()
+        mock_browser.new_context.return_value = mock_context
+        mock_async_playwright = mocker.patch("src.scraper.fetcher.async_playwright")
+        mock_pw = mock_async_playwright.return_value.__aenter__.return_value
+        mock_pw.chromium.launch = mocker.AsyncMock(return_value=mock_browser)
+
+        fetcher = RespectfulFetcher()
+        urls = [f"https://example.com/{i}" for i in range(5)] + ["https://example.com/missing"]
+
+        # Act
+        results = await fetcher.async_fetch_with_browser(urls, concurrency=2)
+
+        # Assert
+        assert results[:5] == [f"<html>https://example.com/{i}</html>" for i in range(5)]
+        assert results[5] is None
+        assert mock_browser.new_context.await_count == 2
+        mock_browser.close.assert_awaited_once()
+
+        # Cleanup
+        fetcher.close()
+
+    async def test_empty_url_list_skips_browser_launch(self, mocker: MockerFixture) -> None:
+        """Test no browser is launched for an empty batch."""
+        # Arrange
+        mock_async_playwright = mocker.patch("src.scraper.fetcher.async_playwright")
+        fetcher = RespectfulFetcher()
+
+        # Act
+        results = await fetcher.async_fetch_with_browser([])
+
+        # Assert
+        assert results == []
+        mock_async_playwright.assert_not_called()
+
+        # Cleanup
+        fetcher.close()
+
+
+class TestRunAsync:
+    """Test run_async() event loop selection."""
+
+    def test_runs_coroutine_on_default_loop_without_uvloop(self, mocker: MockerFixture) -> None:
+        """Test run_async falls back to asyncio's default loop when uvloop is missing."""
+        # Arrange
+        mocker.patch("src.scraper.fetcher.uvloop", None)
+
+        async def _answer() -> int:
+            await asyncio.sleep(0)
+            return 42
+
+        # Act
+        result = run_async(_answer())
+
+        # Assert
+        assert result == 42
+
+    def test_uses_uvloop_loop_factory_when_installed(self, mocker: MockerFixture) -> None:
+        """Test run_async runs the coroutine on a loop created by uvloop."""
+        # Arrange
+        mock_uvloop = mocker.patch("src.scraper.fetcher.uvloop")
+        mock_uvloop.new_event_loop.side_effect = asyncio.new_event_loop
+
+        async def _answer() -> int:
+            return 42
+
+        # Act
+        result = run_async(_answer())
+
+        # Assert
+        assert result == 42
+        mock_uvloop.new_event_loop.assert_called_once()
@@ -11,8 +11,8 @@ from typing import Any
 import pytest
 from pydantic import ValidationError
 
-from src.models.part import Part, PartImage
-from src.models.vehicle import Vehicle, VehicleCompatibility
+from src.models.part import PART_LIST_ADAPTER, Part, PartImage, ReferenceNumber
+from src.models.vehicle import COMPATIBILITY_LIST_ADAPTER, Vehicle, VehicleCompatibility
 
 
 class TestPartImage:
@@ -191,6 +191,55 @@ class TestPart:
         # Assert
         assert part.sku == "CSF-12345"
 
+    def test_part_sku_mixed_case_suffix_normalized_to_uppercase(self) -> None:
+        """Test that lowercase letters after the prefix are uppercased too."""
+        # Arrange
+        mixed_sku = "  CSF-12345ab  "
+
+        # Act
+        part = Part(sku=mixed_sku, name="Test Part", category="Test")
+
+        # Assert
+        assert part.sku == "CSF-12345AB"
+
+    def test_part_sku_is_interned(self) -> None:
+        """Test that parts parsed separately share one interned SKU string."""
+        # Arrange
+        first_sku = "".join(["CSF-", "3680"])
+        second_sku = "".join(["csf-", "3680"])
+
+        # Act
+        first = Part(sku=first_sku, name="Test Part", category="Test")
+        second = Part(sku=second_sku, name="Test Part", category="Test")
+
+        # Assert
+        assert first.sku is second.sku
+
+    def test_part_repeated_strings_are_interned(self) -> None:
+        """Test that category, manufacturer and reference type strings are shared."""
+        # Arrange
+        skus = ["CSF-3680", "CSF-3681"]
+
+        # Act - build each string at runtime so only interning can share it
+        first, second = (
+            Part(
+                sku=sku,
+                name="Test Part",
+                category="".join(["radia", "tors"]),
+                manufacturer="".join(["CS", "F"]),
+                interchange_numbers=[
+                    ReferenceNumber(reference_number="19010", reference_type="".join(["O", "EM"]))
+                ],
+            )
+            for sku in skus
+        )
+
+        # Assert
+        assert first.category is second.category
+        assert first.manufacturer is second.manufacturer
+        first_type = first.interchange_numbers[0].reference_type
+        assert first_type is second.interchange_numbers[0].reference_type
+
     def test_part_price_optional(self) -> None:
         """Test that price is optional."""
         # Arrange
@@ -626,6 +675,24 @@ class TestVehicle:
                 year=1800,  # Invalid year
             )
 
+    def test_vehicle_intern_returns_shared_instance_for_equal_fields(self) -> None:
+        """Test that Vehicle.intern() reuses one instance per field tuple."""
+        # Arrange & Act
+        first = Vehicle.intern(make="honda", model="accord", year=2020, qualifiers=["Manual"])
+        second = Vehicle.intern(make="Honda", model="Accord", year=2020, qualifiers=["Manual"])
+        other = Vehicle.intern(make="Honda", model="Accord", year=2021, qualifiers=["Manual"])
+
+        # Assert
+        assert first is second
+        assert other is not first
+        assert first == Vehicle(make="Honda", model="Accord", year=2020, qualifiers=["Manual"])
+
+    def test_vehicle_intern_validates_fields(self) -> None:
+        """Test that Vehicle.intern() rejects invalid data like the constructor."""
+        # Arrange & Act & Assert
+        with pytest.raises(ValidationError):
+            Vehicle.intern(make="Honda", model="Accord", year=1800)
+
 
 class TestVehicleCompatibility:
     """Tests for VehicleCompatibility model."""
@@ -816,6 +883,34 @@ class TestVehicleCompatibility:
         # Assert
         assert result is False
 
+    def test_compatibility_is_compatible_with_matches_equal_vehicle(self) -> None:
+        """Test is_compatible_with matches a separately built but equal vehicle."""
+        # Arrange
+        vehicles = [Vehicle(make="Honda", model="Civic", year=2020, qualifiers=["w/ A/C"])]
+        compatibility = VehicleCompatibility(part_sku="CSF-12345", vehicles=vehicles)
+        lookup = Vehicle(make="Honda", model="Civic", year=2020, qualifiers=["w/ A/C"])
+
+        # Act
+        result = compatibility.is_compatible_with(lookup)
+
+        # Assert
+        assert result is True
+
+    def test_vehicle_hash_consistent_with_equality(self) -> None:
+        """Test equal vehicles (including qualifiers) hash equally."""
+        # Arrange
+        vehicle1 = Vehicle(make="Honda", model="Civic", year=2020, qualifiers=["Manual"])
+        vehicle2 = Vehicle(make="honda", model="civic", year=2020, qualifiers=["Manual"])
+        vehicle3 = Vehicle(make="Honda", model="Civic", year=2020, qualifiers=["Automatic"])
+
+        # Act
+        unique = {vehicle1, vehicle2, vehicle3}
+
+        # Assert
+        assert vehicle1 == vehicle2
+        assert hash(vehicle1) == hash(vehicle2)
+        assert len(unique) == 2
+
     def test_compatibility_rejects_invalid_data(self) -> None:
         """Test that VehicleCompatibility rejects completely invalid data."""
         # Arrange & Act & Assert
@@ -1269,6 +1364,41 @@ class TestVehicleCompatibilitySerialization:
         assert data["vehicles"][0]["engine"] == "5.7L V8"
 
 
+class TestListAdapterSerialization:
+    """Tests for the bulk list TypeAdapters."""
+
+    def test_part_list_adapter_matches_model_dump(self) -> None:
+        """Test PART_LIST_ADAPTER output equals per-part model_dump(mode="json")."""
+        # Arrange
+        parts = [
+            Part(sku="CSF-10001", name="Radiator", price=Decimal("149.99"), category="Radiators"),
+            Part(sku="CSF-10002", name="Condenser", category="Condensers"),
+        ]
+
+        # Act
+        data = PART_LIST_ADAPTER.dump_python(parts, mode="json")
+
+        # Assert
+        assert data == [part.model_dump(mode="json") for part in parts]
+        assert data[0]["price"] == "149.99"
+
+    def test_compatibility_list_adapter_matches_model_dump(self) -> None:
+        """Test COMPATIBILITY_LIST_ADAPTER output equals per-item model_dump(mode="json")."""
+        # Arrange
+        compatibility = [
+            VehicleCompatibility(
+                part_sku="CSF-10001",
+                vehicles=[Vehicle(make="Honda", model="Civic", year=2020)],
+            ),
+        ]
+
+        # Act
+        data = COMPATIBILITY_LIST_ADAPTER.dump_python(compatibility, mode="json")
+
+        # Assert
+        assert data == [comp.model_dump(mode="json") for comp in compatibility]
+
+
 # ============================================================================
 # Edge Case and Boundary Tests
 # ============================================================================
@@ -18,7 +18,7 @@ import httpx
 import pytest
 from pytest_mock import MockerFixture
 
-from src.models.part import Part
+from src.models.part import Part, PartImage
 from src.models.vehicle import Vehicle
 from src.scraper.ajax_parser import AJAXParsingError, AJAXResponseParser
 from src.scraper.etag_store import ETagStore
@@ -209,7 +209,9 @@ class TestEnumerateMakes:
         mock_response_models = Mock(spec=httpx.Response)
         mock_response_models.text = "models_js"
 
-        mock_fetcher.fetch.side_effect = [mock_response_years, mock_response_models]
+        mock_fetcher.async_fetch_all = AsyncMock(
+            side_effect=[[mock_response_years], [mock_response_models]]
+        )
 
         mock_ajax.parse_year_response.return_value = {100: "2024"}
         mock_ajax.parse_model_response.return_value = {8000: "Camry"}
@@ -243,21 +245,18 @@ class TestBuildHierarchyErrorHandling:
         mock_fetcher = Mock()
         mock_ajax = Mock(spec=AJAXResponseParser)
 
-        # Honda fails, Toyota succeeds
-        honda_error = AJAXParsingError("No .html() call found")
-
         mock_response_toyota_years = Mock(spec=httpx.Response)
         mock_response_toyota_years.text = "years_js"
 
         mock_response_toyota_models = Mock(spec=httpx.Response)
         mock_response_toyota_models.text = "models_js"
 
-        # fetch() calls: Honda years fails, Toyota years succeeds, Toyota models succeeds
-        mock_fetcher.fetch = Mock(
+        mock_fetcher.async_fetch_all = AsyncMock(
             side_effect=[
-                honda_error,  # Honda years
-                mock_response_toyota_years,  # Toyota years
-                mock_response_toyota_models,  # Toyota 2024 models
+                # Batched years fetch: Honda fails after retries, Toyota succeeds
+                [httpx.ConnectTimeout("timed out"), mock_response_toyota_years],
+                # Batched model fetch: Toyota 2024 models succeeds
+                [mock_response_toyota_models],
             ]
         )
 
@@ -283,9 +282,12 @@ class TestBuildHierarchyErrorHandling:
         assert hierarchy[0]["make"] == "Toyota"
         assert hierarchy[0]["model"] == "Camry"
 
-        # Failure was recorded
+        # Failure was recorded with the fetch error's real type
         failures = orchestrator.failure_tracker.get_failed_identifiers("hierarchy")
         assert "make:Honda" in failures
+        failure = orchestrator.failure_tracker.failures[0]
+        assert failure.error_type == "ConnectTimeout"
+        assert failure.error_message == "timed out"
 
     def test_build_hierarchy_continues_on_failed_year(
         self, mocker: MockerFixture, tmp_path: Path
@@ -298,15 +300,16 @@ class TestBuildHierarchyErrorHandling:
         mock_response_years = Mock(spec=httpx.Response)
         mock_response_years.text = "years_js"
 
-        mock_response_models_fail = AJAXParsingError("No .html() call found")
         mock_response_models_ok = Mock(spec=httpx.Response)
         mock_response_models_ok.text = "models_js"
 
-        mock_fetcher.fetch = Mock(
+        mock_fetcher.async_fetch_all = AsyncMock(
             side_effect=[
-                mock_response_years,  # Honda years (succeeds)
-                mock_response_models_fail,  # 2024 models (fails)
-                mock_response_models_ok,  # 2023 models (succeeds)
+                [mock_response_years],  # Honda years (succeeds)
+                [
+                    OSError("cache write failed"),  # 2024 models (not an HTTP error)
+                    mock_response_models_ok,  # 2023 models (succeeds)
+                ],
             ]
         )
 
@@ -328,9 +331,61 @@ class TestBuildHierarchyErrorHandling:
         assert len(hierarchy) == 1
         assert hierarchy[0]["year"] == "2023"
 
-        # Failure was recorded
+        # Failure was recorded with the fetch error's real type
         failures = orchestrator.failure_tracker.get_failed_identifiers("hierarchy")
         assert any("2024" in f for f in failures)
+        assert orchestrator.failure_tracker.failures[0].error_type == "OSError"
+
+    def test_build_hierarchy_batches_models_across_makes(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test model dropdowns for all makes are fetched in one batch, keeping make order."""
+        # Arrange
+        mock_fetcher = Mock()
+        mock_ajax = Mock(spec=AJAXResponseParser)
+
+        mock_response_years = Mock(spec=httpx.Response)
+        mock_response_years.text = "years_js"
+        mock_fetcher.async_fetch_all = AsyncMock(
+            side_effect=[
+                [mock_response_years, mock_response_years],
+                [Mock(spec=httpx.Response), Mock(spec=httpx.Response)],
+            ]
+        )
+
+        mock_ajax.parse_year_response.side_effect = [{100: "2024"}, {200: "2024"}]
+        mock_ajax.parse_model_response.side_effect = [
+            {8000: "Accord"},
+            AJAXParsingError("No .html() call found"),
+        ]
+
+        orchestrator = ScraperOrchestrator.__new__(ScraperOrchestrator)
+        orchestrator.fetcher = mock_fetcher
+        orchestrator.ajax_parser = mock_ajax
+        orchestrator.failure_tracker = FailureTracker()
+        orchestrator.hierarchy_cache = HierarchyCache(tmp_path / "hc.json")
+
+        mocker.patch.object(
+            orchestrator, "_enumerate_makes", return_value={3: "Honda", 4: "Toyota"}
+        )
+
+        # Act
+        hierarchy = orchestrator._build_hierarchy()  # noqa: SLF001
+
+        # Assert
+        assert [c.args[0] for c in mock_fetcher.async_fetch_all.await_args_list] == [
+            [
+                "https://csf.mycarparts.com/get_year_by_make/3",
+                "https://csf.mycarparts.com/get_year_by_make/4",
+            ],
+            [
+                "https://csf.mycarparts.com/get_model_by_make_year/100",
+                "https://csf.mycarparts.com/get_model_by_make_year/200",
+            ],
+        ]
+        assert [(e["make"], e["model"]) for e in hierarchy] == [("Honda", "Accord")]
+        failures = orchestrator.failure_tracker.get_failed_identifiers("hierarchy")
+        assert "year:Toyota/2024" in failures
 
 
 class TestCheckpointWithPartsData:
@@ -380,6 +435,7 @@ class TestCheckpointWithPartsData:
         assert "CSF-1001" in orchestrator2.unique_parts
         assert "CSF-1002" in orchestrator2.unique_parts
         assert orchestrator2.unique_parts["CSF-1001"].name == "Radiator A"
+        assert orchestrator2.unique_parts["CSF-1002"] == part2
 
         # Vehicle compat restored
         assert "CSF-1001" in orchestrator2.vehicle_compat
@@ -394,6 +450,152 @@ class TestCheckpointWithPartsData:
         orchestrator.close()
         orchestrator2.close()
 
+    def test_checkpoint_file_is_indented_json(self, tmp_path: Path) -> None:
+        """Test checkpoint stays human-readable JSON pointing at the processed log."""
+        # Arrange
+        orchestrator = ScraperOrchestrator(
+            output_dir=tmp_path / "exports",
+            checkpoint_dir=tmp_path / "checkpoints",
+        )
+        orchestrator.processed_application_ids = {100, 200}
+
+        # Act
+        checkpoint_path = orchestrator._save_checkpoint(  # noqa: SLF001
+            make_filter="Honda",
+            year_filter=2024,
+        )
+
+        # Assert
+        text = checkpoint_path.read_text()
+        assert '\n  "timestamp": ' in text
+        data = json.loads(text)
+        assert data["processed_log"].startswith("processed_honda_2024_")
+        assert data["processed_log_entries"] == 2
+        assert data["make_filter"] == "Honda"
+        assert data["year_filter"] == 2024
+
+        # Cleanup
+        orchestrator.close()
+
+    def test_failed_checkpoint_write_leaves_no_partial_file(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test a write that fails part-way leaves neither a checkpoint nor its temp file."""
+        # Arrange
+        orchestrator = ScraperOrchestrator(
+            output_dir=tmp_path / "exports",
+            checkpoint_dir=tmp_path / "checkpoints",
+        )
+        dumps = mocker.patch(
+            "src.scraper.orchestrator.orjson.dumps", side_effect=TypeError("not serializable")
+        )
+
+        # Act & Assert
+        with pytest.raises(TypeError, match="not serializable"):
+            orchestrator._save_checkpoint(make_filter=None, year_filter=None)  # noqa: SLF001
+        # orjson is shared module-wide; close() serializes the image manifest
+        mocker.stop(dumps)
+        assert list((tmp_path / "checkpoints").glob("checkpoint_*")) == []
+        assert orchestrator._get_latest_checkpoint() is None  # noqa: SLF001
+
+        # Cleanup
+        orchestrator.close()
+
+    def test_processed_log_appends_without_rewriting(self, tmp_path: Path) -> None:
+        """Test each processed application appends one 4-byte record to the log."""
+        # Arrange
+        orchestrator = ScraperOrchestrator(
+            output_dir=tmp_path / "exports",
+            checkpoint_dir=tmp_path / "checkpoints",
+        )
+        orchestrator._mark_processed(100)  # noqa: SLF001
+        checkpoint_path = orchestrator._save_checkpoint(None, None)  # noqa: SLF001
+        log_path = checkpoint_path.parent / json.loads(checkpoint_path.read_text())["processed_log"]
+
+        # Act
+        orchestrator._mark_processed(200)  # noqa: SLF001
+        orchestrator._mark_processed(300)  # noqa: SLF001
+        orchestrator._save_checkpoint(None, None)  # noqa: SLF001
+
+        # Assert
+        assert log_path.stat().st_size == 3 * 4
+        assert orchestrator.processed_application_ids == {100, 200, 300}
+
+        # Cleanup
+        orchestrator.close()
+
+    def test_load_ignores_log_entries_after_checkpoint(self, tmp_path: Path) -> None:
+        """Test IDs logged after the checkpoint are not treated as processed."""
+        # Arrange
+        orchestrator = ScraperOrchestrator(
+            output_dir=tmp_path / "exports",
+            checkpoint_dir=tmp_path / "checkpoints",
+        )
+        orchestrator._mark_processed(100)  # noqa: SLF001
+        checkpoint_path = orchestrator._save_checkpoint(None, None)  # noqa: SLF001
+        orchestrator._mark_processed(200)  # noqa: SLF001
+        orchestrator.close()
+
+        orchestrator2 = ScraperOrchestrator(
+            output_dir=tmp_path / "exports",
+            checkpoint_dir=tmp_path / "checkpoints",
+        )
+
+        # Act
+        orchestrator2._load_checkpoint(checkpoint_path)  # noqa: SLF001
+
+        # Assert
+        assert orchestrator2.processed_application_ids == {100}
+
+        # Cleanup
+        orchestrator2.close()
+
+    def test_checkpoint_after_resume_deletes_superseded_log(self, tmp_path: Path) -> None:
+        """Test the resumed run's first checkpoint removes the log it replaced."""
+        # Arrange
+        orchestrator = ScraperOrchestrator(
+            output_dir=tmp_path / "exports",
+            checkpoint_dir=tmp_path / "checkpoints",
+        )
+        orchestrator._mark_processed(100)  # noqa: SLF001
+        checkpoint_path = orchestrator._save_checkpoint(None, None)  # noqa: SLF001
+        orchestrator.close()
+        old_log = checkpoint_path.parent / json.loads(checkpoint_path.read_text())["processed_log"]
+
+        orchestrator2 = ScraperOrchestrator(
+            output_dir=tmp_path / "exports",
+            checkpoint_dir=tmp_path / "checkpoints",
+        )
+        orchestrator2._load_checkpoint(checkpoint_path)  # noqa: SLF001
+
+        # Act
+        new_checkpoint = orchestrator2._save_checkpoint(None, None)  # noqa: SLF001
+
+        # Assert
+        new_log = new_checkpoint.parent / json.loads(new_checkpoint.read_text())["processed_log"]
+        assert not old_log.exists()
+        assert list((tmp_path / "checkpoints").glob("processed_*.bin")) == [new_log]
+
+        # Cleanup
+        orchestrator2.close()
+
+    def test_load_with_truncated_processed_log_raises_value_error(self, tmp_path: Path) -> None:
+        """Test a processed log shorter than the checkpoint's entry count is rejected."""
+        # Arrange
+        orchestrator = ScraperOrchestrator(
+            output_dir=tmp_path / "exports",
+            checkpoint_dir=tmp_path / "checkpoints",
+        )
+        orchestrator.processed_application_ids = {100, 200}
+        checkpoint_path = orchestrator._save_checkpoint(None, None)  # noqa: SLF001
+        orchestrator.close()
+        log_path = checkpoint_path.parent / json.loads(checkpoint_path.read_text())["processed_log"]
+        log_path.write_bytes(log_path.read_bytes()[:4])
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="processed log truncated"):
+            orchestrator._load_checkpoint(checkpoint_path)  # noqa: SLF001
+
     def test_checkpoint_backward_compatible_with_old_format(self, tmp_path: Path) -> None:
         """Test loading old checkpoint without parts_data still works."""
         # Arrange
@@ -619,6 +821,29 @@ class TestContentHash:
         # Assert
         assert hash_a == hash_b
 
+    def test_content_hash_ignores_specification_order(self) -> None:
+        """Test that specification key order doesn't change the hash."""
+        # Arrange
+        part_a = Part(
+            sku="CSF-1001",
+            name="Radiator A",
+            category="Radiator",
+            specifications={"Core Rows": "2", "Inlet": "1.25 in"},
+        )
+        part_b = Part(
+            sku="CSF-1001",
+            name="Radiator A",
+            category="Radiator",
+            specifications={"Inlet": "1.25 in", "Core Rows": "2"},
+        )
+
+        # Act
+        hash_a = ScraperOrchestrator._content_hash(part_a)  # noqa: SLF001
+        hash_b = ScraperOrchestrator._content_hash(part_b)  # noqa: SLF001
+
+        # Assert
+        assert hash_a == hash_b
+
 
 class TestLoadPreviousExport:
     """Test load_previous_export() method."""
@@ -674,7 +899,7 @@ class TestLoadPreviousExport:
         assert len(hashes) == 2
         assert "CSF-1001" in hashes
         assert "CSF-1002" in hashes
-        # Hashes should be 32-char hex strings (MD5)
+        # Hashes should be 32-char hex strings (128-bit BLAKE2b)
         assert len(hashes["CSF-1001"]) == 32
         assert all(c in "0123456789abcdef" for c in hashes["CSF-1001"])
 
@@ -842,6 +1067,35 @@ class TestDeduplicateWithChanges:
         # Cleanup
         orchestrator.close()
 
+    def test_deduplicate_skips_tracked_vehicles_including_restored_ones(
+        self, tmp_path: Path
+    ) -> None:
+        """Test a vehicle is tracked once per SKU, also after compat is restored externally."""
+        # Arrange
+        orchestrator = ScraperOrchestrator(
+            output_dir=tmp_path / "exports",
+            checkpoint_dir=tmp_path / "checkpoints",
+        )
+        part = Part(sku="CSF-1001", name="Radiator", category="Radiator")
+        civic = Vehicle(make="Honda", model="Civic", year=2024)
+        civic_v6 = Vehicle(make="Honda", model="Civic", year=2024, engine="3.5L V6")
+        accord = Vehicle(make="Honda", model="Accord", year=2024)
+
+        # Act
+        orchestrator._deduplicate_and_track([part], civic)  # noqa: SLF001
+        orchestrator._deduplicate_and_track([part], civic)  # noqa: SLF001
+        orchestrator._deduplicate_and_track([part], civic_v6)  # noqa: SLF001
+        # Replaced wholesale, as checkpoint restore does
+        orchestrator.vehicle_compat["CSF-1001"] = [accord]
+        orchestrator._deduplicate_and_track([part], accord)  # noqa: SLF001
+        orchestrator._deduplicate_and_track([part], civic)  # noqa: SLF001
+
+        # Assert
+        assert orchestrator.vehicle_compat["CSF-1001"] == [accord, civic]
+
+        # Cleanup
+        orchestrator.close()
+
 
 class TestBuildHierarchyFilters:
     """Test _build_hierarchy with make_filter and year_filter."""
@@ -857,10 +1111,10 @@ class TestBuildHierarchyFilters:
         mock_response_models = Mock(spec=httpx.Response)
         mock_response_models.text = "models_js"
 
-        mock_fetcher.fetch = Mock(
+        mock_fetcher.async_fetch_all = AsyncMock(
             side_effect=[
-                mock_response_years,  # Honda years
-                mock_response_models,  # Honda 2024 models
+                [mock_response_years],  # Honda years
+                [mock_response_models],  # Honda 2024 models
             ]
         )
 
@@ -884,8 +1138,37 @@ class TestBuildHierarchyFilters:
         assert len(hierarchy) == 1
         assert hierarchy[0]["make"] == "Honda"
         assert hierarchy[0]["model"] == "Civic"
-        # fetch() was called only twice (Honda years + Honda 2024 models)
-        assert mock_fetcher.fetch.call_count == 2
+        # Only Honda years and Honda 2024 models were requested
+        assert [c.args[0] for c in mock_fetcher.async_fetch_all.await_args_list] == [
+            ["https://csf.mycarparts.com/get_year_by_make/3"],
+            ["https://csf.mycarparts.com/get_model_by_make_year/100"],
+        ]
+
+    def test_build_hierarchy_make_filter_is_case_insensitive(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test make_filter matches make names regardless of case."""
+        # Arrange
+        mock_fetcher = Mock()
+        mock_fetcher.async_fetch_all = AsyncMock(return_value=[httpx.ConnectError("refused")])
+
+        orchestrator = ScraperOrchestrator.__new__(ScraperOrchestrator)
+        orchestrator.fetcher = mock_fetcher
+        orchestrator.ajax_parser = Mock(spec=AJAXResponseParser)
+        orchestrator.failure_tracker = FailureTracker()
+        orchestrator.hierarchy_cache = HierarchyCache(tmp_path / "hc.json")
+
+        mocker.patch.object(
+            orchestrator, "_enumerate_makes", return_value={3: "Honda", 4: "Toyota"}
+        )
+
+        # Act
+        orchestrator._build_hierarchy(make_filter="hONDA")  # noqa: SLF001
+
+        # Assert - Only the Honda years URL was requested
+        mock_fetcher.async_fetch_all.assert_awaited_once_with(
+            ["https://csf.mycarparts.com/get_year_by_make/3"], cached=True
+        )
 
     def test_build_hierarchy_with_year_filter(self, mocker: MockerFixture, tmp_path: Path) -> None:
         """Test _build_hierarchy filters years when year_filter is set."""
@@ -899,10 +1182,10 @@ class TestBuildHierarchyFilters:
         mock_response_models.text = "models_js"
 
         # Only 1 model call needed (2024 is filtered out, only 2023 remains)
-        mock_fetcher.fetch = Mock(
+        mock_fetcher.async_fetch_all = AsyncMock(
             side_effect=[
-                mock_response_years,  # Honda years
-                mock_response_models,  # Honda 2023 models
+                [mock_response_years],  # Honda years
+                [mock_response_models],  # Honda 2023 models
             ]
         )
 
@@ -924,6 +1207,43 @@ class TestBuildHierarchyFilters:
         assert len(hierarchy) == 1
         assert hierarchy[0]["year"] == "2023"
         assert hierarchy[0]["model"] == "Accord"
+        assert mock_fetcher.async_fetch_all.await_args.args[0] == [
+            "https://csf.mycarparts.com/get_model_by_make_year/101"
+        ]
+
+    def test_build_hierarchy_year_filter_skips_non_numeric_labels(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test a non-numeric year label is filtered out instead of raising."""
+        # Arrange
+        mock_fetcher = Mock()
+        mock_ajax = Mock(spec=AJAXResponseParser)
+
+        mock_response_years = Mock(spec=httpx.Response)
+        mock_response_years.text = "years_js"
+        mock_response_models = Mock(spec=httpx.Response)
+        mock_response_models.text = "models_js"
+
+        mock_fetcher.async_fetch_all = AsyncMock(
+            side_effect=[[mock_response_years], [mock_response_models]]
+        )
+
+        mock_ajax.parse_year_response.return_value = {99: "All Years", 101: "2023"}
+        mock_ajax.parse_model_response.return_value = {9000: "Accord"}
+
+        orchestrator = ScraperOrchestrator.__new__(ScraperOrchestrator)
+        orchestrator.fetcher = mock_fetcher
+        orchestrator.ajax_parser = mock_ajax
+        orchestrator.failure_tracker = FailureTracker()
+        orchestrator.hierarchy_cache = HierarchyCache(tmp_path / "hc.json")
+
+        mocker.patch.object(orchestrator, "_enumerate_makes", return_value={3: "Honda"})
+
+        # Act
+        hierarchy = orchestrator._build_hierarchy(year_filter=2023)  # noqa: SLF001
+
+        # Assert
+        assert [(e["year"], e["model"]) for e in hierarchy] == [("2023", "Accord")]
 
 
 class TestEnrichPartWithDetails:
@@ -983,6 +1303,35 @@ class TestEnrichPartWithDetails:
             ],
         )
 
+    def test_enrich_part_validates_only_replaced_fields(self) -> None:
+        """Test enrichment copies untouched fields and validates replaced ones."""
+        # Arrange
+        orchestrator = ScraperOrchestrator.__new__(ScraperOrchestrator)
+        orchestrator.image_processor = Mock()
+        original_part = Part(sku="CSF-1001", name="Radiator", category="Radiator")
+        orchestrator.unique_parts = {"CSF-1001": original_part}
+        orchestrator.image_processor.process_images.return_value = [
+            {"url": " https://cdn.example.com/1001.avif ", "alt_text": None, "is_primary": True}
+        ]
+
+        # Act
+        orchestrator._enrich_part_with_details(  # noqa: SLF001
+            "CSF-1001",
+            {
+                "full_description": "  Premium radiator  ",
+                "additional_images": [{"url": "https://img.example.com/large.jpg"}],
+            },
+        )
+
+        # Assert
+        enriched = orchestrator.unique_parts["CSF-1001"]
+        assert enriched is not original_part
+        assert enriched.description == "Premium radiator"
+        assert isinstance(enriched.images[0], PartImage)
+        assert enriched.images[0].url == "https://cdn.example.com/1001.avif"
+        assert enriched.scraped_at == original_part.scraped_at
+        assert original_part.description is None
+
     def test_enrich_part_missing_sku_logs_warning(self) -> None:
         """Test enrichment with missing SKU does nothing."""
         # Arrange
@@ -1056,6 +1405,7 @@ class TestLoadCheckpointErrors:
         orchestrator = ScraperOrchestrator.__new__(ScraperOrchestrator)
         orchestrator.unique_parts = {}
         orchestrator.vehicle_compat = {}
+        orchestrator._vehicle_keys = {}  # noqa: SLF001
 
         # Act & Assert
         with pytest.raises(ValueError, match="Invalid checkpoint file"):
@@ -1127,6 +1477,9 @@ class TestScrapeAllPhase2:
         orchestrator.incremental = False
         orchestrator.unique_parts = {}
         orchestrator.vehicle_compat = {}
+        orchestrator._vehicle_keys = {}  # noqa: SLF001
+        orchestrator._processed_log = None  # noqa: SLF001
+        orchestrator._superseded_processed_logs = []  # noqa: SLF001
         orchestrator.parts_scraped = 0
         orchestrator.processed_application_ids = set()
         orchestrator.new_skus = set()
@@ -1198,8 +1551,9 @@ class TestScrapeAllPhase2:
         mocker.patch.object(orchestrator, "_build_hierarchy", return_value=hierarchy)
         mocker.patch.object(orchestrator, "_save_checkpoint", return_value=tmp_path / "cp.json")
 
-        # Async fetch returns None (needs browser fallback)
+        # Async fetch returns None (needs browser fallback); batch render fails too
         orchestrator.fetcher.async_scrape_application_pages = AsyncMock(return_value=[None])
+        orchestrator.fetcher.async_fetch_with_browser = AsyncMock(return_value=[None])
         browser_html = '<html><div class="row app">browser parts</div></html>'
         orchestrator.fetcher.fetch_with_browser.return_value = browser_html
 
@@ -1219,6 +1573,51 @@ class TestScrapeAllPhase2:
         )
         orchestrator.html_parser.parse.assert_called_once_with(browser_html)
 
+    def test_browser_batch_renders_fallback_pages(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test Phase 2 renders HTTP misses in one browser batch before processing."""
+        # Arrange
+        orchestrator = self._make_orchestrator(tmp_path)
+
+        hierarchy = [
+            {
+                "make_id": 3,
+                "make": "Honda",
+                "year_id": 100,
+                "year": "2024",
+                "application_id": app_id,
+                "model": "Civic",
+            }
+            for app_id in (8000, 8001)
+        ]
+        mocker.patch.object(orchestrator, "_build_hierarchy", return_value=hierarchy)
+        mocker.patch.object(orchestrator, "_save_checkpoint", return_value=tmp_path / "cp.json")
+
+        app_html = '<html><div class="row app">parts</div></html>'
+        browser_html = '<html><div class="row app">browser parts</div></html>'
+        orchestrator.fetcher.async_scrape_application_pages = AsyncMock(
+            return_value=[app_html, None]
+        )
+        orchestrator.fetcher.async_fetch_with_browser = AsyncMock(return_value=[browser_html])
+
+        part = Part(sku="CSF-1001", name="Radiator", category="Radiator")
+        parts_data = [{"sku": "CSF-1001", "name": "Radiator", "vehicle_qualifiers": {}}]
+        orchestrator.html_parser.extract_parts_from_application_page.return_value = parts_data
+        orchestrator.validator.validate_batch.return_value = [part]
+
+        # Act
+        result = orchestrator.scrape_all(fetch_details=False)
+
+        # Assert
+        assert result["applications_processed"] == 2
+        assert result["browser_fallback_count"] == 1
+        orchestrator.fetcher.async_fetch_with_browser.assert_awaited_once_with(
+            ["https://csf.mycarparts.com/applications/8001"]
+        )
+        orchestrator.fetcher.fetch_with_browser.assert_not_called()
+        orchestrator.html_parser.parse.assert_any_call(browser_html)
+
     def test_failed_application_continues(self, mocker: MockerFixture, tmp_path: Path) -> None:
         """Test Phase 2 records failure and continues to next application."""
         # Arrange
@@ -1250,6 +1649,7 @@ class TestScrapeAllPhase2:
         orchestrator.fetcher.async_scrape_application_pages = AsyncMock(
             return_value=[None, app_html]
         )
+        orchestrator.fetcher.async_fetch_with_browser = AsyncMock(return_value=[None])
 
         # Browser fallback fails for first application
         orchestrator.fetcher.fetch_with_browser.side_effect = RuntimeError("Network timeout")
@@ -1269,6 +1669,44 @@ class TestScrapeAllPhase2:
         assert result["unique_parts"] == 1
         assert orchestrator.failure_tracker.get_failed_identifiers("application") == ["8000"]
 
+    def test_interval_checkpoints_are_coalesced(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test intervals reached within the minimum gap share Phase 2's final checkpoint."""
+        # Arrange
+        orchestrator = self._make_orchestrator(tmp_path)
+
+        hierarchy = [
+            {
+                "make_id": 3,
+                "make": "Honda",
+                "year_id": 100,
+                "year": "2024",
+                "application_id": app_id,
+                "model": "Civic",
+            }
+            for app_id in (8000, 8001, 8002)
+        ]
+        mocker.patch.object(orchestrator, "_build_hierarchy", return_value=hierarchy)
+        save_checkpoint = mocker.patch.object(
+            orchestrator, "_save_checkpoint", return_value=tmp_path / "cp.json"
+        )
+
+        app_html = '<html><div class="row app">parts</div></html>'
+        orchestrator.fetcher.async_scrape_application_pages = AsyncMock(return_value=[app_html] * 3)
+
+        part = Part(sku="CSF-1001", name="Radiator", category="Radiator")
+        parts_data = [{"sku": "CSF-1001", "name": "Radiator", "vehicle_qualifiers": {}}]
+        orchestrator.html_parser.extract_parts_from_application_page.return_value = parts_data
+        orchestrator.validator.validate_batch.return_value = [part]
+
+        # Act
+        result = orchestrator.scrape_all(fetch_details=False, checkpoint_interval=1)
+
+        # Assert - only the checkpoint that always closes Phase 2
+        assert result["applications_processed"] == 3
+        save_checkpoint.assert_called_once_with(None, None)
+
 
 class TestScrapeAllPhase3:
     """Test scrape_all Phase 3 (detail page fetching)."""
@@ -1292,6 +1730,9 @@ class TestScrapeAllPhase3:
         orchestrator.incremental = False
         orchestrator.unique_parts = {}
         orchestrator.vehicle_compat = {}
+        orchestrator._vehicle_keys = {}  # noqa: SLF001
+        orchestrator._processed_log = None  # noqa: SLF001
+        orchestrator._superseded_processed_logs = []  # noqa: SLF001
         orchestrator.parts_scraped = 0
         orchestrator.processed_application_ids = set()
         orchestrator.new_skus = set()
@@ -1403,6 +1844,34 @@ class TestScrapeAllPhase3:
         assert result["details_fetched_count"] == 2
         assert result["details_skipped_unchanged"] == 0
 
+    def test_detail_browser_fallback_uses_browser_pool(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test detail pages without HTTP content are rendered in one browser-pool batch."""
+        # Arrange
+        orchestrator = self._make_orchestrator(tmp_path)
+        orchestrator.unique_parts["CSF-1001"] = Part(
+            sku="CSF-1001", name="Radiator", category="Radiator"
+        )
+        mocker.patch.object(orchestrator, "_build_hierarchy", return_value=[])
+        mocker.patch.object(orchestrator, "_save_checkpoint", return_value=tmp_path / "cp.json")
+
+        detail_html = '<html><td class="selling-part">1001</td></html>'
+        orchestrator.fetcher.async_fetch_detail_pages = AsyncMock(return_value=[None])
+        orchestrator.fetcher.async_fetch_with_browser = AsyncMock(return_value=[detail_html])
+        orchestrator.html_parser.extract_detail_page_data.return_value = {"specifications": {}}
+        mocker.patch.object(orchestrator, "_enrich_part_with_details")
+
+        # Act
+        result = orchestrator.scrape_all(fetch_details=True)
+
+        # Assert
+        orchestrator.fetcher.async_fetch_with_browser.assert_awaited_once_with(
+            ["https://csf.autocaredata.com/items/1001"]
+        )
+        orchestrator.fetcher.fetch_with_browser.assert_not_called()
+        assert result["details_fetched_count"] == 1
+
 
 class TestScrapeAllResume:
     """Test scrape_all with resume=True."""
@@ -1428,6 +1897,9 @@ class TestScrapeAllResume:
         orchestrator.incremental = False
         orchestrator.unique_parts = {}
         orchestrator.vehicle_compat = {}
+        orchestrator._vehicle_keys = {}  # noqa: SLF001
+        orchestrator._processed_log = None  # noqa: SLF001
+        orchestrator._superseded_processed_logs = []  # noqa: SLF001
         orchestrator.parts_scraped = 0
         orchestrator.processed_application_ids = set()
         orchestrator.new_skus = set()
@@ -1523,6 +1995,9 @@ class TestScrapeAllIncremental:
         orchestrator.incremental = True
         orchestrator.unique_parts = {}
         orchestrator.vehicle_compat = {}
+        orchestrator._vehicle_keys = {}  # noqa: SLF001
+        orchestrator._processed_log = None  # noqa: SLF001
+        orchestrator._superseded_processed_logs = []  # noqa: SLF001
         orchestrator.parts_scraped = 0
         orchestrator.processed_application_ids = set()
         orchestrator.new_skus = set()
@@ -1545,6 +2020,65 @@ class TestScrapeAllIncremental:
         # Assert
         orchestrator.load_previous_export.assert_called_once()
 
+    def test_consecutive_runs_do_not_duplicate_parts_in_export_log(
+        self, mocker: MockerFixture, tmp_path: Path
+    ) -> None:
+        """Test a second incremental run logs each part once, not the catalog again."""
+        # Arrange
+        mocker.patch("src.scraper.orchestrator._CHECKPOINT_MIN_SECONDS", 0.0)
+        radiator = Part(sku="CSF-1001", name="Radiator", category="Radiator")
+        condenser = Part(sku="CSF-1002", name="Condenser", category="Condenser")
+        log_path = tmp_path / "exports" / "parts.jsonl"
+
+        def run(parts_by_app: dict[int, Part]) -> list[str]:
+            fetcher = Mock()
+            fetcher.async_check_etags = AsyncMock(return_value=[(True, "hash")] * len(parts_by_app))
+            fetcher.async_scrape_application_pages = AsyncMock(
+                return_value=["<html></html>"] * len(parts_by_app)
+            )
+            orchestrator = ScraperOrchestrator(
+                output_dir=tmp_path / "exports",
+                incremental=True,
+                checkpoint_dir=tmp_path / "checkpoints",
+                fetcher=fetcher,
+            )
+            hierarchy = [
+                {
+                    "make_id": 3,
+                    "make": "Honda",
+                    "year_id": 100,
+                    "year": "2024",
+                    "application_id": app_id,
+                    "model": "Civic",
+                }
+                for app_id in parts_by_app
+            ]
+            mocker.patch.object(orchestrator, "_build_hierarchy", return_value=hierarchy)
+            mocker.patch.object(
+                orchestrator.html_parser,
+                "extract_parts_from_application_page",
+                return_value=[{"sku": "unused", "vehicle_qualifiers": {}}],
+            )
+            mocker.patch.object(
+                orchestrator.validator,
+                "validate_batch",
+                side_effect=[[part] for part in parts_by_app.values()],
+            )
+            orchestrator.scrape_all(fetch_details=False, checkpoint_interval=1)
+            logged = [json.loads(line)["sku"] for line in log_path.read_text().splitlines()]
+            orchestrator.export_data()
+            orchestrator.close()
+            return logged
+
+        run({8000: radiator})
+
+        # Act
+        logged = run({8000: radiator, 8001: condenser})
+
+        # Assert - each SKU once; the previous run's lines were not kept
+        assert sorted(logged) == ["CSF-1001", "CSF-1002"]
+        assert not log_path.exists()
+
 
 class TestCompletenessReportDictFormat:
     """Test generate_completeness_report with dict-format previous data."""
@@ -1641,6 +2175,8 @@ class TestExportData:
         orchestrator.exporter.output_dir = tmp_path
         orchestrator.incremental = True
         orchestrator.output_dir = tmp_path
+        orchestrator._exported_parts = {}  # noqa: SLF001
+        orchestrator._exported_compat_sizes = {}  # noqa: SLF001
 
         part = Part(sku="CSF-1001", name="Radiator", category="Radiator")
         vehicle = Vehicle(make="Honda", model="Civic", year=2024)
@@ -1661,6 +2197,71 @@ class TestExportData:
         assert paths["parts"] == tmp_path / "parts.json"
         assert paths["compatibility"] == tmp_path / "compat.json"
 
+    def test_incremental_export_appends_only_changes_since_last_export(
+        self, tmp_path: Path
+    ) -> None:
+        """Test a second incremental export only sends replaced parts and grown mappings."""
+        # Arrange
+        (tmp_path / "parts.json").write_text('{"parts": []}')
+        (tmp_path / "compatibility.json").write_text('{"compatibility": []}')
+
+        orchestrator = ScraperOrchestrator.__new__(ScraperOrchestrator)
+        orchestrator.exporter = Mock()
+        orchestrator.exporter.output_dir = tmp_path
+        orchestrator.incremental = True
+        orchestrator.output_dir = tmp_path
+        orchestrator._exported_parts = {}  # noqa: SLF001
+        orchestrator._exported_compat_sizes = {}  # noqa: SLF001
+
+        civic = Vehicle(make="Honda", model="Civic", year=2024)
+        accord = Vehicle(make="Honda", model="Accord", year=2024)
+        part_a = Part(sku="CSF-1001", name="Radiator", category="Radiator")
+        part_b = Part(sku="CSF-1002", name="Condenser", category="Condenser")
+        orchestrator.unique_parts = {"CSF-1001": part_a, "CSF-1002": part_b}
+        orchestrator.vehicle_compat = {"CSF-1001": [civic], "CSF-1002": [civic]}
+        orchestrator.export_data()
+
+        # Replace one part and extend the other part's compatibility
+        updated_a = part_a.model_copy(update={"name": "Radiator HD"})
+        orchestrator.unique_parts["CSF-1001"] = updated_a
+        orchestrator.vehicle_compat["CSF-1002"].append(accord)
+
+        # Act
+        orchestrator.export_data()
+
+        # Assert
+        parts_call = orchestrator.exporter.export_parts_incremental.call_args_list[-1]
+        assert parts_call.args[0] == [updated_a]
+        compat_call = orchestrator.exporter.export_compatibility_incremental.call_args_list[-1]
+        assert [c.part_sku for c in compat_call.args[0]] == ["CSF-1002"]
+        assert compat_call.args[0][0].vehicles == [civic, accord]
+
+    def test_append_export_logs_writes_only_changes_to_jsonl(self) -> None:
+        """Test checkpoint exports append deltas to the JSON Lines logs, not the JSON files."""
+        # Arrange
+        orchestrator = ScraperOrchestrator.__new__(ScraperOrchestrator)
+        orchestrator.exporter = Mock()
+        orchestrator._logged_parts = {}  # noqa: SLF001
+        orchestrator._logged_compat_sizes = {}  # noqa: SLF001
+
+        civic = Vehicle(make="Honda", model="Civic", year=2024)
+        part_a = Part(sku="CSF-1001", name="Radiator", category="Radiator")
+        part_b = Part(sku="CSF-1002", name="Condenser", category="Condenser")
+        orchestrator.unique_parts = {"CSF-1001": part_a}
+        orchestrator.vehicle_compat = {"CSF-1001": [civic]}
+        orchestrator._append_export_logs()  # noqa: SLF001
+
+        orchestrator.unique_parts["CSF-1002"] = part_b
+
+        # Act
+        paths = orchestrator._append_export_logs()  # noqa: SLF001
+
+        # Assert
+        assert orchestrator.exporter.export_parts_jsonl.call_args_list[-1].args[0] == [part_b]
+        orchestrator.exporter.export_compatibility_jsonl.assert_called_once()
+        orchestrator.exporter.export_parts_incremental.assert_not_called()
+        assert set(paths) == {"parts"}
+
 
 class TestExportCompleteDelta:
     """Test export_complete_delta filters to only new and changed parts."""
@@ -1711,6 +2312,9 @@ class TestExportCompleteDelta:
         orchestrator.exporter = Mock()
         orchestrator.unique_parts = {"CSF-1001": Part(sku="CSF-1001", name="R", category="R")}
         orchestrator.vehicle_compat = {}
+        orchestrator._vehicle_keys = {}  # noqa: SLF001
+        orchestrator._processed_log = None  # noqa: SLF001
+        orchestrator._superseded_processed_logs = []  # noqa: SLF001
         orchestrator.new_skus = set()
         orchestrator.changed_skus = set()
 
@@ -1755,7 +2359,7 @@ class TestHierarchyCaching:
         years_response_text = "years_js_content"
         mock_response_years = Mock(spec=httpx.Response)
         mock_response_years.text = years_response_text
-        mock_fetcher.fetch.return_value = mock_response_years
+        mock_fetcher.async_fetch_all = AsyncMock(return_value=[mock_response_years])
 
         orchestrator = ScraperOrchestrator.__new__(ScraperOrchestrator)
         orchestrator.fetcher = mock_fetcher
@@ -1797,8 +2401,8 @@ class TestHierarchyCaching:
         assert hierarchy[0]["model"] == "Civic"
         assert hierarchy[1]["model"] == "Accord"
         mock_ajax.parse_model_response.assert_not_called()
-        # Only 1 fetch call (years URL), no model fetches
-        assert mock_fetcher.fetch.call_count == 1
+        # Only the years batch was fetched, no model fetches
+        mock_fetcher.async_fetch_all.assert_awaited_once_with([years_url], cached=True)
 
     def test_cache_miss_enumerates_normally_and_updates_cache(
         self, mocker: MockerFixture, tmp_path: Path
@@ -1813,10 +2417,10 @@ class TestHierarchyCaching:
         mock_response_models = Mock(spec=httpx.Response)
         mock_response_models.text = "models_js"
 
-        mock_fetcher.fetch = Mock(
+        mock_fetcher.async_fetch_all = AsyncMock(
             side_effect=[
-                mock_response_years,  # Honda years
-                mock_response_models,  # Honda 2024 models
+                [mock_response_years],  # Honda years
+                [mock_response_models],  # Honda 2024 models
             ]
         )
 
@@ -1864,10 +2468,10 @@ class TestHierarchyCaching:
         mock_response_models = Mock(spec=httpx.Response)
         mock_response_models.text = "models_js"
 
-        mock_fetcher.fetch = Mock(
+        mock_fetcher.async_fetch_all = AsyncMock(
             side_effect=[
-                mock_response_years,  # Honda years
-                mock_response_models,  # Honda 2024 models
+                [mock_response_years],  # Honda years
+                [mock_response_models],  # Honda 2024 models
             ]
         )
 
@@ -1902,7 +2506,7 @@ class TestHierarchyCaching:
         years_response_text = "years_js_content"
         mock_response_years = Mock(spec=httpx.Response)
         mock_response_years.text = years_response_text
-        mock_fetcher.fetch.return_value = mock_response_years
+        mock_fetcher.async_fetch_all = AsyncMock(return_value=[mock_response_years])
 
         orchestrator = ScraperOrchestrator.__new__(ScraperOrchestrator)
         orchestrator.fetcher = mock_fetcher
@@ -1956,10 +2560,10 @@ class TestHierarchyCaching:
         mock_response_models = Mock(spec=httpx.Response)
         mock_response_models.text = "models_js"
 
-        mock_fetcher.fetch = Mock(
+        mock_fetcher.async_fetch_all = AsyncMock(
             side_effect=[
-                mock_response_years,  # Honda years
-                mock_response_models,  # Honda 2024 models
+                [mock_response_years],  # Honda years
+                [mock_response_models],  # Honda 2024 models
             ]
         )
 
@@ -19,6 +19,7 @@ from typing import Any
 
 import pytest
 from bs4 import BeautifulSoup, Tag
+from pytest_mock import MockerFixture
 
 from src.scraper.ajax_parser import AJAXParsingError, AJAXResponseParser
 from src.scraper.parser import CSFParser, HTMLParser
@@ -715,6 +716,42 @@ class TestCSFParserExtractSpecifications:
         # Assert
         assert result["Position"] == "Not Applicable"
 
+    def test_extract_specifications_from_container_tag(self) -> None:
+        """Test _extract_specifications() reads a .row.app container without re-parsing."""
+        # Arrange
+        parser = CSFParser()
+        html = """
+        <html>
+            <body>
+                <div class="row app">
+                    <table class="table-borderless">
+                        <tbody>
+                            <tr>
+                                <td>Inlet: 1 1/4&quot; &amp; 1 1/2&quot;</td>
+                            </tr>
+                        </tbody>
+                    </table>
+                </div>
+                <div class="row app">
+                    <table class="table-borderless">
+                        <tbody>
+                            <tr>
+                                <td>Outlet: 1 1/2&quot;</td>
+                            </tr>
+                        </tbody>
+                    </table>
+                </div>
+            </body>
+        </html>
+        """
+        container = parser.parse(html).select(".row.app")[0]
+
+        # Act
+        result = parser._extract_specifications(container)
+
+        # Assert - only this container's specs, entities decoded once
+        assert result == {"Inlet": '1 1/4" & 1 1/2"'}
+
     def test_extract_specifications_returns_empty_dict_when_no_specs(self) -> None:
         """Test _extract_specifications() returns empty dict when no specs found."""
         # Arrange
@@ -1610,6 +1647,99 @@ class TestCSFParserExtractInterchangeData:
         # Assert - Should not match without both headers
         assert result == []
 
+    def test_extract_interchange_data_uses_precomputed_tables(self) -> None:
+        """Test _extract_interchange_data() reuses tables collected by _tables_with_headers()."""
+        # Arrange
+        parser = CSFParser()
+        html = """
+        <table>
+            <tr><td>Core Type</td><td>Aluminum</td></tr>
+        </table>
+        <table>
+            <tr><th>Reference Number</th><th>Reference Name</th></tr>
+            <tr><td>19010RNAA51</td><td>OEM</td></tr>
+        </table>
+        """
+        soup = parser.parse(html)
+        tables = parser._tables_with_headers(soup)
+
+        # Act
+        interchange = parser._extract_interchange_data(soup, tables)
+        specs = parser._extract_detail_specifications(soup, tables)
+
+        # Assert
+        assert [headers for _, headers in tables] == [
+            frozenset(),
+            frozenset({"Reference Number", "Reference Name"}),
+        ]
+        assert interchange == parser._extract_interchange_data(soup)
+        assert specs == parser._extract_detail_specifications(soup)
+        assert interchange[0]["reference_number"] == "19010RNAA51"
+
+
+class TestCSFParserExtractPartsFromApplicationPage:
+    """Test suite for CSFParser.extract_parts_from_application_page()."""
+
+    def test_extract_parts_reads_category_from_each_containers_panel(self) -> None:
+        """Test every container takes the category of its own panel."""
+        # Arrange
+        parser = CSFParser()
+        html = """
+        <div class="applications">
+          <div class="panel result">
+            <div class="panel-header"><h4>Radiator</h4></div>
+            <div class="panel-body">
+              <div class="row app"><h4><a href="/items/1001">1001</a> - Radiator A</h4></div>
+              <div class="row app"><h4><a href="/items/1002">1002</a> - Radiator B</h4></div>
+            </div>
+          </div>
+          <div class="panel result">
+            <div class="panel-header"><h4>Condenser</h4></div>
+            <div class="panel-body">
+              <div class="row app"><h4><a href="/items/2001">2001</a> - Condenser A</h4></div>
+            </div>
+          </div>
+        </div>
+        """
+        soup = parser.parse(html)
+
+        # Act
+        result = parser.extract_parts_from_application_page(soup)
+
+        # Assert
+        assert [(p["sku"], p["category"]) for p in result] == [
+            ("CSF-1001", "Radiator"),
+            ("CSF-1002", "Radiator"),
+            ("CSF-2001", "Condenser"),
+        ]
+
+    def test_extract_parts_uses_nearest_panel_category(self) -> None:
+        """Test nested panels win over their ancestor and panel-less containers get Unknown."""
+        # Arrange
+        parser = CSFParser()
+        html = """
+        <div class="row app"><h4><a href="/items/3001">3001</a> - Loose Part</h4></div>
+        <div class="panel result">
+          <div class="panel-header"><h4>Cooling</h4></div>
+          <div class="row app"><h4><a href="/items/1001">1001</a> - Radiator A</h4></div>
+          <div class="panel result">
+            <div class="panel-header"><h4>Condenser</h4></div>
+            <div class="row app"><h4><a href="/items/2001">2001</a> - Condenser A</h4></div>
+          </div>
+        </div>
+        """
+        soup = parser.parse(html)
+
+        # Act
+        result = parser.extract_parts_from_application_page(soup)
+
+        # Assert
+        assert [(p["sku"], p["category"]) for p in result] == [
+            ("CSF-3001", "Unknown"),
+            ("CSF-1001", "Cooling"),
+            ("CSF-2001", "Condenser"),
+        ]
+
 
 class TestCSFParserExceptionHandling:
     """Test broad exception handling in extract_parts_from_application_page."""
@@ -2054,6 +2184,34 @@ class TestAJAXResponseParser:
         assert "https://example.com/style.css" in result
         assert "\\/" not in result
 
+    def test_parse_skips_unescape_pass_without_backslashes(self, mocker: MockerFixture) -> None:
+        """Test parse() returns unescaped HTML without running the unescape regex."""
+        # Arrange
+        parser = AJAXResponseParser()
+        mock_pattern = mocker.patch.object(AJAXResponseParser, "UNESCAPE_PATTERN")
+        js_code = '$("#el").html("<ul class=\'list-inline\'><li>2025</li></ul>")'
+
+        # Act
+        result = parser.parse(js_code)
+
+        # Assert
+        assert result == "<ul class='list-inline'><li>2025</li></ul>"
+        mock_pattern.sub.assert_not_called()
+
+    def test_parse_skips_debug_event_when_debug_disabled(self, mocker: MockerFixture) -> None:
+        """Test parse() does not build the ajax_parsed event below DEBUG level."""
+        # Arrange
+        parser = AJAXResponseParser()
+        mock_logger = mocker.patch("src.scraper.ajax_parser.logger")
+        mock_logger.is_enabled_for.return_value = False
+
+        # Act
+        result = parser.parse('$("#el").html("<div>Content</div>")')
+
+        # Assert
+        assert result == "<div>Content</div>"
+        mock_logger.debug.assert_not_called()
+
     def test_parse_handles_complex_html_with_multiple_escapes(self) -> None:
         """Test parse() handles HTML with multiple escape sequences."""
         # Arrange
@@ -2066,6 +2224,47 @@ class TestAJAXResponseParser:
         # Assert
         assert result == '<div class="test"><a href="/path">Text</a></div>'
 
+    def test_parse_does_not_stop_at_escaped_quote_before_paren(self) -> None:
+        r"""Test parse() treats \") inside the string as content, not the call's end."""
+        # Arrange
+        parser = AJAXResponseParser()
+        js_code = r'$("#el").html("<a onclick=\"go(\")\">Go</a>")'
+
+        # Act
+        result = parser.parse(js_code)
+
+        # Assert
+        assert result == '<a onclick="go(")">Go</a>'
+
+    def test_parse_raises_error_for_unterminated_html_call(self) -> None:
+        """Test parse() rejects an .html(" call whose string never closes."""
+        # Arrange
+        parser = AJAXResponseParser()
+        js_code = '$("#el").html("' + 'x"' * 10_000
+
+        # Act & Assert
+        with pytest.raises(AJAXParsingError):
+            parser.parse(js_code)
+
+    def test_parse_matches_stdlib_pattern_when_re2_installed(self) -> None:
+        """Test the optional RE2 fast path extracts the same HTML as the re fallback."""
+        # Arrange
+        pytest.importorskip("re2")
+        from src.scraper import ajax_parser  # noqa: PLC0415
+
+        parser = AJAXResponseParser()
+        js_code = r'$("#el").html("<div class=\"a\"><a href=\"\/p\">T<\/a><\/div>")'
+
+        # Act
+        re2_match = ajax_parser._RE2_HTML_PATTERN.search(js_code)
+        re_match = AJAXResponseParser.HTML_PATTERN.search(js_code)
+
+        # Assert
+        assert re2_match is not None
+        assert re_match is not None
+        assert re2_match.group(1) == re_match.group(1)
+        assert parser.parse(js_code) == '<div class="a"><a href="/p">T</a></div>'
+
     def test_parse_raises_ajax_parsing_error_for_invalid_input(self) -> None:
         """Test parse() raises AJAXParsingError when no .html() call found."""
         # Arrange
@@ -2096,6 +2295,21 @@ class TestAJAXResponseParser:
         with pytest.raises(AJAXParsingError):
             parser.parse(wrong_method)
 
+    def test_parse_accepts_raw_utf8_bytes(self) -> None:
+        """Test parse() on response bytes decodes only the extracted HTML."""
+        # Arrange
+        parser = AJAXResponseParser()
+        js_code = '$("#el").html("<a href=\\"/applications/7\\">Citroën</a>");'
+
+        # Act
+        result = parser.parse(js_code.encode())
+
+        # Assert
+        assert result == parser.parse(js_code)
+        assert result == '<a href="/applications/7">Citroën</a>'
+        assert parser.parse_model_response(js_code.encode()) == {7: "Citroën"}
+        assert parser.try_parse(b'console.log("no html");') is None
+
     def test_try_parse_returns_html_on_success(self) -> None:
         """Test try_parse() returns extracted HTML on successful parse."""
         # Arrange
@@ -2183,6 +2397,24 @@ class TestAJAXResponseParser:
         # Assert
         assert result == {789: "Valid"}
 
+    def test_parse_dropdown_response_requires_integer_trailing_segment(self) -> None:
+        """Test _parse_dropdown_response takes only a wholly numeric last path segment."""
+        # Arrange
+        parser = AJAXResponseParser()
+        js_code = (
+            '$("#el").html("<ul>'
+            '<li><a href=\\"/applications/12x\\">Suffixed</a></li>'
+            '<li><a href=\\"/applications/34/\\">Trailing slash</a></li>'
+            '<li><a href=\\"/applications/56\\">Valid</a></li>'
+            '</ul>")'
+        )
+
+        # Act
+        result = parser._parse_dropdown_response(js_code, "/applications/", "models")
+
+        # Assert
+        assert result == {56: "Valid"}
+
     def test_parse_dropdown_response_returns_empty_for_no_matches(self) -> None:
         """Test _parse_dropdown_response returns empty dict when no hrefs match."""
         # Arrange
@@ -2195,6 +2427,36 @@ class TestAJAXResponseParser:
         # Assert
         assert result == {}
 
+    def test_parse_dropdown_response_strips_nested_link_text(self) -> None:
+        """Test _parse_dropdown_response joins nested text and strips whitespace."""
+        # Arrange
+        parser = AJAXResponseParser()
+        js_code = (
+            '$("#el").html("<li><a href=\\"/applications/42\\">'
+            ' <span>Accord</span> </a></li><li><a>No href</a></li>")'
+        )
+
+        # Act
+        result = parser._parse_dropdown_response(js_code, "/applications/", "models")
+
+        # Assert
+        assert result == {42: "Accord"}
+
+    def test_parse_dropdown_response_decodes_entities_in_link_text(self) -> None:
+        """Test _parse_dropdown_response decodes HTML entities in option text."""
+        # Arrange
+        parser = AJAXResponseParser()
+        js_code = (
+            '$("#el").html("<li><a data-remote=\\"true\\" '
+            'href=\\"/applications/7\\">Ram &amp; Dodge</a></li>")'
+        )
+
+        # Act
+        result = parser._parse_dropdown_response(js_code, "/applications/", "models")
+
+        # Assert
+        assert result == {7: "Ram & Dodge"}
+
     def test_parse_year_response_end_to_end(self) -> None:
         """Test parse_year_response extracts years from jQuery dropdown response."""
         # Arrange
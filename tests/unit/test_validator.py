@@ -5,6 +5,7 @@ CLI DataValidator (src.cli.validators) following AAA pattern.
 """
 
 import json
+from dataclasses import FrozenInstanceError
 from decimal import Decimal
 from pathlib import Path
 from typing import Any
@@ -625,6 +626,23 @@ class TestCLIDataValidator:
         assert "parts2.json" in results
         assert "readme.txt" not in results
 
+    def test_validate_directory_skips_subdirectories(self, tmp_path: Path) -> None:
+        """Test validate_directory ignores directories whose name ends in .json."""
+        # Arrange
+        validator = CLIDataValidator()
+        parts_data = {
+            "metadata": {"export_date": "2025-10-28", "total_parts": 1},
+            "parts": [{"sku": "CSF-12345", "name": "Radiator", "category": "Radiators"}],
+        }
+        (tmp_path / "parts.json").write_text(json.dumps(parts_data))
+        (tmp_path / "archive.json").mkdir()
+
+        # Act
+        results = validator.validate_directory(tmp_path)
+
+        # Assert
+        assert list(results) == ["parts.json"]
+
     def test_validate_parts_export_checks_structure(self, tmp_path: Path) -> None:
         """Test _validate_parts_export validates export structure."""
         # Arrange
@@ -738,6 +756,53 @@ class TestCLIDataValidator:
         assert result.is_valid is True  # Warnings don't invalidate
         assert result.warning_count > 0
 
+    def test_validate_parts_export_stops_at_max_errors(self, tmp_path: Path) -> None:
+        """Test parts validation stops collecting errors once max_errors is reached."""
+        # Arrange
+        validator = CLIDataValidator(max_errors=3)
+        data = {
+            "metadata": {"export_date": "2025-10-28", "total_parts": 10},
+            "parts": [{"sku": "INVALID", "name": "Radiator", "category": "Cat"}] * 10,
+        }
+        test_file = tmp_path / "broken.json"
+        test_file.write_text(json.dumps(data))
+
+        # Act
+        result = validator.validate_json_file(test_file)
+
+        # Assert
+        assert result.is_valid is False
+        assert result.total_items == 10
+        assert result.error_count == 4  # 3 part errors + truncation summary
+        assert "truncated" in result.errors[-1].message
+
+    def test_validate_hierarchical_export_stops_at_max_errors(self, tmp_path: Path) -> None:
+        """Test hierarchical validation stops walking the tree at max_errors."""
+        # Arrange
+        validator = CLIDataValidator(max_errors=2)
+        bad_part = {"sku": "INVALID", "name": "Radiator", "category": "Cat"}
+        data = {
+            "metadata": {
+                "export_date": "2025-10-28",
+                "structure": "year>make>model",
+                "total_years": 2,
+            },
+            "data": {
+                "2020": {"Audi": {"A4": [bad_part, bad_part]}},
+                "2021": {"BMW": {"X5": [bad_part, bad_part]}},
+            },
+        }
+        test_file = tmp_path / "broken_hierarchy.json"
+        test_file.write_text(json.dumps(data))
+
+        # Act
+        result = validator.validate_json_file(test_file)
+
+        # Assert
+        assert result.is_valid is False
+        assert result.total_items == 2
+        assert "truncated" in result.errors[-1].message
+
     def test_validation_result_error_count_property(self) -> None:
         """Test ValidationResult.error_count property."""
         # Arrange
@@ -925,6 +990,54 @@ class TestCLIDataValidator:
         # Assert
         assert result.total_items == 3  # Should count all 3 parts
 
+    def test_hierarchical_validation_resolves_parts_table_refs(self, tmp_path: Path) -> None:
+        """Test hierarchical validation follows integer refs into parts_table."""
+        # Arrange
+        validator = CLIDataValidator()
+        hierarchical_data = {
+            "metadata": {
+                "export_date": "2025-10-28",
+                "structure": "year > make > model > part_indices; see parts_table",
+                "total_years": 1,
+            },
+            "parts_table": [{"sku": "CSF-12345", "name": "Part 1", "category": "Cat1"}],
+            "data": {"2020": {"Audi": {"A4": [0], "A6": [0]}}},
+        }
+        test_file = tmp_path / "hierarchical.json"
+        test_file.write_text(json.dumps(hierarchical_data))
+
+        # Act
+        result = validator.validate_json_file(test_file)
+
+        # Assert
+        assert result.is_valid
+        assert result.total_items == 2
+        assert result.valid_items == 2
+
+    def test_hierarchical_validation_rejects_bad_parts_table_ref(self, tmp_path: Path) -> None:
+        """Test hierarchical validation reports refs outside parts_table."""
+        # Arrange
+        validator = CLIDataValidator()
+        hierarchical_data = {
+            "metadata": {
+                "export_date": "2025-10-28",
+                "structure": "year > make > model > part_indices; see parts_table",
+                "total_years": 1,
+            },
+            "parts_table": [{"sku": "CSF-12345", "name": "Part 1", "category": "Cat1"}],
+            "data": {"2020": {"Audi": {"A4": [0, 5]}}},
+        }
+        test_file = tmp_path / "hierarchical.json"
+        test_file.write_text(json.dumps(hierarchical_data))
+
+        # Act
+        result = validator.validate_json_file(test_file)
+
+        # Assert
+        assert not result.is_valid
+        assert result.valid_items == 1
+        assert any("parts_table index" in error.message for error in result.errors)
+
     def test_validate_parts_export_with_non_list_parts(self, tmp_path: Path) -> None:
         """Test _validate_parts_export rejects non-list parts field."""
         # Arrange
@@ -1055,7 +1168,7 @@ class TestCLIDataValidator:
         # Act - call _validate_metadata directly because _validate_parts_export
         # does not guard against non-dict metadata before accessing .get()
         result = validator._validate_metadata(  # noqa: SLF001
-            non_dict_metadata, ["export_date", "total_parts"]
+            non_dict_metadata, frozenset({"export_date", "total_parts"})
         )
 
         # Assert
@@ -1140,6 +1253,15 @@ class TestValidationIssue:
         # Assert
         assert issue.details == "missing_field"
 
+    def test_validation_issue_is_immutable(self) -> None:
+        """Test ValidationIssue rejects attribute assignment."""
+        # Arrange
+        issue = ValidationIssue(severity="error", field="parts[0].sku", message="Bad SKU")
+
+        # Act & Assert
+        with pytest.raises(FrozenInstanceError):
+            issue.severity = "warning"  # type: ignore[misc]
+
 
 class TestScraperValidatorBatch:
     """Tests for batch validation in scraper validator."""
@@ -1194,3 +1316,20 @@ class TestScraperValidatorBatch:
 
         # Assert
         assert len(results) == 0
+
+    def test_validate_batch_isolates_part_with_invalid_image(self) -> None:
+        """Test a part whose image fails pre-processing does not drop the rest of the batch."""
+        # Arrange
+        validator = ScraperDataValidator()
+        parts_data = [
+            {"sku": "CSF-1", "name": "Part 1", "category": "Cat1"},
+            {"sku": "CSF-2", "name": "Part 2", "category": "Cat2", "images": [{"alt_text": "x"}]},
+            {"sku": "CSF-3", "name": "", "category": "Cat3"},
+            {"sku": "CSF-4", "name": "Part 4", "category": "Cat4"},
+        ]
+
+        # Act
+        results = validator.validate_batch(parts_data)
+
+        # Assert
+        assert [part.sku for part in results] == ["CSF-1", "CSF-4"]